@@ -0,0 +1,68 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - cost of column sizing as the transaction table grows
+##
+## "stretch" IS THE OLD QHeaderView.Stretch, "contents" QHeaderView.ResizeToContents AND
+## "sampled" THE ColumnSizer. LOAD = SET THE ROWS AND LAY THE TABLE OUT, RESIZE = ONE
+## WINDOW RESIZE STEP INCLUDING THE REPAINT
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_column_sizing [resizes]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtWidgets import QApplication, QHeaderView
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_settings import Settings
+
+
+TABLE_SIZES = (10_000, 100_000, 1_000_000)
+POLICIES = ("stretch", "contents", "sampled")
+
+
+def sizingTimes(policy, columns, resizes):
+    Settings.COLUMN_SIZING = "sampled" if policy == "sampled" else "stretch"
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.pages.show("widgets")
+    if policy == "contents":
+        window.ui.transactionTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+    QApplication.processEvents()
+
+    start = time.perf_counter()
+    window.transactionModel.setColumns(columns)
+    QApplication.processEvents()
+    loadMs = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for step in range(resizes):
+        start = time.perf_counter()
+        window.resize(1280 - 10 * (step % 20), 800)
+        QApplication.processEvents()
+        window.repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    window.close()
+    window.deleteLater()
+    return loadMs, statistics.median(timings)
+
+
+if __name__ == "__main__":
+    resizes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    QStandardPaths.setTestModeEnabled(True)
+    app = QApplication(sys.argv)
+    print(f"{'rows':>10}  {'policy':<10}{'load ms':>10}{'resize ms':>11}")
+    for rows in TABLE_SIZES:
+        columns = sampleTransactions(rows)
+        for policy in POLICIES:
+            loadMs, resizeMs = sizingTimes(policy, columns, resizes)
+            print(f"{rows:>10,}  {policy:<10}{loadMs:>10.1f}{resizeMs:>11.2f}")
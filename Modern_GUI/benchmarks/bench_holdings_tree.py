@@ -0,0 +1,103 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - matching and opening the holdings tree
+##
+## THE SAMPLE SPREADS ITS ROWS OVER 20 TICKERS, SO AT 1M ROWS EACH ASSET HAS 50K
+## TRADES. EXPAND = EXPAND ONE ASSET (ITS DISPOSALS ARE IN RANGES), THEN ITS FIRST RANGE,
+## AND PAINT. SCROLL = ONE PAGE FURTHER DOWN THE RANGE AND THE REPAINT. NODES = HOW MANY
+## CHILD NODES EXIST AFTERWARDS
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_holdings_tree [rows]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QStandardPaths, QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_themes import installThemes
+from src.models.holdings_model import DISPOSAL, Node
+
+
+SCROLLS = 200
+
+
+def nodesMade(index):
+    children = index.internalPointer().children or ()
+    return sum(child is not None for child in children)
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    QStandardPaths.setTestModeEnabled(True)
+    app = QApplication(sys.argv)
+    installThemes()
+
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.show()
+    window.pages.show("widgets")
+    window.transactionModel.setColumns(sampleTransactions(rows))
+    window.pages.show("holdings")
+    tree = window.ui.holdingsTree
+    model = window.holdingsModel
+
+    start = time.perf_counter()
+    while window.gainsMatcher.pending():
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+    print(f"rows: {rows:,}   matched in the background: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    asset = model.index(0, 0)
+    results = model.results
+    disposals = results.disposalStarts[1] - results.disposalStarts[0]
+    expandMs = timed(lambda: (tree.expand(asset), QApplication.processEvents(), tree.viewport().repaint()))
+    print(f"expand {model.data(asset)} ({disposals:,} disposals): {expandMs:.1f} ms, {nodesMade(asset):,} nodes")
+
+    group = model.index(1, 0, asset)
+    expandMs = timed(lambda: (tree.expand(group), QApplication.processEvents(), tree.viewport().repaint()))
+    print(f"expand {model.data(group)}: {expandMs:.1f} ms, {nodesMade(group):,} nodes")
+
+    scrollBar = tree.verticalScrollBar()
+    timings = []
+    for step in range(SCROLLS):
+        timings.append(timed(lambda: (scrollBar.setValue(scrollBar.value() + scrollBar.pageStep()),
+                                      QApplication.processEvents(), tree.viewport().repaint())))
+    print(f"scroll {SCROLLS} pages: median {statistics.median(timings):.2f} ms, "
+          f"worst {max(timings):.2f} ms, {nodesMade(group):,} nodes")
+
+    disposal = model.index(0, 0, group)
+    expandMs = timed(lambda: (tree.expand(disposal), QApplication.processEvents(), tree.viewport().repaint()))
+    print(f"expand a disposal ({model.rowCount(disposal)} matches): {expandMs:.1f} ms")
+
+    # A NODE AGAINST THE SAME FOUR FIELDS IN AN ORDINARY (__dict__) OBJECT
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [Node(None, DISPOSAL, position, position) for position in range(100_000)]
+    slotted = (tracemalloc.get_traced_memory()[0] - before) / len(nodes)
+    plain = type("PlainNode", (), {})
+    before = tracemalloc.get_traced_memory()[0]
+    others = []
+    for position in range(100_000):
+        other = plain()
+        other.parent, other.kind, other.position, other.row, other.children = None, DISPOSAL, position, position, []
+        others.append(other)
+    unslotted = (tracemalloc.get_traced_memory()[0] - before) / len(others)
+    tracemalloc.stop()
+    print(f"bytes per node: {slotted:.0f} with __slots__, {unslotted:.0f} with __dict__")
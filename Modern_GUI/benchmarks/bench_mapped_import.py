@@ -0,0 +1,106 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - the memory-mapped tokenizer against the csv module on a very large export
+##
+## A SYNTHETIC CRYPTO EXCHANGE TRADE HISTORY (12 COLUMNS, 6 OF THEM READ; ONE FILL A SECOND,
+## 6 DP QUANTITIES AND FEES) OF THE SIZE GIVEN IS READ ON ONE THREAD BY THE csv MODULE PATH
+## (readChunks -> parseChunks) AND THE MEMORY-MAPPED ONE (mappedChunks -> splitColumns).
+## tokenize STOPS AT THE CELL TEXTS OF THE COLUMNS READ, import GOES ON TO TransactionColumns
+## BLOCKS (THROWN AWAY) - THE CONVERSION IS THE SAME FOR BOTH. speedup IS AGAINST csv
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_mapped_import [GB] [chunk bytes]
+##
+################################################################################
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+import mmap
+
+from src.models.broker_formats import detectFormat
+from src.models.transaction_import import (convertChunks, fileBlocks, mappedChunks, parseChunks, readChunks,
+                                           splitColumns)
+
+
+HEADER = "Date,Symbol,Side,Price,Quantity,Fee,Fee Asset,Total,Order ID,Trade ID,Maker,Account\n"
+PAIRS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "ETHBTC", "BNBUSDT", "XRPUSDT", "ADAUSDT", "DOGEUSDT")
+BLOCK_ROWS = 100_000
+
+
+def writeExport(path, size):
+    random.seed(1)
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(HEADER)
+        while file.tell() < size:
+            lines = []
+            for trade in range(rows, rows + BLOCK_ROWS):
+                price, quantity = random.uniform(0.05, 60000), random.uniform(0.0001, 25)
+                day, second = divmod(trade, 86400)
+                lines.append(f"2024-{day // 28 % 12 + 1:02}-{day % 28 + 1:02} "
+                             f"{second // 3600:02}:{second // 60 % 60:02}:{second % 60:02},"
+                             f"{PAIRS[trade % len(PAIRS)]},{'BUY' if trade % 3 else 'SELL'},{price:.2f},"
+                             f"{quantity:.6f},{price * quantity * 0.001:.6f},USDT,{price * quantity:.6f},"
+                             f"{8_000_000_000 + trade},{1_000_000_000 + trade},{trade % 2 == 0},SPOT\n")
+            file.write("".join(lines))
+            rows += BLOCK_ROWS
+    return rows
+
+
+def tokenize(path, chunkBytes, mapped):
+    with open(path, "rb") as file:
+        mapper = detectFormat(file)
+        if mapped:
+            rows = 0
+            for chunk in mappedChunks(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), chunkBytes):
+                cells = splitColumns(chunk.decode("utf-8"), mapper.delimiter, mapper.needed)
+                rows += len(cells[mapper.needed[0]])
+        else:
+            rows = -1               # THE HEADER COMES OUT AS A ROW
+            for lines, parsed in parseChunks(readChunks(file, chunkBytes), mapper.delimiter):
+                lines, cells = mapper.cells(lines, parsed, None)
+                rows += len(lines)
+    return rows
+
+
+def load(path, chunkBytes, mapped):
+    rejects = []
+    rows = 0
+    with open(path, "rb") as file:
+        mapper = detectFormat(file)
+        if mapped:
+            blocks = fileBlocks(file, chunkBytes, mapper, lambda line, reason: rejects.append(line))
+        else:
+            blocks = convertChunks(parseChunks(readChunks(file, chunkBytes), mapper.delimiter), mapper,
+                                   lambda line, reason: rejects.append(line))
+        for block in blocks:
+            rows += len(block)
+    assert not rejects, rejects[:10]
+    return rows
+
+
+if __name__ == "__main__":
+    size = int(float(sys.argv[1]) * 1e9) if len(sys.argv) > 1 else 5_000_000_000
+    chunkBytes = int(sys.argv[2]) if len(sys.argv) > 2 else 1 << 20
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        rows = writeExport(path, size)
+        size = os.path.getsize(path)
+        print(f"rows: {rows:,}  file: {size / 1e9:.2f} GB  chunk: {chunkBytes // 1024} KB")
+        print(f"{'':>9}{'path':>6}{'seconds':>10}{'MB/s':>8}{'rows/s':>12}{'speedup':>9}")
+        for stage, run in (("tokenize", tokenize), ("import", load)):
+            baseline = None
+            for name, mapped in (("csv", False), ("mmap", True)):
+                start = time.perf_counter()
+                assert run(path, chunkBytes, mapped) == rows
+                seconds = time.perf_counter() - start
+                baseline = baseline or seconds
+                print(f"{stage:>9}{name:>6}{seconds:>10.1f}{size / 1e6 / seconds:>8.1f}{rows / seconds:>12,.0f}"
+                      f"{baseline / seconds:>9.2f}")
+    finally:
+        os.remove(path)
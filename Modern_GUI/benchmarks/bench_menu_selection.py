@@ -0,0 +1,93 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - menu click to page shown as the left menu grows
+##
+## COMPARES THE OLD STYLESHEET STRING EDITS ON EVERY MENU BUTTON WITH THE selected
+## PROPERTY USED BY MainWindow.selectMenuItem
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_menu_selection [clicks]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSize
+from PySide6.QtWidgets import QApplication, QPushButton
+
+
+MENU_SIZES = (5, 16, 32, 64)
+
+# THE STYLESHEET APPENDED TO THE SELECTED BUTTON BEFORE THE selected PROPERTY
+LEGACY_SELECTED_STYLESHEET = """
+    border-left: 22px solid qlineargradient(spread:pad, x1:0.034, y1:0, x2:0.216, y2:0, stop:0.499 rgba(255, 121, 198, 255), stop:0.5 rgba(85, 170, 255, 0));
+    background-color: rgb(40, 44, 52);
+    """
+
+
+def legacySelect(window, button):
+    for w in window.ui.topMenu.findChildren(QPushButton):
+        w.setStyleSheet(w.styleSheet().replace(LEGACY_SELECTED_STYLESHEET, ""))
+    button.setStyleSheet(button.styleSheet() + LEGACY_SELECTED_STYLESHEET)
+
+
+def clickLatency(window, buttons, select, clicks):
+    pages = ("home", "widgets", "new_page")
+    timings = []
+    for click in range(clicks):
+        button = buttons[click % len(buttons)]
+        start = time.perf_counter()
+        window.pages.show(pages[click % len(pages)])
+        select(button)
+        window.repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+# btn_save IS LEFT OUT - ITS DESIGNER STYLESHEET HAS NO TRAILING ";" SO THE OLD STRING
+# CONCATENATION PRODUCED A STYLESHEET QT COULD NOT PARSE
+def menuButtons(window):
+    return [button for button in window.ui.topMenu.findChildren(QPushButton)
+            if button is not window.ui.btn_save]
+
+
+def buildWindow(menuSize):
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    for name in window.pages.factories:
+        window.pages.page(name)
+
+    # GROW THE MENU WITH BUTTONS LIKE THE DESIGNER ONES
+    layout = window.ui.topMenu.layout()
+    for index in range(menuSize - 5):
+        button = QPushButton(f"Item {index}", window.ui.topMenu)
+        button.setObjectName(f"btn_bench_{index}")
+        button.setMinimumSize(QSize(0, 45))
+        button.setStyleSheet("background-image: url(:/icons/images/icons/cil-file.png);")
+        layout.addWidget(button)
+    QApplication.processEvents()
+    return window
+
+
+if __name__ == "__main__":
+    clicks = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication(sys.argv)
+    print(f"{'menu items':<12}{'stylesheet ms':>15}{'property ms':>13}")
+    for menuSize in MENU_SIZES:
+        window = buildWindow(menuSize)
+        buttons = menuButtons(window)
+        legacy = clickLatency(window, buttons, lambda button: legacySelect(window, button), clicks)
+        window.close()
+        window.deleteLater()
+
+        window = buildWindow(menuSize)
+        buttons = menuButtons(window)
+        current = clickLatency(window, buttons, window.selectMenuItem, clicks)
+        window.close()
+        window.deleteLater()
+        print(f"{menuSize:<12}{statistics.median(legacy):>15.3f}{statistics.median(current):>13.3f}")
@@ -0,0 +1,70 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - paint time of the transaction table with and without NumericDelegate
+##
+## "scroll" MOVES A FEW ROWS PER FRAME LIKE A WHEEL OR A FLICK, "jump" SHOWS NEW ROWS
+## EVERY FRAME (SCROLL BAR DRAG), "repaint" PAINTS THE SAME ROWS AGAIN (SELECTION,
+## HOVER, A PANEL ANIMATING OVER THE TABLE)
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_numeric_delegate [rows]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_themes import installThemes
+
+
+FRAMES = 300
+
+
+def frameTimes(table, move):
+    scrollBar = table.verticalScrollBar()
+    timings = []
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        move(scrollBar, frame)
+        table.viewport().repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+MOVES = {
+    "scroll": lambda scrollBar, frame: scrollBar.setValue(frame * 3),
+    "jump": lambda scrollBar, frame: scrollBar.setValue(scrollBar.maximum() * frame // FRAMES),
+    "repaint": lambda scrollBar, frame: None,
+}
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    QStandardPaths.setTestModeEnabled(True)
+    app = QApplication(sys.argv)
+    installThemes()
+
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.show()
+    window.pages.show("widgets")
+    window.transactionModel.setColumns(sampleTransactions(rows))
+    QApplication.processEvents()
+    table = window.ui.transactionTable
+
+    print(f"rows: {rows:,}")
+    print(f"{'delegate':<12}" + "".join(f"{move + ' ms':>12}" for move in MOVES))
+    for name in ("default", "numeric"):
+        for column, delegate in window.numericDelegates.items():
+            table.setItemDelegateForColumn(column, delegate if name == "numeric" else table.itemDelegate())
+        results = [frameTimes(table, move) for move in MOVES.values()]
+        print(f"{name:<12}" + "".join(f"{result:>12.3f}" for result in results))
@@ -0,0 +1,67 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - frame time of the left box animation in each animation mode
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_panel_animation [frames]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_settings import Settings
+
+
+ROWS = 2000
+
+
+def animationFrames(mode, frames):
+    Settings.ANIMATION_MODE = mode
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.pages.show("widgets")
+    window.pages.page("extraLeftBox")
+
+    window.transactionModel.setColumns(sampleTransactions(ROWS))
+    QApplication.processEvents()
+
+    # START THE ANIMATION, THEN STEP IT BY HAND
+    start = time.perf_counter()
+    window.toggleLeftBox()
+    startMs = (time.perf_counter() - start) * 1000
+    animation = window.rowAnimator.animation if mode == "snapshot" else window.group
+    animation.pause()
+
+    # ONE FRAME = ADVANCE THE ANIMATION, RUN ANY RELAYOUT IT CAUSED AND REPAINT THE WINDOW
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        animation.setCurrentTime(Settings.TIME_ANIMATION * frame // frames)
+        QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        window.repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    animation.stop()
+    window.close()
+    window.deleteLater()
+    return startMs, timings
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    app = QApplication(sys.argv)
+    print(f"{'mode':<12}{'start ms':>10}{'median ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for mode in ("layout", "snapshot"):
+        startMs, timings = animationFrames(mode, frames)
+        timings.sort()
+        print(f"{mode:<12}{startMs:>10.3f}{statistics.median(timings):>10.3f}"
+              f"{timings[int(len(timings) * 0.95)]:>10.3f}{timings[-1]:>10.3f}")
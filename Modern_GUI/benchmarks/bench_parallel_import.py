@@ -0,0 +1,58 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - many statement files imported at once in worker processes
+##
+## THE SAME FILES IMPORTED WITH 1, 2, 4... PROCESSES (UP TO THE CPU COUNT) - speedup IS
+## AGAINST ONE FILE AT A TIME ON THE RUNNER'S THREAD. THE TIME INCLUDES STARTING THE
+## PROCESSES AND THE ONE MERGE, NOT THE GUI'S INSERT. RUN IT ON A MACHINE WITH SEVERAL CORES -
+## ON ONE CORE THE WORKERS ONLY TAKE TURNS
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_parallel_import [files] [rows per file]
+##
+################################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_transaction_import import writeFile
+from benchmarks.sample_data import sampleTransactions
+from src.models.transaction_import import ImportRunner
+from src.models.transaction_model import TransactionTableModel
+
+
+def load(paths, processes, rows):
+    runner = ImportRunner(paths, 1 << 18, 2, 100, processes=processes)
+    runner.signals.block.connect(lambda runner, block: runner.blockInserted())
+    start = time.perf_counter()
+    runner.run()
+    seconds = time.perf_counter() - start
+    assert runner.error is None, runner.error
+    assert runner.rows == rows
+    return seconds
+
+
+if __name__ == "__main__":
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rowsPerFile = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    folder = tempfile.mkdtemp()
+    try:
+        paths = []
+        for month in range(files):
+            path = os.path.join(folder, f"statement_{month:02}.csv")
+            writeFile(TransactionTableModel(sampleTransactions(rowsPerFile, seed=month + 1)).columns, path)
+            paths.append(path)
+        size = sum(map(os.path.getsize, paths))
+        print(f"files: {files}  rows: {files * rowsPerFile:,}  size: {size / 1e6:.1f} MB  cores: {os.cpu_count()}")
+        print(f"{'processes':>10}{'seconds':>10}{'MB/s':>8}{'speedup':>9}")
+        counts = [1] + [count for count in (2, 4, 8, 16) if count <= os.cpu_count()]
+        serial = None
+        for processes in counts:
+            seconds = load(paths, processes, files * rowsPerFile)
+            serial = serial or seconds
+            print(f"{processes:>10}{seconds:>10.2f}{size / 1e6 / seconds:>8.1f}{serial / seconds:>9.2f}")
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,75 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - importing statements that are already (partly) held
+##
+## first IMPORTS THE FILES INTO AN EMPTY STORE, unchanged IMPORTS THE SAME FILES AGAIN (EVERY
+## FILE SKIPPED ON ITS STAT), touched AFTER THEIR MODIFICATION TIMES CHANGE (EVERY FILE
+## DIGESTED, NONE READ) AND overlapping IMPORTS STATEMENTS WHOSE FIRST HALF REPEATS AN
+## EARLIER ONE (EVERY ROW FINGERPRINTED, HALF OF THEM LEFT OUT)
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_reimport [files] [rows per file]
+##
+################################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_transaction_import import writeFile
+from benchmarks.sample_data import sampleTransactions
+from src.models.import_index import ImportIndex
+from src.models.transaction_import import ImportRunner
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_store import TransactionStore
+
+
+def load(store, paths):
+    index = ImportIndex(store.importedFiles(), store.fingerprintCounts)
+    runner = ImportRunner(paths, 1 << 18, 2, 100, store, index=index)
+    runner.signals.block.connect(lambda runner, block: runner.blockInserted())
+    start = time.perf_counter()
+    runner.run()
+    assert runner.error is None, runner.error
+    store.recordImports(runner.imported)
+    return time.perf_counter() - start, runner
+
+
+# THE SECOND HALF OF path'S ROWS, THEN NEW ROWS
+def overlap(path, rows, seed, target):
+    writeFile(TransactionTableModel(sampleTransactions(rows, seed=seed)).columns, target)
+    with open(path) as held, open(target) as new:
+        lines, extra = held.readlines(), new.readlines()[1:]
+    with open(target, "w") as file:
+        file.writelines(lines[:1] + lines[1 + rows // 2:] + extra[:rows // 2])
+
+
+if __name__ == "__main__":
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rowsPerFile = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    folder = tempfile.mkdtemp()
+    try:
+        paths = []
+        for month in range(files):
+            path = os.path.join(folder, f"statement_{month:02}.csv")
+            writeFile(TransactionTableModel(sampleTransactions(rowsPerFile, seed=month + 1)).columns, path)
+            paths.append(path)
+        overlapping = [os.path.join(folder, f"overlap_{month:02}.csv") for month in range(files)]
+        for month, path in enumerate(overlapping):
+            overlap(paths[month], rowsPerFile, files + month + 1, path)
+        store = TransactionStore(os.path.join(folder, "store.db"))
+
+        print(f"files: {files}  rows per file: {rowsPerFile:,}")
+        print(f"{'import':>12}{'seconds':>10}{'rows':>10}{'held':>10}{'skipped':>9}")
+        for name, batch, touch in (("first", paths, False), ("unchanged", paths, False),
+                                   ("touched", paths, True), ("overlapping", overlapping, False)):
+            if touch:
+                for path in batch:
+                    os.utime(path)
+            seconds, runner = load(store, batch)
+            print(f"{name:>12}{seconds:>10.3f}{runner.rows:>10,}{runner.duplicates:>10,}{len(runner.skipped):>9}")
+        store.close()
+    finally:
+        shutil.rmtree(folder)
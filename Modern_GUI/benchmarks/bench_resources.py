@@ -0,0 +1,47 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - time to register the Qt resources at startup
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_resources [runs]
+##
+################################################################################
+
+import os
+import statistics
+import subprocess
+import sys
+
+
+# EACH RUN IS A FRESH INTERPRETER SO THE IMPORT COST IS PAID EVERY TIME. QtCore IS
+# IMPORTED BEFORE THE CLOCK STARTS - BOTH PATHS NEED IT, ONLY THE RESOURCES ARE TIMED
+CHILD = """
+import time
+from PySide6.QtCore import QFile
+t = time.perf_counter()
+from src.app_resources import loadResources
+mode = loadResources({mode!r})
+ms = (time.perf_counter() - t) * 1000
+assert QFile.exists(":/icons/images/icons/cil-home.png")
+print(mode, ms)
+"""
+
+
+def timeMode(mode, runs):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", CHILD.format(mode=mode)],
+                             cwd=root, capture_output=True, text=True, check=True)
+        loaded, ms = out.stdout.split()
+        timings.append(float(ms))
+    return loaded, timings
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'mode':<8}{'loaded':<8}{'median ms':>10}{'min ms':>10}{'max ms':>10}")
+    for mode in ("python", "rcc"):
+        loaded, timings = timeMode(mode, runs)
+        print(f"{mode:<8}{loaded:<8}{statistics.median(timings):>10.2f}"
+              f"{min(timings):>10.2f}{max(timings):>10.2f}")
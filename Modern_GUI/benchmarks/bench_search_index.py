@@ -0,0 +1,102 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - search box keystroke to filtered table
+##
+## EACH QUERY IS TYPED ONE CHARACTER AT A TIME; A KEYSTROKE = SEARCH THE INDEX ON THE THREAD
+## POOL AND HAND THE ROWS TO THE PROXY. gui IS THE GUI THREAD'S SHARE OF THE WORST KEYSTROKE,
+## shown WHEN ITS ROWS APPEAR. "scan" IS THE SAME FILTER AS A PREDICATE OVER EVERY ROW
+## (SORTED BY PRICE)
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_search_index [rows]
+##
+################################################################################
+
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication, QThreadPool, Qt
+
+from benchmarks.sample_data import sampleTransactions
+from src.models.search_index import TransactionSearchIndex
+from src.models.transaction_columns import ACTIONS
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import TransactionProxyModel
+
+
+QUERIES = ("vod", "bp.", "sell", "a", "vod sell", "v buy", "zzz")
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def scanFilter(query):
+    def predicate(columns):
+        tickers = [ticker.casefold() for ticker in columns.tickers]
+        actions = [action.casefold() for action in ACTIONS]
+        return bytes(all(term in tickers[ticker] or term in actions[action] for term in query.split())
+                     for ticker, action in zip(columns.tickerIds, columns.actions))
+    return predicate
+
+
+def settle():
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.processEvents()
+
+
+# WORST KEYSTROKE (GUI THREAD ms, ms UNTIL THE ROWS ARE SHOWN) - searchLater, THEN THE ROWS
+# FOUND HANDED TO THE PROXY, WHOSE ORDER MAY BE BUILT ON THE THREAD POOL TOO
+def typing(index, proxy, query):
+    guiTimes, shownTimes, handed = [], [], []
+    found = lambda text, rows: handed.append(timed(lambda: proxy.setRowFilter("search", rows)))
+    index.found.connect(found)
+    for length in range(1, len(query) + 1):
+        handed.clear()
+        start = time.perf_counter()
+        index.searchLater(query[:length])
+        asked = (time.perf_counter() - start) * 1000
+        settle()
+        settle()
+        guiTimes.append(asked + sum(handed))
+        shownTimes.append((time.perf_counter() - start) * 1000)
+    index.found.disconnect(found)
+    return max(guiTimes), max(shownTimes)
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QCoreApplication(sys.argv)
+    model = TransactionTableModel(sampleTransactions(rows))
+    proxy = TransactionProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(model.PRICE, Qt.DescendingOrder)
+
+    start = time.perf_counter()
+    index = TransactionSearchIndex(model.portfolio)
+    settle()
+    print(f"rows: {rows:,}   index built in the background: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # WORST KEYSTROKE WHILE TYPING THE QUERY, IN IMPORT ORDER AND SORTED BY PRICE
+    print(f"{'query':<12}{'import gui':>11}{'shown':>8}{'sorted gui':>12}{'shown':>8}{'scan ms':>10}{'rows':>12}")
+    for query in QUERIES:
+        proxy.sort(-1)
+        settle()
+        index.state.termCache.clear()
+        importGui, importShown = typing(index, proxy, query)
+        found = proxy.rowCount()
+        proxy.clearFilter("search")
+        proxy.sort(model.PRICE, Qt.DescendingOrder)
+        settle()
+        index.state.termCache.clear()
+        sortedGui, sortedShown = typing(index, proxy, query)
+        proxy.clearFilter("search")
+        settle()
+        scan = timed(lambda: (proxy.setFilter("scan", scanFilter(query)), settle()))
+        assert proxy.rowCount() == found
+        proxy.clearFilter("scan")
+        settle()
+        print(f"{query!r:<12}{importGui:>11.1f}{importShown:>8.1f}{sortedGui:>12.1f}{sortedShown:>8.1f}"
+              f"{scan:>10.1f}{found:>12,}")
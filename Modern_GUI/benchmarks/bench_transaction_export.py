@@ -0,0 +1,63 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - streaming grid rows to a CSV file
+##
+## rows/s IS THE WHOLE EXPORT ON ONE THREAD, peak IS THE LARGEST PYTHON ALLOCATION HELD
+## WHILE IT RAN (tracemalloc, ON A SECOND RUN - TRACING SLOWS IT DOWN SEVERAL TIMES) - IT
+## SHOULD FOLLOW THE CHUNK SIZE, NOT THE ROW COUNT
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_export [rows]
+##
+################################################################################
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.sample_data import sampleTransactions
+from src.models.transaction_export import ExportRunner, columnChunks
+from src.models.transaction_model import TransactionTableModel
+
+
+CHUNK_ROWS = (1_000, 20_000, 100_000)
+
+
+def export(columns, rows, chunkRows, path):
+    runner = ExportRunner(columnChunks(columns, rows, chunkRows), len(rows), path)
+    runner.run()
+    assert runner.error is None, runner.error
+    assert runner.written == len(rows)
+
+
+def timed(columns, rows, chunkRows, path):
+    start = time.perf_counter()
+    export(columns, rows, chunkRows, path)
+    return time.perf_counter() - start
+
+
+def peak(columns, rows, chunkRows, path):
+    tracemalloc.start()
+    export(columns, rows, chunkRows, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns = TransactionTableModel(sampleTransactions(rows)).columns
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        print(f"rows: {rows:,}")
+        print(f"{'chunk rows':>12}{'seconds':>10}{'rows/s':>12}{'peak MB':>10}{'file MB':>10}")
+        for chunkRows in CHUNK_ROWS:
+            seconds = timed(columns, range(rows), chunkRows, path)
+            peakBytes = peak(columns, range(rows), chunkRows, path)
+            print(f"{chunkRows:>12,}{seconds:>10.2f}{rows / seconds:>12,.0f}"
+                  f"{peakBytes / 1e6:>10.1f}{os.path.getsize(path) / 1e6:>10.1f}")
+    finally:
+        os.remove(path)
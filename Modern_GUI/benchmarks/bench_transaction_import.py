@@ -0,0 +1,89 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - streaming a broker CSV file in through the import pipeline
+##
+## MB/s AND rows/s ARE READ -> PARSE -> NORMALISE -> VALIDATE ON ONE THREAD WITH THE BLOCKS
+## THROWN AWAY (NOTHING INSERTED), peak IS THE LARGEST PYTHON ALLOCATION HELD WHILE IT RAN
+## (tracemalloc, ON A SECOND RUN) - IT SHOULD FOLLOW THE CHUNK SIZE, NOT THE FILE SIZE.
+## detect IS THE BROKER FORMAT DETECTION, FIRST FOR THE HEADER AND THEN FROM THE CACHE
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_import [rows]
+##
+################################################################################
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.sample_data import sampleTransactions
+from src.models import broker_formats
+from src.models.transaction_export import HEADER, CsvFormatter, columnChunks
+from src.models.transaction_import import ImportRunner
+from src.models.transaction_model import TransactionTableModel
+
+
+CHUNK_BYTES = (1 << 16, 1 << 18, 1 << 20)
+
+
+def writeFile(columns, path):
+    formatter = CsvFormatter()
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(HEADER)
+        for chunk, rows in columnChunks(columns, range(len(columns)), 100_000):
+            file.write(formatter.text(chunk, rows))
+
+
+def load(path, chunkBytes, rows):
+    runner = ImportRunner([path], chunkBytes, 2, 100)
+    runner.signals.block.connect(lambda runner, block: runner.blockInserted())
+    runner.run()
+    assert runner.error is None, runner.error
+    assert runner.rows == rows and runner.rejected == 0
+
+
+def detectTimes(path):
+    broker_formats.mapperCache.clear()
+    times = []
+    with open(path, "rb") as file:
+        for run in range(2):
+            start = time.perf_counter()
+            broker_formats.detectFormat(file)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def timed(path, chunkBytes, rows):
+    start = time.perf_counter()
+    load(path, chunkBytes, rows)
+    return time.perf_counter() - start
+
+
+def peak(path, chunkBytes, rows):
+    tracemalloc.start()
+    load(path, chunkBytes, rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        writeFile(TransactionTableModel(sampleTransactions(rows)).columns, path)
+        size = os.path.getsize(path)
+        print(f"rows: {rows:,}  file: {size / 1e6:.1f} MB")
+        first, cached = detectTimes(path)
+        print(f"detect: first {first * 1e3:.2f} ms, cached {cached * 1e6:.1f} us")
+        print(f"{'chunk KB':>10}{'seconds':>10}{'MB/s':>8}{'rows/s':>12}{'peak MB':>10}")
+        for chunkBytes in CHUNK_BYTES:
+            seconds = timed(path, chunkBytes, rows)
+            peakBytes = peak(path, chunkBytes, rows)
+            print(f"{chunkBytes >> 10:>10,}{seconds:>10.2f}{size / 1e6 / seconds:>8.1f}"
+                  f"{rows / seconds:>12,.0f}{peakBytes / 1e6:>10.1f}")
+    finally:
+        os.remove(path)
@@ -0,0 +1,76 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - sorting and filtering the transaction table through the proxy
+##
+## THE PERMUTATIONS ARE BUILT ON THE THREAD POOL AFTER THE LOAD - background IS HOW LONG
+## THAT TAKES, AND THE SORTS AFTER IT ARE WHAT THE GUI THREAD PAYS. A FILTER'S ORDER IS ALSO
+## WORKED OUT ON THE THREAD POOL: gui IS THE GUI THREAD'S SHARE, shown WHEN THE ROWS APPEAR
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_proxy [rows]
+##
+################################################################################
+
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication, QThreadPool, Qt
+
+from benchmarks.sample_data import sampleTransactions
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import (TransactionProxyModel, actionFilter, dateFilter,
+                                          priceFilter, tickerFilter)
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+# (GUI THREAD ms, ms UNTIL THE NEW ORDER IS SHOWN)
+def settled(app, action):
+    start = time.perf_counter()
+    action()
+    gui = (time.perf_counter() - start) * 1000
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    return gui, (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QCoreApplication(sys.argv)
+    model = TransactionTableModel(sampleTransactions(rows))
+    proxy = TransactionProxyModel()
+    gui, background = settled(app, lambda: proxy.setSourceModel(model))
+    assert len(proxy.permutations) == len(model.HEADERS)
+
+    # THE FIRST SORT PICKS UP THE PERMUTATION BUILT IN THE BACKGROUND
+    print(f"rows: {rows:,}  background: {background:,.0f} ms")
+    print(f"{'column':<12}{'first ms':>10}{'cached ms':>11}{'reverse ms':>12}")
+    for column, header in enumerate(model.HEADERS):
+        first = timed(lambda: proxy.sort(column, Qt.AscendingOrder))
+        reverse = timed(lambda: proxy.sort(column, Qt.DescendingOrder))
+        proxy.sort(-1)
+        cached = timed(lambda: proxy.sort(column, Qt.AscendingOrder))
+        print(f"{header:<12}{first:>10.1f}{cached:>11.1f}{reverse:>12.1f}")
+
+    filters = (
+        ("action SELL", "action", actionFilter("SELL")),
+        ("ticker VOD, AAPL", "ticker", tickerFilter("VOD", "AAPL")),
+        ("dates 2018-2020", "date", dateFilter("2018-04-06", "2020-04-05")),
+        ("price 100-1000", "price", priceFilter(100, 1000)),
+    )
+    print(f"\n{'filter':<28}{'gui ms':>8}{'shown ms':>10}{'rows':>12}")
+    proxy.sort(-1)
+    for label, name, predicate in filters:
+        gui, shown = settled(app, lambda: proxy.setFilter(name, predicate))
+        print(f"{'+ ' + label:<28}{gui:>8.1f}{shown:>10.1f}{proxy.rowCount():>12,}")
+    gui, shown = settled(app, lambda: proxy.sort(model.PRICE, Qt.DescendingOrder))
+    print(f"{'sort filtered by price':<28}{gui:>8.1f}{shown:>10.1f}{proxy.rowCount():>12,}")
+    gui, shown = settled(app, proxy.clearFilter)
+    print(f"{'clear filters':<28}{gui:>8.1f}{shown:>10.1f}{proxy.rowCount():>12,}")
+    proxy.sort(model.DATE, Qt.AscendingOrder)
+    gui, shown = settled(app, lambda: proxy.setFilter("date", dateFilter("2018-04-06", "2019-04-05")))
+    print(f"{'tax year, sorted by date':<28}{gui:>8.1f}{shown:>10.1f}{proxy.rowCount():>12,}")
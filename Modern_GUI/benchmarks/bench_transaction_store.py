@@ -0,0 +1,100 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - opening and scrolling a transaction store through the paged model
+##
+## WRITES rows SAMPLE TRANSACTIONS TO A TEMPORARY STORE, THEN COMPARES READING THE WHOLE
+## STORE INTO THE TABLE WITH OPENING IT PAGED, AND SCROLLS THE PAGED TABLE DOWN AT A
+## STEADY SPEED COUNTING THE FRAMES THAT SHOWED ROWS NOT READ YET
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_store [rows]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_settings import Settings
+from src.models.transaction_store import TransactionStore
+
+
+FRAMES = 600
+ROWS_PER_FRAME = 120
+
+
+def visibleBlocks(table, model):
+    first = table.rowAt(0)
+    last = table.rowAt(table.viewport().height() - 1)
+    last = model.rowCount() - 1 if last < 0 else last
+    return range(first // model.blockRows, last // model.blockRows + 1)
+
+
+def scrollFrames(window, frames):
+    table = window.ui.transactionTable
+    model = window.transactionPages
+    scrollBar = table.verticalScrollBar()
+    timings = []
+    misses = 0
+    for frame in range(frames):
+        start = time.perf_counter()
+        scrollBar.setValue(scrollBar.value() + ROWS_PER_FRAME)
+        # DELIVERS THE LOADED BLOCKS AND THE fetchMore INSERTS, THEN PAINTS THE VIEWPORT
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+        misses += any(block not in model.blocks for block in visibleBlocks(table, model))
+        time.sleep(0.004)      # THE REST OF A 60 Hz FRAME - TIME FOR THE READER THREAD
+    return timings, misses, scrollBar.value()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "transactions.db")
+        start = time.perf_counter()
+        TransactionStore(path).append(sampleTransactions(rows))
+        writeMs = (time.perf_counter() - start) * 1000
+
+        from src.gui.mainwindow import MainWindow
+        window = MainWindow()
+        window.resize(1280, 800)
+        window.pages.show("widgets")
+        QApplication.processEvents()
+
+        # EVERYTHING UP FRONT - READ THE STORE INTO THE IN-MEMORY TABLE
+        start = time.perf_counter()
+        window.transactionModel.setColumns(TransactionStore(path).readAll())
+        QApplication.processEvents()
+        readAllMs = (time.perf_counter() - start) * 1000
+
+        # PAGED - COUNT THE ROWS, SHOW THE FIRST BLOCK
+        start = time.perf_counter()
+        window.openTransactionStore(TransactionStore(path))
+        QApplication.processEvents()
+        openMs = (time.perf_counter() - start) * 1000
+        window.transactionPages.pool.waitForDone()
+        QApplication.processEvents()
+        firstBlockMs = (time.perf_counter() - start) * 1000
+
+        timings, misses, position = scrollFrames(window, FRAMES)
+        timings.sort()
+        window.transactionPages.pool.waitForDone()
+        print(f"rows:                 {rows:,}")
+        print(f"write store:          {writeMs:,.0f} ms")
+        print(f"read all into table:  {readAllMs:,.1f} ms")
+        print(f"open paged:           {openMs:.1f} ms  (first block shown {firstBlockMs:.1f} ms)")
+        print(f"scroll frame:         median {statistics.median(timings):.3f} ms, "
+              f"p95 {timings[int(len(timings) * 0.95)]:.3f} ms, max {timings[-1]:.3f} ms")
+        print(f"frames missing rows:  {misses} of {FRAMES}, scrolled to row {position:,}")
+        print(f"blocks in memory:     {len(window.transactionPages.blocks)} "
+              f"(cap {Settings.STORE_CACHE_BLOCKS} x {Settings.STORE_BLOCK_ROWS} rows)")
+        window.close()
@@ -0,0 +1,72 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - memory and scroll frame time of the transaction table
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_table [rows]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+
+
+FRAMES = 300
+
+
+def scrollFrames(window, frames):
+    table = window.ui.transactionTable
+    scrollBar = table.verticalScrollBar()
+
+    # ONE FRAME = JUMP TO A NEW POSITION IN THE HISTORY AND REPAINT SYNCHRONOUSLY
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        scrollBar.setValue(scrollBar.maximum() * frame // frames)
+        table.viewport().repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QApplication(sys.argv)
+
+    start = time.perf_counter()
+    columns = sampleTransactions(rows)
+    buildMs = (time.perf_counter() - start) * 1000
+
+    # TRACING EVERY ALLOCATION IS SLOW - MEASURE THE HEAP ON A TENTH OF THE ROWS
+    sampleRows = max(rows // 10, 1)
+    tracemalloc.start()
+    sample = sampleTransactions(sampleRows)
+    pythonBytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sample
+
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.resize(1280, 800)
+    window.pages.show("widgets")
+    start = time.perf_counter()
+    window.transactionModel.setColumns(columns)
+    QApplication.processEvents()
+    attachMs = (time.perf_counter() - start) * 1000
+
+    timings = sorted(scrollFrames(window, FRAMES))
+    print(f"rows:              {rows:,}")
+    print(f"build columns:     {buildMs:,.0f} ms")
+    print(f"column bytes/row:  {columns.nbytes() / max(rows, 1):.1f}")
+    print(f"python bytes/row:  {pythonBytes / sampleRows:.1f}")
+    print(f"attach to view:    {attachMs:.1f} ms")
+    print(f"scroll frame:      median {statistics.median(timings):.3f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)]:.3f} ms, max {timings[-1]:.3f} ms")
@@ -0,0 +1,105 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - keeping the totals footer up to date
+##
+## grid = THE CHANGE ITSELF (MODEL AND PROXY), totals = TransactionTotals CATCHING UP WITH
+## IT, re-sum = THE SAME TOTALS SUMMED AGAIN OVER EVERY ROW THE GRID SHOWS
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_transaction_totals [rows]
+##
+################################################################################
+
+import sys
+import time
+from datetime import date
+
+from PySide6.QtCore import QCoreApplication, QThreadPool, Qt
+
+from benchmarks.sample_data import sampleTransactions
+from src.models.capital_gains import matchDisposals
+from src.models.gains_matcher import GainsMatcher
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import TransactionProxyModel, dateFilter, tickerFilter
+from src.models.transaction_totals import TransactionTotals
+
+
+TAX_YEARS = [(date(year, 4, 6), date(year + 1, 4, 5)) for year in range(2015, 2025)]
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def resum(totals):
+    order = totals.proxy.order if totals.proxy.order is not None else range(len(totals.rowProceeds))
+    proceeds = sum(map(totals.rowProceeds.__getitem__, order))
+    return proceeds, None if totals.rowCosts is None else sum(map(totals.rowCosts.__getitem__, order))
+
+
+# A FILTER'S ORDER IS BUILT ON THE THREAD POOL - grid ms RUNS UNTIL IT IS SHOWN
+def report(name, change):
+    gridMs = timed(lambda: (change(), settle()))
+    totalsMs = timed(totals.refresh)
+    resumMs = timed(lambda: resum(totals))
+    proceeds, costs = resum(totals)
+    assert (totals.proceeds, totals.costs) == (proceeds, None if totals.costs is None else costs), name
+    print(f"{name:<30}{gridMs:>10.2f}{totalsMs:>11.3f}{resumMs:>11.2f}{totals.count:>12,}")
+
+
+def settle():
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.processEvents()
+
+
+def waitForMatching():
+    while matcher.pending():
+        QThreadPool.globalInstance().waitForDone()
+        QCoreApplication.processEvents()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QCoreApplication(sys.argv)
+    model = TransactionTableModel(sampleTransactions(rows))
+    proxy = TransactionProxyModel()
+    proxy.setSourceModel(model)
+    matcher = GainsMatcher(model.portfolio)
+    totals = TransactionTotals(proxy, matcher)
+    start = time.perf_counter()
+    waitForMatching()
+    print(f"rows: {rows:,}   matched in the background: {(time.perf_counter() - start) * 1000:.0f} ms")
+    results = matcher.results
+    assert totals.allProceeds == sum(results.disposalProceeds)
+
+    print(f"{'change':<30}{'grid ms':>10}{'totals ms':>11}{'re-sum ms':>11}{'rows':>12}")
+    report("all rows", lambda: None)
+
+    # ONE TAX YEAR AT A TIME - THE FIRST BUILDS THE DATE PERMUTATION AND ITS PREFIX SUMS
+    for number, (first, last) in enumerate(TAX_YEARS[:3]):
+        report(f"tax year {first.year}/{last.year % 100}" + (" (first)" if not number else ""),
+               lambda: proxy.setFilter("taxYear", dateFilter(first, last)))
+
+    proxy.sort(model.PRICE, Qt.DescendingOrder)
+    report("tax year, sorted by price", lambda: proxy.setFilter("taxYear", dateFilter(*TAX_YEARS[5])))
+    report("tax year and two tickers", lambda: proxy.setFilter("ticker", tickerFilter("VOD", "AAPL")))
+    proxy.clearFilter()
+    proxy.sort(-1)
+    settle()
+    totals.refresh()
+
+    # APPENDS AND EDITS IN IMPORT ORDER - COSTS WAIT FOR THE MATCHING, PROCEEDS DO NOT. THE
+    # BLOCK TOUCHES EVERY ASSET, THE EDIT ONLY ITS OWN
+    block = sampleTransactions(1_000, seed=2)
+    report("append 1,000 rows", lambda: model.appendColumns(block))
+    report("matching caught up", waitForMatching)
+    columns = model.columns
+    row = next(row for row in range(rows) if columns.actions[row])
+    report("edit one disposal's price",
+           lambda: model.portfolio.updateRows([row], {"prices": [columns.prices[row] + 1_000_000]}))
+    report("matching caught up (one asset)", waitForMatching)
+
+    # ONLY THE EDITED ASSET WAS MATCHED AGAIN - IT MUST AGREE WITH MATCHING EVERYTHING
+    assert totals.allCosts == sum(matchDisposals(model.columns).disposalCosts)
@@ -0,0 +1,56 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark - table scroll frame time with each window shadow mode
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m benchmarks.bench_window_shadow [frames]
+##
+################################################################################
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.sample_data import sampleTransactions
+from src.app_settings import Settings
+
+
+ROWS = 2000
+
+
+def scrollFrames(mode, frames):
+    Settings.WINDOW_SHADOW = mode
+    from src.gui.mainwindow import MainWindow
+    window = MainWindow()
+    window.pages.show("widgets")
+
+    table = window.ui.transactionTable
+    window.transactionModel.setColumns(sampleTransactions(ROWS))
+    QApplication.processEvents()
+
+    # ONE FRAME = SCROLL ONE STEP AND REPAINT SYNCHRONOUSLY (TABLE + ANY EFFECT ABOVE IT)
+    scrollBar = table.verticalScrollBar()
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        scrollBar.setValue(frame % scrollBar.maximum())
+        table.viewport().repaint()
+        timings.append((time.perf_counter() - start) * 1000)
+    window.close()
+    window.deleteLater()
+    return timings
+
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication(sys.argv)
+    print(f"{'shadow':<12}{'median ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for mode in ("effect", "nineslice"):
+        timings = sorted(scrollFrames(mode, frames))
+        print(f"{mode:<12}{statistics.median(timings):>10.3f}"
+              f"{timings[int(len(timings) * 0.95)]:>10.3f}{timings[-1]:>10.3f}")
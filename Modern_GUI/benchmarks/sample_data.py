@@ -0,0 +1,33 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Benchmark data - synthetic broker histories of any size
+##
+################################################################################
+
+import random
+from datetime import date
+
+from src.models.transaction_columns import (FEE_SCALE, PRICE_SCALE, QUANTITY_SCALE,
+                                            TransactionColumns)
+
+
+TICKERS = ("VOD", "BP.", "HSBA", "AZN", "GSK", "ULVR", "RIO", "SHEL", "LLOY", "BARC",
+           "TSCO", "BT.A", "AAPL", "MSFT", "NVDA", "AMZN", "VWRL", "VUSA", "ISF", "SGLN")
+
+
+# rows TRANSACTIONS OVER TEN TAX YEARS, IN DATE ORDER - SAME seed, SAME DATA
+def sampleTransactions(rows, seed=1):
+    generator = random.Random(seed)
+    columns = TransactionColumns()
+    tickerIds = [columns.tickerId(ticker) for ticker in TICKERS]
+    start = date(2015, 4, 6).toordinal()
+    span = max(rows, 1)
+    columns.dates.extend(start + row * 3650 // span for row in range(rows))
+    columns.tickerIds.extend(generator.choice(tickerIds) for row in range(rows))
+    columns.actions.extend(generator.random() < 0.35 for row in range(rows))
+    columns.quantities.extend(generator.randint(1, 2_000) * QUANTITY_SCALE for row in range(rows))
+    columns.prices.extend(generator.randint(50, 500_000) * PRICE_SCALE // 100 for row in range(rows))
+    fees = (0, 0, 995 * FEE_SCALE // 100, 1195 * FEE_SCALE // 100, 1500 * FEE_SCALE // 100)
+    columns.fees.extend(generator.choice(fees) for row in range(rows))
+    return columns
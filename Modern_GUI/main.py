@@ -16,18 +16,27 @@
 
 import sys
 import os
+import multiprocessing
 
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
+from src import tracing
 
-#from src.gui.mainwindow import MainWindow
-from src.gui.splashscreen import SplashScreen
 
-os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
+if __name__ == "__main__":
+    # IMPORT WORKER PROCESSES ARE SPAWNED AND RE-RUN THIS SCRIPT AS __mp_main__ - THE GUI IS
+    # IMPORTED HERE SO THEY ONLY IMPORT WHAT THEIR JOBS NEED. IN A FROZEN BUILD THEY STOP HERE
+    multiprocessing.freeze_support()
+    with tracing.span("main.py imports"):
+        from PySide6.QtGui import QIcon
+        from PySide6.QtWidgets import QApplication
 
+        #from src.gui.mainwindow import MainWindow
+        from src.gui.splashscreen import SplashScreen
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("icon.ico"))
-    window = SplashScreen()
+    os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
+
+    with tracing.span("QApplication"):
+        app = QApplication(sys.argv)
+        app.setWindowIcon(QIcon("icon.ico"))
+    with tracing.span("SplashScreen"):
+        window = SplashScreen()
     sys.exit(app.exec())
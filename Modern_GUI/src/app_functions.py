@@ -21,24 +21,20 @@ from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
 from .app_settings import Settings
+from .app_themes import applyTheme
 from src.gui.mainwindow import MainWindow
 
 # WITH ACCESS TO MAIN WINDOW WIDGETS
 # ///////////////////////////////////////////////////////////////
 class AppFunctions(MainWindow):
     def setThemeHack(self):
-        Settings.BTN_LEFT_BOX_COLOR = "background-color: #495474;"
-        Settings.BTN_RIGHT_BOX_COLOR = "background-color: #495474;"
-        Settings.MENU_SELECTED_STYLESHEET = MENU_SELECTED_STYLESHEET = """
-        border-left: 22px solid qlineargradient(spread:pad, x1:0.034, y1:0, x2:0.216, y2:0, stop:0.499 rgba(255, 121, 198, 255), stop:0.5 rgba(85, 170, 255, 0));
-        background-color: #566388;
-        """
+        # SELECTED MENU AND BOX BUTTON COLOURS ARE THE [selected="true"] RULES OF THE THEME FILE
 
         # SET MANUAL STYLES
         self.ui.lineEdit.setStyleSheet("background-color: #6272a4;")
         self.ui.pushButton.setStyleSheet("background-color: #6272a4;")
         self.ui.plainTextEdit.setStyleSheet("background-color: #6272a4;")
-        self.ui.tableWidget.setStyleSheet("QScrollBar:vertical { background: #6272a4; } QScrollBar:horizontal { background: #6272a4; }")
+        self.ui.transactionTable.setStyleSheet("QScrollBar:vertical { background: #6272a4; } QScrollBar:horizontal { background: #6272a4; }")
         self.ui.scrollArea.setStyleSheet("QScrollBar:vertical { background: #6272a4; } QScrollBar:horizontal { background: #6272a4; }")
         self.ui.comboBox.setStyleSheet("background-color: #6272a4;")
         self.ui.horizontalScrollBar.setStyleSheet("background-color: #6272a4;")
@@ -48,18 +44,10 @@ class AppFunctions(MainWindow):
     
     # IMPORT THEMES FILES QSS/CSS
     # ///////////////////////////////////////////////////////////////
-    def setCustomTheme(self):
-        
-        useCustomTheme = False
-        themeFile1 = "Modern_GUI\\themes\\py_dracula_light.qss"
-        themeFile2 = "Modern_GUI\\themes\\py_dracula_dark.qss"
-        
-        # SET THEME AND HACKS
-        if useCustomTheme:
-            # LOAD AND APPLY STYLE
-            str = open(themeFile1, 'r').read()
-            self.ui.styleSheet.setStyleSheet(str)
+    def setCustomTheme(self, theme="light"):
+        # LOAD AND APPLY STYLE - THE THEME ENGINE RE-POLISHES THIS WINDOW ONLY
+        applyTheme(self, theme)
 
-            # SET HACKS
-            #AppFunctions.setThemeHack(self)
-            # FIXME Inherit rather than circular call
+        # SET HACKS
+        #AppFunctions.setThemeHack(self)
+        # FIXME Inherit rather than circular call
@@ -0,0 +1,66 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Qt resource loading - binary .rcc bundle with resources_rc.py fallback
+##
+################################################################################
+
+import os
+import subprocess
+import sys
+
+from PySide6.QtCore import QResource
+
+from src import tracing
+from src.app_settings import Settings
+
+
+# RESOURCE FILE LOCATIONS (RELATIVE TO THE Modern_GUI FOLDER)
+# ///////////////////////////////////////////////////////////////
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QRC_FILE = os.path.join(APP_ROOT, "resources.qrc")
+RCC_FILE = os.path.join(APP_ROOT, "resources.rcc")
+
+# MODE THE RESOURCES WERE REGISTERED WITH ("rcc" OR "python"), None UNTIL LOADED
+_loadedMode = None
+
+
+# REGISTER THE ICONS/IMAGES UNDER ":/" ONCE AND RETURN THE MODE USED
+# "rcc" REGISTERS resources.rcc WITH QResource, WHICH MEMORY-MAPS THE FILE INSTEAD OF
+# UNMARSHALLING THE 900 KB BYTES LITERAL IN resources_rc.py. FROZEN BUILDS, OR A MISSING
+# .rcc, FALL BACK TO IMPORTING resources_rc
+# ///////////////////////////////////////////////////////////////
+def loadResources(mode=None):
+    global _loadedMode
+    if _loadedMode is not None:
+        return _loadedMode
+
+    mode = mode or Settings.RESOURCE_MODE
+    with tracing.span("loadResources", requested=mode):
+        if mode == "rcc" and not getattr(sys, "frozen", False):
+            if os.path.exists(RCC_FILE) and QResource.registerResource(RCC_FILE):
+                _loadedMode = "rcc"
+                return _loadedMode
+
+        # FALLBACK - IMPORTING THE MODULE REGISTERS THE DATA (qInitResources)
+        from src import resources_rc
+        _loadedMode = "python"
+        return _loadedMode
+
+
+def loadedResourceMode():
+    return _loadedMode
+
+
+# COMPILE resources.qrc TO A BINARY .rcc - STORED UNCOMPRESSED SO QT CAN SERVE THE
+# FILES STRAIGHT FROM THE MAPPED BUNDLE (THE PNGs DO NOT COMPRESS FURTHER ANYWAY)
+# ///////////////////////////////////////////////////////////////
+def compileResources(output=RCC_FILE):
+    command = ["pyside6-rcc", "--binary", "--no-compress", QRC_FILE, "-o", output]
+    subprocess.run(command, cwd=APP_ROOT, check=True)
+    return output
+
+
+if __name__ == "__main__":
+    # REBUILD THE BUNDLE: python -m src.app_resources
+    print(f"Written: {compileResources()}")
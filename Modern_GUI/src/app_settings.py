@@ -2,7 +2,29 @@ class Settings():
     # CUSTOM TITLE BAR | SET AS "True" FOR WINDOWS AND "False" FOR MAC OR LINUX
     # ///////////////////////////////////////////////////////////////
     ENABLE_CUSTOM_TITLE_BAR = True
+
+    # WINDOW RESIZE | HAND THE CUSTOM GRIPS OVER TO THE WINDOW MANAGER (QWindow.startSystemResize)
+    # WHERE SUPPORTED, OTHERWISE RESIZE IN PYTHON AT MOST ONCE PER DISPLAY FRAME
+    ENABLE_SYSTEM_RESIZE = True
+
+    # WINDOW MOVE | DRAGGING THE TITLE BAR HANDS THE MOVE TO THE WINDOW MANAGER (QWindow.startSystemMove)
+    # WHERE SUPPORTED, OTHERWISE THE WINDOW IS MOVED IN PYTHON AT MOST ONCE PER DISPLAY FRAME
+    ENABLE_SYSTEM_MOVE = True
+
+    # QT RESOURCES | "rcc" LOADS THE BINARY resources.rcc BUNDLE, "python" IMPORTS resources_rc.py
+    # (FROZEN BUILDS AND A MISSING .rcc ALWAYS USE resources_rc.py)
+    # ///////////////////////////////////////////////////////////////
+    RESOURCE_MODE = "rcc"
     
+    # THEME | THEME OF THE MAIN WINDOW, A NAME IN src/app_themes.THEME_FILES ("dark" OR "light")
+    # ///////////////////////////////////////////////////////////////
+    THEME = "dark"
+
+    # WINDOW SHADOW | "nineslice" PAINTS A CACHED SHADOW AROUND THE FRAME, "effect" USES
+    # QGraphicsDropShadowEffect (EVERY CHILD REPAINT THEN GOES THROUGH A BLUR PASS)
+    # ///////////////////////////////////////////////////////////////
+    WINDOW_SHADOW = "nineslice"
+
     # BOX SIZES AND ANIMATIONS
     # ///////////////////////////////////////////////////////////////    
     MENU_WIDTH = 240
@@ -10,17 +32,55 @@ class Settings():
     RIGHT_BOX_WIDTH = 240
     TIME_ANIMATION = 500
 
-    # BTNS LEFT AND RIGHT BOX COLORS
-    BTN_LEFT_BOX_COLOR = "background-color: rgb(44, 49, 58);"
-    BTN_RIGHT_BOX_COLOR = "background-color: #ff79c6;"
+    # PANEL ANIMATIONS | "snapshot" SLIDES PIXMAPS OF THE PANELS AND RELAYOUTS ONCE, "layout"
+    # ANIMATES minimumWidth (THE WHOLE CONTENT AREA IS LAID OUT AGAIN EVERY FRAME)
+    ANIMATION_MODE = "snapshot"
+
+    # PAGES | MILLISECONDS AFTER THE MAIN WINDOW IS SHOWN BEFORE THE REMAINING PAGES ARE
+    # BUILT IN THE BACKGROUND, None TO BUILD EACH PAGE ONLY WHEN IT IS FIRST OPENED
+    PAGE_PREBUILD_DELAY = 500
+
+    # TRANSACTION STORE | PATH OF THE sqlite HISTORY OPENED AT START-UP, None FOR NONE. THE TABLE
+    # PAGES IT IN BLOCKS OF STORE_BLOCK_ROWS AS IT SCROLLS, READS STORE_PREFETCH_BLOCKS AHEAD ON A
+    # WORKER THREAD AND KEEPS AT MOST STORE_CACHE_BLOCKS IN MEMORY (LEAST RECENTLY USED GO FIRST)
+    # ///////////////////////////////////////////////////////////////
+    TRANSACTION_STORE = None
+    STORE_BLOCK_ROWS = 2000
+    STORE_PREFETCH_BLOCKS = 2
+    STORE_CACHE_BLOCKS = 64
+
+    # TABLE COLUMNS | "sampled" SIZES THEM FROM THE ROWS ON SCREEN AND THE WIDEST VALUES THE MODEL
+    # HAS SEEN AND REMEMBERS THE WIDTHS BETWEEN RUNS, "stretch" GIVES EVERY COLUMN AN EQUAL SHARE
+    COLUMN_SIZING = "sampled"
+
+    # SEARCH | THE SEARCH BOX IS SEARCHED (ON A WORKER THREAD) THIS MANY MS AFTER THE LAST KEYSTROKE
+    SEARCH_DELAY = 150
+
+    # HOLDINGS TREE | AN ASSET WITH MORE DISPOSALS (OR POOL ENTRIES) THAN THIS SHOWS THEM IN RANGES
+    # OF THIS MANY - EXPANDING A NODE LAYS OUT EVERY ONE OF ITS CHILDREN
+    HOLDINGS_GROUP_ROWS = 1000
+
+    # COPY / EXPORT | ROWS ARE FORMATTED AND WRITTEN THIS MANY AT A TIME ON A WORKER THREAD - MEMORY
+    # STAYS AT ONE CHUNK HOWEVER MANY ROWS ARE SELECTED
+    EXPORT_CHUNK_ROWS = 20000
+
+    # IMPORT | BROKER CSV FILES ARE READ, PARSED AND CHECKED THIS MANY BYTES AT A TIME ON A WORKER
+    # THREAD. AT MOST IMPORT_QUEUE_BLOCKS PARSED BLOCKS WAIT TO BE INSERTED (THE WORKER PAUSES
+    # UNTIL ONE IS), SO MEMORY STAYS AT A FEW CHUNKS HOWEVER LARGE THE FILE. THE FIRST
+    # IMPORT_REJECT_LIMIT BAD ROWS ARE LISTED, THE REST ONLY COUNTED
+    IMPORT_CHUNK_BYTES = 1 << 18
+    IMPORT_QUEUE_BLOCKS = 2
+    IMPORT_REJECT_LIMIT = 100
+
+    # IMPORT | SEVERAL FILES CHOSEN TOGETHER ARE PARSED IN THIS MANY WORKER PROCESSES (0 - ONE PER
+    # CPU CORE) AND INSERTED AS ONE BLOCK. A SINGLE FILE IS ALWAYS STREAMED
+    IMPORT_PROCESSES = 0
 
-    # BACKGROUND COLOUR FOR A MENU ITEM THAT IS SELECTED
-    MENU_SELECTED_STYLESHEET = """
-    border-left: 22px solid qlineargradient(spread:pad, x1:0.034, y1:0, x2:0.216, y2:0, stop:0.499 rgba(255, 121, 198, 255), stop:0.5 rgba(85, 170, 255, 0));
-    background-color: rgb(40, 44, 52);
-    """
+    # THE SELECTED MENU ITEM AND THE OPEN BOX BUTTONS CARRY THE DYNAMIC PROPERTY selected=true,
+    # STYLED BY THE [selected="true"] RULES IN THE STYLESHEET / THEME FILES
     
-    # APP NAME
+    # APP NAME - ORGANISATION AND TITLE ALSO NAME THE QSettings STORE
+    ORGANISATION = "DaisyCat"
     TITLE = "DaisyCat Tax"    
     DESCRIPTION = "DaisyCat Tax - UK Capital Gains Tax calculator."
         
@@ -0,0 +1,147 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Theme engine - compiles themes/*.qss into one application stylesheet
+##
+## THEME FILES ARE QSS WITH COLOUR VARIABLES, DEFINED AS  @name: value;  OUTSIDE ANY
+## RULE AND USED AS  @name  IN THE RULES. COMPILING RESOLVES THE VARIABLES, STRIPS THE
+## COMMENTS AND WHITESPACE AND SCOPES EVERY RULE TO  *[theme="<name>"] , SO ALL THEMES
+## SIT IN ONE SHEET SET ON THE QApplication A SINGLE TIME. A WINDOW PICKS ITS THEME
+## WITH THE theme PROPERTY - SWITCHING ONLY RE-POLISHES THAT WINDOW'S WIDGETS, WHERE
+## QApplication.setStyleSheet WOULD RE-POLISH EVERY WIDGET IN THE APPLICATION
+##
+################################################################################
+
+import hashlib
+import os
+import re
+
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtWidgets import QApplication, QWidget
+
+from src import tracing
+from src.app_settings import Settings
+
+
+# THEME FILES (RELATIVE TO THE Modern_GUI FOLDER)
+# ///////////////////////////////////////////////////////////////
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THEMES_DIR = os.path.join(APP_ROOT, "themes")
+THEME_FILES = {
+    "dark": "py_dracula_dark.qss",
+    "light": "py_dracula_light.qss",
+}
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_DEFINITION = re.compile(r"^\s*@([A-Za-z_][\w-]*)\s*:\s*([^;]+?)\s*;", re.MULTILINE)
+_REFERENCE = re.compile(r"@([A-Za-z_][\w-]*)")
+_SPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{};,])\s*")
+_DECLARATION = re.compile(r":\s+")
+_RULE = re.compile(r"([^{}]+)(\{[^}]*\})")
+
+# COMPILED SHEETS - KEY: SHA-1 OF THE THEME SOURCE(S)
+_compiledCache = {}
+
+
+## COMPILE
+########################################################################
+# RESOLVE THE VARIABLES AND MINIFY ONE THEME SOURCE - A SOURCE SEEN BEFORE IS NOT COMPILED AGAIN
+def compileTheme(source, name):
+    key = hashlib.sha1(f"{name}\0{source}".encode("utf-8")).hexdigest()
+    if key in _compiledCache:
+        return _compiledCache[key]
+
+    with tracing.span("compileTheme", theme=name):
+        sheet = _COMMENT.sub("", source)
+
+        # VARIABLES MAY USE THE ONES DEFINED ABOVE THEM
+        variables = {}
+        for variable, value in _DEFINITION.findall(sheet):
+            variables[variable] = resolveVariables(value, variables)
+        sheet = resolveVariables(_DEFINITION.sub("", sheet), variables)
+
+        sheet = _SPACE.sub(" ", sheet)
+        sheet = _PUNCTUATION.sub(r"\1", sheet)
+        sheet = _DECLARATION.sub(":", sheet)
+        sheet = sheet.replace(";}", "}").strip()
+        sheet = scopeRules(sheet, name)
+
+    _compiledCache[key] = sheet
+    return sheet
+
+
+def resolveVariables(text, variables):
+    def lookup(match):
+        name = match.group(1)
+        if name not in variables:
+            raise ValueError(f"Undefined theme variable: @{name}")
+        return variables[name]
+    return _REFERENCE.sub(lookup, text)
+
+
+# PREFIX EVERY SELECTOR WITH THE THEME SCOPE - THE SAME EXTRA SPECIFICITY ON EVERY RULE
+# KEEPS THEIR ORDER OF PRECEDENCE
+def scopeRules(sheet, name):
+    scope = f'*[theme="{name}"] '
+    def scoped(match):
+        selectors = ",".join(scope + selector for selector in match.group(1).split(","))
+        return selectors + match.group(2)
+    return _RULE.sub(scoped, sheet)
+
+
+def themeFile(name):
+    return os.path.join(THEMES_DIR, THEME_FILES[name])
+
+
+def loadTheme(name):
+    with open(themeFile(name), "r", encoding="utf-8") as file:
+        return compileTheme(file.read(), name)
+
+
+# ALL THEMES IN ONE SHEET - SAFE TO CALL OFF THE GUI THREAD
+def applicationSheet():
+    return "".join(loadTheme(name) for name in THEME_FILES)
+
+
+## APPLY
+########################################################################
+# SET THE COMBINED SHEET ON THE QApplication - ONLY THE FIRST CALL (OR A CHANGED THEME
+# FILE) REACHES QApplication.setStyleSheet
+def installThemes(app=None):
+    app = app or QApplication.instance()
+    sheet = applicationSheet()
+    if app.styleSheet() != sheet:
+        with tracing.span("installThemes"):
+            app.setStyleSheet(sheet)
+
+
+# SELECT THE THEME OF window AND ITS CHILDREN. CALLED BEFORE THE WINDOW IS BUILT THIS ONLY
+# SETS THE PROPERTY; LATER, ONLY WIDGETS THAT HAVE ALREADY BEEN POLISHED ARE RE-POLISHED -
+# PAGES NOT BUILT OR NEVER SHOWN PICK THE THEME UP WHEN THEY ARE FIRST POLISHED
+def applyTheme(window, name=None):
+    name = name or Settings.THEME
+    if name not in THEME_FILES:
+        raise ValueError(f"Unknown theme: {name}")
+    installThemes()
+    if window.property("theme") == name:
+        return name
+
+    with tracing.span("applyTheme", theme=name):
+        window.setProperty("theme", name)
+        styleChange = QEvent(QEvent.StyleChange)
+        for widget in [window] + window.findChildren(QWidget):
+            if widget.testAttribute(Qt.WA_WState_Polished):
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
+                QApplication.sendEvent(widget, styleChange)
+    return name
+
+
+if __name__ == "__main__":
+    # PRINT THE COMPILED SIZE OF EACH THEME: python -m src.app_themes
+    for name in THEME_FILES:
+        with open(themeFile(name), "r", encoding="utf-8") as file:
+            source = file.read()
+        print(f"{name}: {len(source)} -> {len(compileTheme(source, name))} characters")
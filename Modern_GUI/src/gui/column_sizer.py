@@ -0,0 +1,117 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Column sizer - table column widths from a bounded sample of the rows
+##
+## QHeaderView.ResizeToContents MEASURES UP TO resizeContentsPrecision() ROWS OF EVERY
+## COLUMN EACH TIME THE TABLE CHANGES. HERE A COLUMN IS AS WIDE AS THE WIDEST OF ITS
+## HEADER, THE ROWS ON SCREEN AND THE WIDEST VALUES THE MODEL HAS TRACKED WHILE ROWS
+## WERE ADDED (model.widestValues), SO MEASURING COSTS THE SAME FOR TEN ROWS OR A
+## MILLION. THE WIDTHS ARE KEPT PER VIEW AND SAVED WITH QSettings; A RESIZE ONLY SHARES
+## THE SPARE WIDTH OUT IN PROPORTION, IT NEVER MEASURES
+##
+################################################################################
+
+from PySide6.QtCore import QEvent, QObject, QSettings, Qt, QTimer
+from PySide6.QtWidgets import QHeaderView, QStyle
+
+from src import tracing
+from src.app_settings import Settings
+
+
+class ColumnSizer(QObject):
+    def __init__(self, view, padding=24):
+        super().__init__(view)
+        self.view = view
+        self.padding = padding
+        self.model = None
+        self.settings = QSettings(Settings.ORGANISATION, Settings.TITLE)
+        self.settingsKey = f"columnWidths/{view.objectName()}"
+
+        # WIDTH EACH COLUMN NEEDS - LAST RUN'S UNTIL THE FIRST MEASURE
+        self.widths = [int(width) for width in self.settings.value(self.settingsKey, []) or []]
+
+        header = view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(False)
+
+        # MODEL CHANGES ARRIVE IN BURSTS (ONE PER IMPORTED BLOCK) - MEASURE ONCE AFTER THEM
+        self.measureTimer = QTimer(self)
+        self.measureTimer.setSingleShot(True)
+        self.measureTimer.timeout.connect(self.measure)
+        view.viewport().installEventFilter(self)
+
+    ## CLASS METHODS ==> MODEL
+    ########################################################################
+    def setModel(self, model):
+        if self.model is not None:
+            for signal in self.modelSignals(self.model):
+                signal.disconnect(self.scheduleMeasure)
+        self.model = model
+        for signal in self.modelSignals(model):
+            signal.connect(self.scheduleMeasure)
+        self.fit()
+        self.scheduleMeasure()
+
+    def modelSignals(self, model):
+        return (model.modelReset, model.rowsInserted, model.layoutChanged, model.dataChanged)
+
+    def scheduleMeasure(self, *args):
+        self.measureTimer.start(0)
+
+    ## CLASS METHODS ==> WIDTHS
+    ########################################################################
+    def measure(self):
+        model = self.model
+        if model is None:
+            return
+        with tracing.span("ColumnSizer.measure", view=self.view.objectName()):
+            cellMetrics = self.view.fontMetrics()
+            headerMetrics = self.view.horizontalHeader().fontMetrics()
+            indicator = self.view.style().pixelMetric(QStyle.PM_HeaderMarkSize)
+            rows = self.sampleRows()
+            widths = []
+            for column in range(model.columnCount()):
+                title = model.headerData(column, Qt.Horizontal, Qt.DisplayRole) or ""
+                width = headerMetrics.horizontalAdvance(title) + indicator
+                texts = list(model.widestValues(column)) if hasattr(model, "widestValues") else []
+                texts += [model.index(row, column).data() for row in rows]
+                for text in texts:
+                    if text:
+                        width = max(width, cellMetrics.horizontalAdvance(text))
+                widths.append(width + self.padding)
+
+        if widths != self.widths:
+            self.widths = widths
+            self.settings.setValue(self.settingsKey, widths)
+            self.fit()
+
+    # THE ROWS ON SCREEN, OR THE FIRST SCREENFUL BEFORE THE VIEW HAS LAID ANY OUT
+    def sampleRows(self):
+        rowCount = self.model.rowCount()
+        first = max(self.view.rowAt(0), 0)
+        last = self.view.rowAt(self.view.viewport().height() - 1)
+        if last < 0:
+            rowHeight = max(self.view.verticalHeader().defaultSectionSize(), 1)
+            last = first + self.view.viewport().height() // rowHeight
+        return range(first, min(last + 1, rowCount))
+
+    # SET THE SECTIONS FROM self.widths, SHARING ANY SPARE VIEWPORT WIDTH IN PROPORTION
+    def fit(self):
+        header = self.view.horizontalHeader()
+        if not self.widths or len(self.widths) != header.count():
+            return
+        available = self.view.viewport().width()
+        total = sum(self.widths)
+        sizes = list(self.widths)
+        if 0 < total < available:
+            sizes = [width * available // total for width in self.widths]
+            sizes[-1] += available - sum(sizes)
+        for column, size in enumerate(sizes):
+            if header.sectionSize(column) != size:
+                header.resizeSection(column, size)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Resize:
+            self.fit()
+        return False
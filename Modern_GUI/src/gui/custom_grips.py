@@ -18,6 +18,8 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+from src.app_settings import Settings
+
 class CustomGrip(QWidget):
     def __init__(self, parent, position, disable_color = False):
 
@@ -26,6 +28,13 @@ class CustomGrip(QWidget):
         self.parent = parent
         self.setParent(parent)
         self.wi = Widgets()
+        self.edge = position
+
+        # COALESCE RESIZES - THE LATEST GEOMETRY IS APPLIED AT MOST ONCE PER DISPLAY FRAME
+        self.pendingGeometry = None
+        self.frameTimer = QTimer(self)
+        self.frameTimer.setSingleShot(True)
+        self.frameTimer.timeout.connect(self.applyPendingGeometry)
 
         # SHOW TOP GRIP
         if position == Qt.TopEdge:
@@ -43,9 +52,11 @@ class CustomGrip(QWidget):
                 height = max(self.parent.minimumHeight(), self.parent.height() - delta.y())
                 geo = self.parent.geometry()
                 geo.setTop(geo.bottom() - height)
-                self.parent.setGeometry(geo)
+                self.queueGeometry(geo)
                 event.accept()
             self.wi.top.mouseMoveEvent = resize_top
+            self.wi.top.mousePressEvent = self.startResize
+            self.wi.top.mouseReleaseEvent = self.finishResize
 
             # ENABLE COLOR
             if disable_color:
@@ -67,9 +78,13 @@ class CustomGrip(QWidget):
             def resize_bottom(event):
                 delta = event.pos()
                 height = max(self.parent.minimumHeight(), self.parent.height() + delta.y())
-                self.parent.resize(self.parent.width(), height)
+                geo = self.parent.geometry()
+                geo.setHeight(height)
+                self.queueGeometry(geo)
                 event.accept()
             self.wi.bottom.mouseMoveEvent = resize_bottom
+            self.wi.bottom.mousePressEvent = self.startResize
+            self.wi.bottom.mouseReleaseEvent = self.finishResize
 
             # ENABLE COLOR
             if disable_color:
@@ -89,9 +104,11 @@ class CustomGrip(QWidget):
                 width = max(self.parent.minimumWidth(), self.parent.width() - delta.x())
                 geo = self.parent.geometry()
                 geo.setLeft(geo.right() - width)
-                self.parent.setGeometry(geo)
+                self.queueGeometry(geo)
                 event.accept()
             self.wi.leftgrip.mouseMoveEvent = resize_left
+            self.wi.leftgrip.mousePressEvent = self.startResize
+            self.wi.leftgrip.mouseReleaseEvent = self.finishResize
 
             # ENABLE COLOR
             if disable_color:
@@ -106,9 +123,13 @@ class CustomGrip(QWidget):
             def resize_right(event):
                 delta = event.pos()
                 width = max(self.parent.minimumWidth(), self.parent.width() + delta.x())
-                self.parent.resize(width, self.parent.height())
+                geo = self.parent.geometry()
+                geo.setWidth(width)
+                self.queueGeometry(geo)
                 event.accept()
             self.wi.rightgrip.mouseMoveEvent = resize_right
+            self.wi.rightgrip.mousePressEvent = self.startResize
+            self.wi.rightgrip.mouseReleaseEvent = self.finishResize
 
             # ENABLE COLOR
             if disable_color:
@@ -118,6 +139,35 @@ class CustomGrip(QWidget):
     def mouseReleaseEvent(self, event):
         self.mousePos = None
 
+    # LET THE WINDOW MANAGER RESIZE THE WINDOW WHERE THE PLATFORM SUPPORTS IT - MOVE EVENTS
+    # THEN NEVER REACH THE GRIP. OTHERWISE THE MOVE HANDLERS ABOVE QUEUE THE GEOMETRY
+    def startResize(self, event):
+        if Settings.ENABLE_SYSTEM_RESIZE and event.button() == Qt.LeftButton:
+            handle = self.parent.windowHandle()
+            if handle is not None:
+                handle.startSystemResize(self.edge)
+        event.accept()
+
+    def finishResize(self, event):
+        self.applyPendingGeometry()
+        event.accept()
+
+    def queueGeometry(self, geometry):
+        # ONLY THE LATEST GEOMETRY MATTERS - EACH MOVE EVENT IS MEASURED FROM THE GEOMETRY
+        # ACTUALLY APPLIED, SO OVERWRITING THE PENDING ONE LOSES NOTHING
+        self.pendingGeometry = geometry
+        if not self.frameTimer.isActive():
+            screen = self.parent.screen()
+            rate = screen.refreshRate() if screen is not None else 60.0
+            self.frameTimer.start(max(int(1000 / max(rate, 1.0)), 1))
+
+    def applyPendingGeometry(self):
+        self.frameTimer.stop()
+        if self.pendingGeometry is not None:
+            geometry, self.pendingGeometry = self.pendingGeometry, None
+            if geometry != self.parent.geometry():
+                self.parent.setGeometry(geometry)
+
     def resizeEvent(self, event):
         if hasattr(self.wi, 'container_top'):
             self.wi.container_top.setGeometry(0, 0, self.width(), 10)
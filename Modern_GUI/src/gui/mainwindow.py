@@ -6,12 +6,37 @@
 ################################################################################
 
 
+import os
+import sys
+import tempfile
+from array import array
+
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+from src import tracing
+from src.app_themes import applyTheme
 from src.app_settings import Settings
+from src.gui.column_sizer import ColumnSizer
 from src.gui.custom_grips import CustomGrip
+from src.gui.numeric_delegate import NumericDelegate
+from src.gui.page_registry import PageRegistry
+from src.gui.panel_animation import PanelAnimator
+from src.gui.window_shadow import WindowShadow
+from src.models.capital_gains import MONEY_SCALE
+from src.models.gains_matcher import GainsMatcher
+from src.models.import_index import ImportIndex, fingerprintCounts
+from src.models.holdings_model import HoldingsTreeModel
+from src.models.paged_transaction_model import PagedTransactionModel
+from src.models.portfolio_model import REMOVED, RESET, PortfolioModel
+from src.models.search_index import TransactionSearchIndex
+from src.models.transaction_columns import TransactionColumns, formatFixed
+from src.models.transaction_export import CsvFileMimeData, ExportRunner, columnChunks, storeChunks
+from src.models.transaction_import import ImportRunner
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import TransactionProxyModel
+from src.models.transaction_totals import TransactionTotals
 
 from src.qtdesigner.ui_mainwindow import Ui_MainWindow
 
@@ -20,19 +45,27 @@ class MainWindow(QMainWindow):
     def __init__(self):
         QMainWindow.__init__(self)
 
+        # APP THEME - SELECTED BEFORE ANY WIDGET EXISTS SO NOTHING IS POLISHED TWICE
+        applyTheme(self)
+
         # QT DESIGNER USER INTERFACE CONVERTED TO PYTHON
         self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
+        with tracing.span("Ui_MainWindow.setupUi"):
+            self.ui.setupUi(self)
+        tracing.traceFirstPaint(self.ui.styleSheet)
 
         # INITIALISE COMPONENTS
         self.MAXIMISED_WINDOW = False       
+        self.selectedMenuItem = None
+        self.transactionStore = None
+        self.transactionPages = None
         self.initialiseTitleBar()
         self.initialiseTitleRightInfo()
         self.initialiseGrips()
         self.initialiseDropShadowEffect()
-
-        # TABLEWIDGET PARAMETERS
-        self.ui.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.initialisePages()
+        self.initialisePanelAnimations()
+        self.initialiseExport()
         
         # SET STANDARD WINDOW BUTTON ACTIONS - MINIMIZE, MAXIMIZE/RESTORE & CLOSE
         self.ui.minimizeAppBtn.clicked.connect(self.showMinimized)
@@ -43,21 +76,26 @@ class MainWindow(QMainWindow):
         self.ui.toggleButton.clicked.connect(self.toggleMenu)
         self.ui.btn_home.clicked.connect(self.menuButtonClick)
         self.ui.btn_widgets.clicked.connect(self.menuButtonClick)
+        self.ui.btn_holdings.clicked.connect(self.menuButtonClick)
         self.ui.btn_new.clicked.connect(self.menuButtonClick)
         self.ui.btn_save.clicked.connect(self.menuButtonClick)
 
         # SET BOX PANEL TOGGLE BUTTON ACTIONS (LEFT & RIGHT)
         self.ui.toggleLeftBox.clicked.connect(self.toggleLeftBox)
-        self.ui.extraCloseColumnBtn.clicked.connect(self.toggleLeftBox)
         self.ui.settingsTopBtn.clicked.connect(self.toggleRightBox)
         
         # SET TO HOME PAGE
-        self.ui.stackedWidget.setCurrentWidget(self.ui.home)
-        self.ui.btn_home.setStyleSheet(self.highlightMenuItem(self.ui.btn_home.styleSheet()))        
+        self.pages.show("home")
+        self.selectMenuItem(self.ui.btn_home)
         self.show()        
+
+        # BUILD THE OTHER PAGES IN THE BACKGROUND ONCE THE WINDOW HAS BEEN PAINTED
+        if Settings.PAGE_PREBUILD_DELAY is not None:
+            self.pages.prebuildWhenIdle(Settings.PAGE_PREBUILD_DELAY)
          
     ## CLASS METHODS ==> INITIALISATION
     ######################################################################## 
+    @tracing.traced()
     def initialiseTitleBar(self):
         self.setWindowTitle(Settings.TITLE) 
         if Settings.ENABLE_CUSTOM_TITLE_BAR:
@@ -65,11 +103,20 @@ class MainWindow(QMainWindow):
             self.setWindowFlags(Qt.FramelessWindowHint)
             self.setAttribute(Qt.WA_TranslucentBackground)            
          
+    @tracing.traced()
     def initialiseTitleRightInfo(self):
         self.ui.titleRightInfo.setText(Settings.DESCRIPTION)
         self.ui.titleRightInfo.mouseDoubleClickEvent = self.doubleClickMaximizeRestore
         self.ui.titleRightInfo.mouseMoveEvent = self.moveWindow
+
+        # FALLBACK WINDOW MOVE - THE LATEST POSITION IS APPLIED ONCE PER DISPLAY FRAME
+        self.systemMoveSupported = Settings.ENABLE_SYSTEM_MOVE
+        self.pendingMove = None
+        self.moveTimer = QTimer(self)
+        self.moveTimer.setSingleShot(True)
+        self.moveTimer.timeout.connect(self.applyPendingMove)
         
+    @tracing.traced()
     def initialiseGrips(self):
         
         if Settings.ENABLE_CUSTOM_TITLE_BAR:
@@ -91,7 +138,11 @@ class MainWindow(QMainWindow):
         self.sizegrip = QSizeGrip(self.ui.frame_size_grip)
         self.sizegrip.setStyleSheet("width: 20px; height: 20px; margin 0px; padding: 0px;") 
         
+    @tracing.traced()
     def initialiseDropShadowEffect(self):    
+        if Settings.WINDOW_SHADOW == "nineslice":
+            self.shadow = WindowShadow(self.ui.bgApp, 17, QColor(0, 0, 0, 150))
+            return
         self.shadow = QGraphicsDropShadowEffect(self)
         self.shadow.setBlurRadius(17)
         self.shadow.setXOffset(0)
@@ -99,17 +150,450 @@ class MainWindow(QMainWindow):
         self.shadow.setColor(QColor(0, 0, 0, 150))
         self.ui.bgApp.setGraphicsEffect(self.shadow)
         
+    @tracing.traced()
+    def initialisePages(self):
+        # PAGES AND SIDE PANELS ARE ONLY BUILT WHEN FIRST NEEDED
+        self.pages = PageRegistry(self.ui.stackedWidget, self)
+        self.pages.register("home", self.ui.setupHomePage, self.ui.btn_home)
+        self.pages.register("widgets", self.buildWidgetsPage, self.ui.btn_widgets)
+        self.pages.register("holdings", self.buildHoldingsPage, self.ui.btn_holdings)
+        self.pages.register("new_page", self.buildImportPage, self.ui.btn_new)
+        self.pages.register("extraLeftBox", self.buildExtraLeftBox, inStack=False)
+        self.pages.register("extraRightBox", self.ui.setupExtraRightBox, inStack=False)
+
+    def initialisePanelAnimations(self):
+        # SNAPSHOT ANIMATORS FOR THE bgApp ROW (MENU, LEFT BOX, CONTENT) AND THE content
+        # ROW (PAGES, RIGHT BOX)
+        self.rowAnimator = PanelAnimator(self.ui.bgApp, Settings.TIME_ANIMATION)
+        self.contentAnimator = PanelAnimator(self.ui.content, Settings.TIME_ANIMATION)
+
+        # LAYOUT ANIMATIONS - CREATED ONCE AND REUSED FOR EVERY TOGGLE
+        self.animation = QPropertyAnimation(self.ui.leftMenuBg, b"minimumWidth", self)
+        self.left_box = QPropertyAnimation(self.ui.extraLeftBox, b"minimumWidth", self)
+        self.right_box = QPropertyAnimation(self.ui.extraRightBox, b"minimumWidth", self)
+        for animation in (self.animation, self.left_box, self.right_box):
+            animation.setDuration(Settings.TIME_ANIMATION)
+            animation.setEasingCurve(QEasingCurve.InOutQuart)
+        self.group = QParallelAnimationGroup(self)
+        self.group.addAnimation(self.left_box)
+        self.group.addAnimation(self.right_box)
+
+    def initialiseExport(self):
+        # COPY / EXPORT AND IMPORT - ONE OF EACH AT A TIME, SHOWN IN THE BOTTOM BAR WHILE IT RUNS
+        self.exportRunner = None
+        self.importRunner = None
+        self.importedFiles = []
+        self.clipboardPath = None
+        self.shareMenu = None
+        self.copyShortcut = None
+
+        # THE TWO SHARE THE BOTTOM BAR - CANCEL STOPS WHICHEVER IS RUNNING, THE OTHER CANNOT START
+        self.ui.exportCancelBtn.clicked.connect(self.cancelTransfer)
+        QCoreApplication.instance().aboutToQuit.connect(self.releaseClipboard)
+        self.exportMessageTimer = QTimer(self)
+        self.exportMessageTimer.setSingleShot(True)
+        self.exportMessageTimer.timeout.connect(lambda: self.showExportStatus(""))
+        self.showExportStatus("")
+
+    ## CLASS METHODS ==> PAGE FACTORIES
+    ########################################################################
+    def buildWidgetsPage(self):
+        page = self.ui.setupWidgetsPage()
+
+        # ONE COPY OF THE TRANSACTIONS - THE TABLE, SEARCH, GAINS, TOTALS AND HOLDINGS ALL
+        # FOLLOW ITS CHANGE SETS
+        self.portfolio = PortfolioModel(TransactionColumns(), self)
+
+        # TRANSACTION TABLE - COLUMN ARRAYS BEHIND A MODEL, EVERY ROW THE SAME HEIGHT SO THE
+        # VIEW NEVER MEASURES ROWS
+        self.transactionModel = TransactionTableModel(self.portfolio, self)
+        self.transactionProxy = TransactionProxyModel(self)
+        self.transactionProxy.setSourceModel(self.transactionModel)
+        self.ui.transactionTable.setModel(self.transactionProxy)
+        self.ui.transactionTable.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        # MONEY AND QUANTITY CELLS - CACHED TEXT PAINTED WITH THE PALETTE, DECIMAL POINTS ALIGNED
+        self.numericDelegates = {}
+        for column, (field, scale, minPlaces) in TransactionTableModel.NUMERIC.items():
+            delegate = NumericDelegate(scale, minPlaces, self.ui.transactionTable)
+            self.ui.transactionTable.setItemDelegateForColumn(column, delegate)
+            self.numericDelegates[column] = delegate
+
+        # COLUMN WIDTHS - MEASURED ON A BOUNDED SAMPLE, NEVER OVER EVERY ROW
+        self.columnSizer = None
+        if Settings.COLUMN_SIZING == "sampled":
+            self.columnSizer = ColumnSizer(self.ui.transactionTable)
+            self.columnSizer.setModel(self.transactionProxy)
+        else:
+            self.ui.transactionTable.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        # SEARCH BOX - THE WORDS ARE LOOKED UP IN THE TRIGRAM INDEX ON THE THREAD POOL (WHERE
+        # THE INDEX IS BUILT TOO) AND THE MATCHING ROWS HANDED TO THE PROXY. KEYSTROKES LESS
+        # THAN Settings.SEARCH_DELAY APART ARE SEARCHED ONCE
+        self.searchIndex = TransactionSearchIndex(self.portfolio, self)
+        self.searchIndex.changed.connect(self.applySearch)
+        self.searchIndex.found.connect(self.showSearch)
+        self.searchTimer = QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.timeout.connect(self.applySearch)
+        self.ui.lineEdit.textChanged.connect(lambda text: self.searchTimer.start(Settings.SEARCH_DELAY))
+
+        # GAINS - ONE MATCHING RUN ON THE THREAD POOL AFTER EACH CHANGE, SHARED BY THE TOTALS
+        # FOOTER AND THE HOLDINGS PAGE
+        self.gainsMatcher = GainsMatcher(self.portfolio, self)
+
+        # TOTALS FOOTER - KEPT UP TO DATE FROM THE ROWS THAT CHANGED, NOT RE-SUMMED
+        self.transactionTotals = TransactionTotals(self.transactionProxy, self.gainsMatcher, self)
+        self.transactionTotals.changed.connect(self.showTotals)
+
+        # CTRL+C COPIES THE SELECTED ROWS THROUGH THE STREAMING EXPORT, NOT ONE CELL'S TEXT
+        self.copyShortcut = QShortcut(QKeySequence.Copy, self.ui.transactionTable)
+        self.copyShortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        self.copyShortcut.activated.connect(self.copyRows)
+
+        # HEADER CLICKS SORT THROUGH THE PROXY'S CACHED PERMUTATIONS - START IN IMPORT ORDER
+        self.ui.transactionTable.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.ui.transactionTable.setSortingEnabled(True)
+        if self.transactionPages is not None:
+            self.showTransactionPages()
+        return page
+
+    # HOLDINGS TREE - SHOWS THE TRANSACTION TABLE'S GAINS MATCHING, SO THE WIDGETS PAGE (WHICH
+    # OWNS IT) IS BUILT FIRST
+    def buildHoldingsPage(self):
+        self.pages.page("widgets")
+        page = self.ui.setupHoldingsPage()
+        self.holdingsModel = HoldingsTreeModel(self.gainsMatcher, self)
+        self.ui.holdingsTree.setModel(self.holdingsModel)
+        header = self.ui.holdingsTree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        return page
+
+    # IMPORT PAGE - ADDS TO THE TRANSACTION TABLE, SO THE WIDGETS PAGE IS BUILT FIRST
+    def buildImportPage(self):
+        self.pages.page("widgets")
+        page = self.ui.setupNewPage()
+        self.ui.btn_import_open.clicked.connect(self.chooseImportFiles)
+        self.portfolio.changed.connect(self.forgetImportedFiles)
+        self.updateTransferButtons()
+        return page
+
+    # FILTER THE TABLE TO THE SEARCH BOX - UNTIL THE INDEX IS BUILT THE TABLE STAYS AS IT IS
+    # AND changed APPLIES THE SEARCH WHEN IT IS READY
+    def applySearch(self):
+        query = self.ui.lineEdit.text().strip()
+        if not query:
+            self.transactionProxy.clearFilter("search")
+            return
+        self.searchIndex.searchLater(query)
+
+    # ROWS FOUND ON THE THREAD POOL - UNLESS THE BOX HAS MOVED ON SINCE
+    def showSearch(self, query, rows):
+        if query == self.ui.lineEdit.text().strip():
+            self.transactionProxy.setRowFilter("search", rows)
+
+    # ALLOWABLE COST AND GAIN SHOW "matching" UNTIL THE MATCHING HAS CAUGHT UP WITH THE ROWS
+    def showTotals(self):
+        totals = self.transactionTotals
+        self.ui.labelTotalCount.setText(f"{totals.count:,} transactions")
+        self.ui.labelTotalProceeds.setText(f"Proceeds {formatFixed(totals.proceeds, MONEY_SCALE)}")
+        if totals.costs is None:
+            self.ui.labelTotalCost.setText("Allowable cost matching...")
+            self.ui.labelTotalGain.setText("Net gain matching...")
+        else:
+            self.ui.labelTotalCost.setText(f"Allowable cost {formatFixed(totals.costs, MONEY_SCALE)}")
+            self.ui.labelTotalGain.setText(f"Net gain {formatFixed(totals.gain(), MONEY_SCALE)}")
+
+    ## CLASS METHODS ==> TRANSACTION STORE
+    ########################################################################
+    # SHOW AN ON-DISK HISTORY - ROWS ARE PAGED IN AS THE TABLE SCROLLS, NOTHING IS READ UP FRONT
+    def openTransactionStore(self, store):
+        self.transactionStore = store
+        self.transactionPages = PagedTransactionModel(store, self)
+        if self.pages.isBuilt("widgets"):
+            self.showTransactionPages()
+
+    def showTransactionPages(self):
+        # SORTING, FILTERING, SEARCH AND TOTALS NEED EVERY ROW IN MEMORY - THE PAGED TABLE STAYS
+        # IN STORE ORDER
+        self.ui.transactionTable.setSortingEnabled(False)
+        self.ui.transactionTable.setModel(self.transactionPages)
+        self.ui.row_4.hide()
+        if self.columnSizer is not None:
+            self.columnSizer.setModel(self.transactionPages)
+
+    def buildExtraLeftBox(self):
+        box = self.ui.setupExtraLeftBox()
+        self.ui.extraCloseColumnBtn.clicked.connect(self.toggleLeftBox)
+        self.ui.btn_share.clicked.connect(self.showShareMenu)
+        self.updateTransferButtons()
+        return box
+
+    ## CLASS METHODS ==> COPY AND EXPORT
+    ########################################################################
+    def showShareMenu(self):
+        if self.shareMenu is None:
+            self.shareMenu = QMenu(self)
+            self.shareMenu.addAction("Copy rows", self.copyRows)
+            self.shareMenu.addAction("Export rows to CSV...", self.exportRowsToFile)
+        button = self.ui.btn_share
+        self.shareMenu.popup(button.mapToGlobal(QPoint(0, button.height())))
+
+    # THE SELECTED ROWS IN THE ORDER SHOWN, OR EVERY ROW SHOWN IF NONE ARE SELECTED, AS
+    # (CHUNKS, COUNT). ROWS COME FROM THE SELECTION RANGES - NO QModelIndex PER ROW
+    def rowsToExport(self):
+        self.pages.page("widgets")
+        table = self.ui.transactionTable
+        ranges = sorted((selected.top(), selected.bottom() + 1) for selected in table.selectionModel().selection())
+        if not ranges:
+            rows = range(table.model().rowCount())
+        elif len(ranges) == 1:
+            rows = range(*ranges[0])
+        else:
+            # RANGES IN ORDER, EACH CLIPPED TO WHERE THE ONE BEFORE ENDED IN CASE THEY OVERLAP
+            rows, end = array("I"), 0
+            for top, bottom in ranges:
+                rows.extend(range(max(top, end), bottom))
+                end = max(end, bottom)
+
+        chunkRows = Settings.EXPORT_CHUNK_ROWS
+        if table.model() is self.transactionPages:
+            return storeChunks(self.transactionStore, rows, chunkRows), len(rows)
+        order = self.transactionProxy.order
+        if order is not None:
+            rows = order[rows.start:rows.stop] if isinstance(rows, range) else array("I", map(order.__getitem__, rows))
+        return columnChunks(self.transactionModel.columns, rows, chunkRows), len(rows)
+
+    def copyRows(self):
+        # EACH COPY GETS ITS OWN FILE - THE CLIPBOARD MAY STILL BE READING THE LAST ONE
+        handle, path = tempfile.mkstemp(prefix="daisycat-rows-", suffix=".csv")
+        os.close(handle)
+        self.startExport(path, toClipboard=True)
+
+    def exportRowsToFile(self):
+        path, selectedFilter = QFileDialog.getSaveFileName(self, "Export rows", "transactions.csv",
+                                                           "CSV files (*.csv)")
+        if path:
+            self.startExport(path, toClipboard=False)
+
+    def startExport(self, path, toClipboard):
+        if self.importRunner is not None:
+            return
+        self.cancelExport()
+        chunks, total = self.rowsToExport()
+        runner = ExportRunner(chunks, total, path)
+        runner.toClipboard = toClipboard
+        runner.signals.progress.connect(self.exportProgress)
+        runner.signals.finished.connect(self.exportFinished)
+        runner.signals.failed.connect(self.exportFailed)
+        self.exportRunner = runner
+        self.updateTransferButtons()
+        self.exportMessageTimer.stop()
+        self.ui.exportProgress.setRange(0, max(total, 1))
+        self.ui.exportProgress.setValue(0)
+        self.showExportStatus(f"{'Copying' if toClipboard else 'Exporting'} {total:,} rows", running=True)
+        QThreadPool.globalInstance().start(runner)
+
+    def cancelExport(self):
+        if self.exportRunner is not None:
+            self.exportRunner.cancel()
+
+    def exportProgress(self, runner):
+        if runner is self.exportRunner:
+            self.ui.exportProgress.setValue(runner.written)
+
+    def exportFinished(self, runner):
+        if runner is not self.exportRunner or runner.cancelled:
+            if runner.toClipboard:
+                os.remove(runner.path)
+            if runner is self.exportRunner:
+                self.endExport()
+                self.showExportMessage("Cancelled")
+            return
+        self.endExport()
+        if runner.toClipboard:
+            self.replaceClipboardFile(runner.path)
+            QGuiApplication.clipboard().setMimeData(CsvFileMimeData(runner.path))
+            self.showExportMessage(f"Copied {runner.written:,} rows")
+        else:
+            self.showExportMessage(f"Exported {runner.written:,} rows")
+
+    def exportFailed(self, runner):
+        print(runner.error, file=sys.stderr)
+        if runner.toClipboard and os.path.exists(runner.path):
+            os.remove(runner.path)
+        if runner is self.exportRunner:
+            self.endExport()
+            self.showExportMessage("Export failed")
+
+    def endExport(self):
+        self.exportRunner = None
+        self.updateTransferButtons()
+
+    def replaceClipboardFile(self, path):
+        if self.clipboardPath is not None and os.path.exists(self.clipboardPath):
+            os.remove(self.clipboardPath)
+        self.clipboardPath = path
+
+    # THE CLIPBOARD CANNOT KEEP A PYTHON QMimeData PAST THE INTERPRETER - ROWS STILL ON IT AT
+    # EXIT ARE HANDED OVER AS PLAIN TEXT AND THEIR FILE REMOVED
+    def releaseClipboard(self):
+        clipboard = QGuiApplication.clipboard()
+        if isinstance(clipboard.mimeData(), CsvFileMimeData):
+            clipboard.setText(clipboard.text())
+        self.replaceClipboardFile(None)
+
+    def cancelTransfer(self):
+        self.cancelExport()
+        self.cancelImport()
+
+    # PAGES ARE BUILT LATE - A BUTTON NOT BUILT YET IS SET WHEN IT IS
+    def updateTransferButtons(self):
+        if hasattr(self.ui, "btn_share"):
+            self.ui.btn_share.setEnabled(self.importRunner is None)
+        if hasattr(self.ui, "btn_import_open"):
+            self.ui.btn_import_open.setEnabled(self.importRunner is None and self.exportRunner is None)
+        if self.copyShortcut is not None:
+            self.copyShortcut.setEnabled(self.importRunner is None)
+
+    def showExportStatus(self, text, running=False):
+        self.ui.exportLabel.setText(text)
+        self.ui.exportLabel.setVisible(bool(text))
+        self.ui.exportProgress.setVisible(running)
+        self.ui.exportCancelBtn.setVisible(running)
+
+    def showExportMessage(self, text):
+        self.showExportStatus(text)
+        self.exportMessageTimer.start(3000)
+
+    ## CLASS METHODS ==> IMPORT
+    ########################################################################
+    def chooseImportFiles(self):
+        paths, selectedFilter = QFileDialog.getOpenFileNames(self, "Import transactions", "",
+                                                             "CSV files (*.csv);;All files (*)")
+        if paths:
+            self.startImport(paths)
+
+    # BLOCKS ARE APPENDED TO THE PORTFOLIO AS THEY ARRIVE (OR BY THE WORKER STRAIGHT TO AN OPEN
+    # STORE) - GAINS MATCHING WAITS UNTIL THE LAST ONE
+    def startImport(self, paths):
+        if self.importRunner is not None or self.exportRunner is not None:
+            return
+        store = self.transactionStore
+        runner = ImportRunner(paths, Settings.IMPORT_CHUNK_BYTES, Settings.IMPORT_QUEUE_BLOCKS,
+                              Settings.IMPORT_REJECT_LIMIT, store, Settings.IMPORT_PROCESSES or os.cpu_count(),
+                              self.importIndex(store))
+        runner.firstRow = len(self.portfolio) if store is None else store.rowCount()
+        runner.signals.block.connect(self.importBlock)
+        runner.signals.progress.connect(self.importProgress)
+        runner.signals.finished.connect(self.importFinished)
+        runner.signals.failed.connect(self.importFailed)
+        self.importRunner = runner
+        if store is None:
+            self.gainsMatcher.hold()
+        self.updateTransferButtons()
+        self.exportMessageTimer.stop()
+
+        # KILOBYTES - A 2 GB FILE'S BYTE COUNT DOES NOT FIT THE BAR'S int
+        self.ui.exportProgress.setRange(0, max(runner.total >> 10, 1))
+        self.ui.exportProgress.setValue(0)
+        self.showExportStatus(f"Importing {len(paths)} file{'s' if len(paths) > 1 else ''}", running=True)
+        QThreadPool.globalInstance().start(runner)
+
+    # WHAT IS ALREADY HELD - THE STORE KEEPS IT WITH ITS ROWS, THE PORTFOLIO FOR THIS SESSION
+    def importIndex(self, store):
+        if store is not None:
+            return ImportIndex(store.importedFiles(), store.fingerprintCounts)
+        columns = self.portfolio.columns
+        return ImportIndex(self.importedFiles, lambda: fingerprintCounts(columns))
+
+    # ROWS TAKEN OUT OF THE PORTFOLIO - ITS FILES ARE NO LONGER ALL THERE, SO THEY ARE READ AGAIN
+    # (THEIR ROWS STILL HELD ARE LEFT OUT BY FINGERPRINT)
+    def forgetImportedFiles(self, change):
+        if change.kind == REMOVED or change.kind == RESET:
+            self.importedFiles = []
+
+    def cancelImport(self):
+        if self.importRunner is not None:
+            self.importRunner.cancel()
+
+    # BLOCKS STILL QUEUED WHEN THE IMPORT WAS CANCELLED ARE DROPPED
+    def importBlock(self, runner, block):
+        if runner is self.importRunner and not runner.cancelled:
+            self.portfolio.appendColumns(block)
+        runner.blockInserted()
+
+    def importProgress(self, runner):
+        if runner is not self.importRunner:
+            return
+        self.ui.exportProgress.setValue(runner.read >> 10)
+        if runner.processes > 1 and not runner.rows:
+            self.showExportStatus(f"Parsed {len(runner.formats)} of {len(runner.paths)} files", running=True)
+        else:
+            self.showExportStatus(f"Importing {runner.rows:,} rows", running=True)
+        if runner.store is not None:
+            self.transactionPages.refresh()
+
+    def importFinished(self, runner):
+        if runner is not self.importRunner:
+            return
+        self.endImport(runner)
+        if runner.cancelled:
+            self.rollBackImport(runner)
+            self.showExportMessage("Import cancelled")
+            self.logImport(runner, "cancelled - nothing imported")
+            return
+        if runner.store is None:
+            self.importedFiles.extend(runner.imported)
+        else:
+            runner.store.recordImports(runner.imported)
+        self.showExportMessage(f"Imported {runner.rows:,} rows" if runner.rows else "Nothing new to import")
+        result = f"{runner.rows:,} rows imported, {runner.duplicates:,} already held, {runner.rejected:,} rejected"
+        if runner.skipped:
+            result += f", {len(runner.skipped)} unchanged file{'s' if len(runner.skipped) > 1 else ''} skipped"
+        self.logImport(runner, result)
+
+    def importFailed(self, runner):
+        if runner is not self.importRunner:
+            return
+        print(runner.error, file=sys.stderr)
+        self.endImport(runner)
+        self.rollBackImport(runner)
+        self.showExportMessage("Import failed")
+        self.logImport(runner, "failed - nothing imported: " + runner.error.strip().splitlines()[-1])
+
+    def endImport(self, runner):
+        self.importRunner = None
+        self.updateTransferButtons()
+        if runner.store is None:
+            self.gainsMatcher.release()
+
+    # A CANCELLED OR FAILED IMPORT TAKES AWAY EVERY ROW IT ADDED - THE FILES IMPORTED BEFORE IT
+    # ARE STILL ALL THERE, SO THE REMOVAL DOES NOT FORGET THEM
+    def rollBackImport(self, runner):
+        if runner.store is None:
+            importedFiles = self.importedFiles
+            self.portfolio.removeRows(runner.firstRow, len(self.portfolio))
+            self.importedFiles = importedFiles
+        else:
+            runner.store.truncate(runner.firstRow)
+            self.transactionPages.reload()
+
+    def logImport(self, runner, result):
+        names = ", ".join(f"{os.path.basename(path)} ({runner.formats[path]})" if path in runner.formats
+                          else os.path.basename(path) for path in runner.paths)
+        lines = [f"{names}: {result}"]
+        lines.extend(f"    {os.path.basename(path)} line {line}: {reason}" for path, line, reason in runner.rejects)
+        if runner.rejected > len(runner.rejects):
+            lines.append(f"    ... and {runner.rejected - len(runner.rejects):,} more rejected rows")
+        self.ui.importLog.appendPlainText("\n".join(lines))
+        
     ## CLASS METHODS ==> MOUSE CLICK EVENTS
     ########################################################################
     def mousePressEvent(self, event):
         # SET DRAG POS WINDOW
         self.dragPos = event.globalPos()
-
-        # PRINT MOUSE EVENTS
-        if event.buttons() == Qt.LeftButton:
-            print('Mouse click: LEFT CLICK')
-        if event.buttons() == Qt.RightButton:
-            print('Mouse click: RIGHT CLICK')
         # TODO Actions still to be set up    
             
     ## CLASS METHODS ==> MENU (LEFT)
@@ -119,20 +603,11 @@ class MainWindow(QMainWindow):
         btn = self.sender()
         btnName = btn.objectName()
 
-        # SHOW HOME PAGE
-        if btnName == "btn_home":
-            self.ui.stackedWidget.setCurrentWidget(self.ui.home) # SET PAGE
-            btn.setStyleSheet(self.highlightMenuItem(btn.styleSheet())) # RESET MENU BACKGROUNDS
-
-        # SHOW WIDGETS PAGE
-        if btnName == "btn_widgets":
-            self.ui.stackedWidget.setCurrentWidget(self.ui.widgets)
-            btn.setStyleSheet(self.highlightMenuItem(btn.styleSheet()))
-
-        # SHOW NEW PAGE
-        if btnName == "btn_new":
-            self.ui.stackedWidget.setCurrentWidget(self.ui.new_page)
-            btn.setStyleSheet(self.highlightMenuItem(btn.styleSheet()))
+        # SHOW THE PAGE REGISTERED FOR THE BUTTON (BUILT ON FIRST VISIT)
+        pageName = self.pages.nameForButton(btn)
+        if pageName is not None:
+            self.pages.show(pageName) # SET PAGE
+            self.selectMenuItem(btn) # MOVE THE MENU HIGHLIGHT
 
         if btnName == "btn_save":
             print("Save BTN clicked!")
@@ -154,71 +629,77 @@ class MainWindow(QMainWindow):
             widthExtended = standard
 
         # ANIMATION
-        self.animation = QPropertyAnimation(self.ui.leftMenuBg, b"minimumWidth")
-        self.animation.setDuration(Settings.TIME_ANIMATION)
+        if Settings.ANIMATION_MODE == "snapshot":
+            self.rowAnimator.animate({self.ui.leftMenuBg: widthExtended})
+            return
+        self.animation.stop()
         self.animation.setStartValue(width)
         self.animation.setEndValue(widthExtended)
-        self.animation.setEasingCurve(QEasingCurve.InOutQuart)
         self.animation.start()
 
-    def highlightMenuItem(self, getStyle):
-        # RESET BACKGROUND FOR ALL MENU ITEMS        
-        for w in self.ui.topMenu.findChildren(QPushButton):
-            deselect = w.styleSheet().replace(Settings.MENU_SELECTED_STYLESHEET, "")
-            w.setStyleSheet(deselect)
-        # GET THE STYLESHEET FOR THE SELECTED BUTTON                    
-        select = getStyle + Settings.MENU_SELECTED_STYLESHEET
-        return select
+    def selectMenuItem(self, button):
+        # ONLY THE PREVIOUS AND THE NEW MENU ITEM ARE RESTYLED
+        if button is self.selectedMenuItem:
+            return
+        if self.selectedMenuItem is not None:
+            self.setSelected(self.selectedMenuItem, False)
+        self.setSelected(button, True)
+        self.selectedMenuItem = button
+
+    # SELECTED BUTTONS ARE STYLED BY THE [selected="true"] RULES IN THE STYLESHEET - CHANGING
+    # THE PROPERTY RE-POLISHES THE ONE WIDGET WITHOUT PARSING ANY STYLESHEET AGAIN
+    def setSelected(self, widget, selected):
+        if bool(widget.property("selected")) == selected:
+            return
+        widget.setProperty("selected", selected)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        widget.update()
        
     ## CLASS METHODS ==> BOX PANEL TOGGLES (LEFT & RIGHT)
     ########################################################################
     def toggleLeftBox(self):
+        self.pages.page("extraLeftBox")
+
         # GET WIDTH
         width = self.ui.extraLeftBox.width()
         widthRightBox = self.ui.extraRightBox.width()
         maxExtend = Settings.LEFT_BOX_WIDTH
-        color = Settings.BTN_LEFT_BOX_COLOR
         standard = 0
 
-        # GET BTN STYLE
-        style = self.ui.toggleLeftBox.styleSheet()
-
         # SET MAX WIDTH
         if width == 0:
             widthExtended = maxExtend
             # SELECT BTN
-            self.ui.toggleLeftBox.setStyleSheet(style + color)
+            self.setSelected(self.ui.toggleLeftBox, True)
             if widthRightBox != 0:
-                style = self.ui.settingsTopBtn.styleSheet()
-                self.ui.settingsTopBtn.setStyleSheet(style.replace(Settings.BTN_RIGHT_BOX_COLOR, ''))
+                self.setSelected(self.ui.settingsTopBtn, False)
         else:
             widthExtended = standard
             # RESET BTN
-            self.ui.toggleLeftBox.setStyleSheet(style.replace(color, ''))
+            self.setSelected(self.ui.toggleLeftBox, False)
                 
         self.boxAnimation(width, widthRightBox, "left")
 
     def toggleRightBox(self):
+        self.pages.page("extraRightBox")
+
         # GET WIDTH
         width = self.ui.extraRightBox.width()
         widthLeftBox = self.ui.extraLeftBox.width()
         maxExtend = Settings.RIGHT_BOX_WIDTH
-        color = Settings.BTN_RIGHT_BOX_COLOR
         standard = 0
-        # GET BTN STYLE
-        style = self.ui.settingsTopBtn.styleSheet()
         # SET MAX WIDTH
         if width == 0:
             widthExtended = maxExtend
             # SELECT BTN
-            self.ui.settingsTopBtn.setStyleSheet(style + color)
+            self.setSelected(self.ui.settingsTopBtn, True)
             if widthLeftBox != 0:
-                style = self.ui.toggleLeftBox.styleSheet()
-                self.ui.toggleLeftBox.setStyleSheet(style.replace(Settings.BTN_LEFT_BOX_COLOR, ''))
+                self.setSelected(self.ui.toggleLeftBox, False)
         else:
             widthExtended = standard
             # RESET BTN
-            self.ui.settingsTopBtn.setStyleSheet(style.replace(color, ''))
+            self.setSelected(self.ui.settingsTopBtn, False)
 
         self.boxAnimation(widthLeftBox, width, "right")
 
@@ -237,24 +718,25 @@ class MainWindow(QMainWindow):
         else:
             right_width = 0       
 
+        # SNAPSHOT ANIMATION - ONLY THE RIGHT BOX MOVING STAYS INSIDE THE content ROW
+        if Settings.ANIMATION_MODE == "snapshot":
+            widths = {self.ui.extraLeftBox: left_width, self.ui.extraRightBox: right_width}
+            if left_box_width == left_width:
+                self.contentAnimator.animate(widths)
+            else:
+                self.rowAnimator.animate(widths)
+            return
+
         # ANIMATION LEFT BOX        
-        self.left_box = QPropertyAnimation(self.ui.extraLeftBox, b"minimumWidth")
-        self.left_box.setDuration(Settings.TIME_ANIMATION)
+        self.group.stop()
         self.left_box.setStartValue(left_box_width)
         self.left_box.setEndValue(left_width)
-        self.left_box.setEasingCurve(QEasingCurve.InOutQuart)
 
         # ANIMATION RIGHT BOX        
-        self.right_box = QPropertyAnimation(self.ui.extraRightBox, b"minimumWidth")
-        self.right_box.setDuration(Settings.TIME_ANIMATION)
         self.right_box.setStartValue(right_box_width)
         self.right_box.setEndValue(right_width)
-        self.right_box.setEasingCurve(QEasingCurve.InOutQuart)
 
         # GROUP ANIMATION
-        self.group = QParallelAnimationGroup()
-        self.group.addAnimation(self.left_box)
-        self.group.addAnimation(self.right_box)
         self.group.start()
 
     ## CLASS METHODS ==> MOVE OR RESIZE WINDOW
@@ -264,11 +746,32 @@ class MainWindow(QMainWindow):
             # IF MAXIMIZED CHANGE TO NORMAL
             if self.MAXIMISED_WINDOW:
                 self.maximizeRestore()
+            if event.buttons() != Qt.LeftButton:
+                return
+
+            # LET THE WINDOW MANAGER MOVE THE WINDOW - THE DRAG THEN NO LONGER DEPENDS ON
+            # HOW BUSY THE GUI THREAD IS
+            if self.systemMoveSupported and self.pendingMove is None:
+                handle = self.windowHandle()
+                if handle is not None and handle.startSystemMove():
+                    event.accept()
+                    return
+                self.systemMoveSupported = False
+
             # MOVE WINDOW
-            if event.buttons() == Qt.LeftButton:
-                self.move(self.pos() + event.globalPos() - self.dragPos)
-                self.dragPos = event.globalPos()
-                event.accept()  
+            if self.pendingMove is None:
+                self.pendingMove = self.pos()
+            self.pendingMove += event.globalPos() - self.dragPos
+            self.dragPos = event.globalPos()
+            if not self.moveTimer.isActive():
+                rate = self.screen().refreshRate() if self.screen() is not None else 60.0
+                self.moveTimer.start(max(int(1000 / max(rate, 1.0)), 1))
+            event.accept()  
+
+    def applyPendingMove(self):
+        if self.pendingMove is not None:
+            self.move(self.pendingMove)
+            self.pendingMove = None
                 
     def resizeEvent(self, event):        
         def resize_grips():
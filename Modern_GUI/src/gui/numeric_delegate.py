@@ -0,0 +1,106 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Numeric delegate - money and quantity cells painted from cached text
+##
+## THE DEFAULT DELEGATE FORMATS, LAYS OUT AND STYLES EVERY CELL THROUGH THE STYLESHEET
+## ON EVERY PAINT. THIS ONE ASKS THE MODEL FOR THE STORED FIXED-POINT INTEGER, KEEPS A
+## PREPARED QStaticText PER VALUE (LEAST RECENTLY USED DROPPED PAST cacheSize) AND
+## PAINTS IT WITH THE VIEW'S PALETTE - THE THEME SETS selection-background-color AND
+## selection-color ON QTableView FOR IT. DECIMAL POINTS LINE UP DOWN THE COLUMN
+##
+################################################################################
+
+from collections import OrderedDict
+
+from PySide6.QtCore import QPointF, Qt
+from PySide6.QtGui import QFont, QFontMetricsF, QPalette, QStaticText, QTransform
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from src.models.transaction_columns import formatFixed
+from src.models.transaction_model import TransactionTableModel
+
+
+class NumericDelegate(QStyledItemDelegate):
+    def __init__(self, scale, minPlaces=2, parent=None, padding=5, negativeColor=None, cacheSize=4096):
+        super().__init__(parent)
+        self.scale = scale
+        self.minPlaces = minPlaces
+        self.padding = padding              # ::item padding-left / padding-right OF THE THEMES
+        self.negativeColor = negativeColor  # E.G. LOSSES, None PAINTS THEM LIKE ANY OTHER VALUE
+        self.cacheSize = cacheSize
+
+        # VALUE -> (QStaticText, WIDTH, WIDTH FROM THE DECIMAL POINT ON) FOR self.font
+        self.cache = OrderedDict()
+        self.font = None
+        self.metrics = None
+        self.fractionWidths = {}            # DECIMAL PLACES -> WIDTH OF ".000..."
+
+    ## CLASS METHODS ==> CACHE
+    ########################################################################
+    def setFont(self, font):
+        # A COPY - option.font BELONGS TO THE STYLE OPTION, WHICH ONLY LIVES FOR ONE paint()
+        self.font = QFont(font)
+        self.metrics = QFontMetricsF(font)
+        self.cache.clear()
+        self.fractionWidths.clear()
+
+    def entry(self, value):
+        entry = self.cache.get(value)
+        if entry is not None:
+            self.cache.move_to_end(value)
+            return entry
+
+        text = formatFixed(value, self.scale, self.minPlaces)
+        staticText = QStaticText(text)
+        staticText.setTextFormat(Qt.PlainText)
+        staticText.prepare(QTransform(), self.font)
+        point = text.find(".")
+        fraction = self.metrics.horizontalAdvance(text[point:]) if point >= 0 else 0.0
+        entry = (staticText, self.metrics.horizontalAdvance(text), fraction)
+        self.cache[value] = entry
+        if len(self.cache) > self.cacheSize:
+            self.cache.popitem(last=False)
+        return entry
+
+    def fractionWidth(self, places):
+        width = self.fractionWidths.get(places)
+        if width is None:
+            width = self.metrics.horizontalAdvance("." + "0" * places) if places else 0.0
+            self.fractionWidths[places] = width
+        return width
+
+    ## CLASS METHODS ==> PAINT
+    ########################################################################
+    def paint(self, painter, option, index):
+        value = index.data(TransactionTableModel.RawValueRole)
+        if value is None:
+            # A PAGED BLOCK NOT READ YET, OR NOT A NUMERIC COLUMN
+            super().paint(painter, option, index)
+            return
+        if self.font is None or option.font != self.font:
+            self.setFont(option.font)
+
+        # THE PEN IS THE CELL'S OWN - THE VIEW'S PAINTER GOES BACK AS IT CAME
+        painter.save()
+        rect = option.rect
+        selected = option.state & QStyle.State_Selected
+        if selected:
+            painter.fillRect(rect, option.palette.brush(QPalette.Highlight))
+
+        staticText, width, fraction = self.entry(value)
+        model = index.model()
+        places = model.decimalPlaces(index.column()) if hasattr(model, "decimalPlaces") else self.minPlaces
+
+        # DECIMAL POINTS ON ONE LINE, UNLESS A VALUE HAS MORE PLACES THAN THE MODEL REPORTED
+        right = rect.right() + 1 - self.padding
+        x = right - self.fractionWidth(places) - (width - fraction)
+        x = min(x, right - width)
+        y = rect.top() + (rect.height() - self.metrics.height()) / 2
+
+        if value < 0 and self.negativeColor is not None:
+            painter.setPen(self.negativeColor)
+        else:
+            painter.setPen(option.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        painter.drawStaticText(QPointF(x, y), staticText)
+        painter.restore()
@@ -0,0 +1,71 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Page registry - stackedWidget pages and side panels built on demand
+##
+################################################################################
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src import tracing
+
+
+class PageRegistry(QObject):
+    pageBuilt = Signal(str, object)
+
+    def __init__(self, stackedWidget, parent=None):
+        super().__init__(parent)
+        self.stackedWidget = stackedWidget
+        self.factories = {}
+        self.inStack = {}
+        self.buttons = {}
+        self.pages = {}
+        self.prebuildQueue = []
+
+    ## CLASS METHODS ==> REGISTRATION
+    ########################################################################
+    # factory() BUILDS AND RETURNS THE PAGE WIDGET. PAGES GO INTO THE stackedWidget,
+    # PANELS (inStack=False) ARE PLACED IN THEIR OWN LAYOUT BY THE FACTORY
+    def register(self, name, factory, button=None, inStack=True):
+        self.factories[name] = factory
+        self.inStack[name] = inStack
+        if button is not None:
+            self.buttons[button.objectName()] = name
+
+    def nameForButton(self, button):
+        return self.buttons.get(button.objectName())
+
+    def isBuilt(self, name):
+        return name in self.pages
+
+    ## CLASS METHODS ==> BUILD AND SHOW
+    ########################################################################
+    def page(self, name):
+        if name not in self.pages:
+            with tracing.span(f"build page: {name}"):
+                widget = self.factories[name]()
+            if self.inStack[name]:
+                self.stackedWidget.addWidget(widget)
+            self.pages[name] = widget
+            self.pageBuilt.emit(name, widget)
+        return self.pages[name]
+
+    def show(self, name):
+        page = self.page(name)
+        self.stackedWidget.setCurrentWidget(page)
+        return page
+
+    # BUILD THE REMAINING PAGES ONE PER EVENT LOOP PASS, SO INPUT IS NEVER BLOCKED FOR
+    # LONGER THAN A SINGLE PAGE BUILD
+    def prebuildWhenIdle(self, delay=0):
+        self.prebuildQueue = [name for name in self.factories if name not in self.pages]
+        QTimer.singleShot(delay, self.prebuildNext)
+
+    def prebuildNext(self):
+        while self.prebuildQueue:
+            name = self.prebuildQueue.pop(0)
+            if name not in self.pages:
+                self.page(name)
+                break
+        if self.prebuildQueue:
+            QTimer.singleShot(0, self.prebuildNext)
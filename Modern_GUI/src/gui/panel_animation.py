@@ -0,0 +1,111 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Panel animation - slides snapshots of a row of panels instead of
+##          relaying out the content every frame
+##
+################################################################################
+
+from PySide6.QtCore import QCoreApplication, QEasingCurve, QRectF, Qt, QVariantAnimation
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QWidget
+
+
+# OVERLAY ON A ROW OF PANELS (A WIDGET WITH A QHBoxLayout, e.g. bgApp OR content)
+# animate() GRABS THE ROW, APPLIES THE NEW PANEL WIDTHS WITH ONE RELAYOUT AND GRABS IT
+# AGAIN. WHILE THE ANIMATION RUNS THE OVERLAY COVERS THE ROW AND DRAWS EACH PANEL AS A
+# STRIP OF ONE OF THE TWO SNAPSHOTS, SO A FRAME COSTS A FEW PIXMAP BLITS WHATEVER IS
+# OPEN ON THE PAGES BELOW
+# ///////////////////////////////////////////////////////////////
+class PanelAnimator(QWidget):
+    def __init__(self, row, duration, easing=QEasingCurve.InOutQuart):
+        super().__init__(row)
+        self.row = row
+        self.strips = []
+        self.before = None
+        self.after = None
+        self.progress = 0.0
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.hide()
+
+        # ONE ANIMATION, REUSED FOR EVERY TOGGLE
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.setDuration(duration)
+        self.animation.setEasingCurve(easing)
+        self.animation.valueChanged.connect(self.setProgress)
+        self.animation.finished.connect(self.finish)
+
+    def isRunning(self):
+        return self.animation.state() == QVariantAnimation.Running
+
+    ## CLASS METHODS ==> ANIMATE
+    ########################################################################
+    # widths: {PANEL: FINAL MINIMUM WIDTH}. THE PANELS MAY SIT ANYWHERE INSIDE THE ROW
+    def animate(self, widths):
+        if self.isRunning():
+            self.animation.stop()
+            self.finish()
+
+        layout = self.row.layout()
+        panels = [layout.itemAt(i).widget() for i in range(layout.count())]
+        panels = [panel for panel in panels if panel is not None and not panel.isHidden()]
+        start = [(panel.x(), panel.width()) for panel in panels]
+        before = self.row.grab() if self.row.isVisible() else None
+
+        # THE ONLY RELAYOUT - THE ROW IS IN ITS FINAL STATE FROM HERE ON
+        for panel, width in widths.items():
+            panel.setMinimumWidth(width)
+        layout.activate()
+
+        # PANELS BUILT ON FIRST USE SHOW THEIR CHILDREN THROUGH QUEUED CALLS - DELIVER THEM
+        # SO THE SECOND SNAPSHOT HAS THE PANEL CONTENT
+        QCoreApplication.sendPostedEvents()
+
+        end = [(panel.x(), panel.width()) for panel in panels]
+        if before is None or start == end:
+            return
+
+        self.before = before
+        self.after = self.row.grab()
+        self.strips = list(zip(start, end))
+        self.progress = 0.0
+        self.setGeometry(self.row.rect())
+        self.raise_()
+        self.show()
+        self.animation.start()
+
+    def setProgress(self, value):
+        self.progress = value
+        self.update()
+
+    def finish(self):
+        self.hide()
+        self.before = None
+        self.after = None
+        self.strips = []
+
+    ## CLASS METHODS ==> PAINT
+    ########################################################################
+    # EACH STRIP IS DRAWN LEFT-ANCHORED FROM THE SNAPSHOT IN WHICH ITS PANEL IS WIDER, SO A
+    # PANEL OPENING SHOWS ITS FINAL CONTENT UNCOVERED AND A PANEL CLOSING SHOWS ITS OLD ONE
+    def paintEvent(self, event):
+        if self.before is None:
+            return
+        height = self.height()
+        t = self.progress
+        painter = QPainter(self)
+        for (startX, startW), (endX, endW) in self.strips:
+            x = startX + (endX - startX) * t
+            width = startW + (endW - startW) * t
+            if width <= 0:
+                continue
+            if endW >= startW:
+                pixmap, sourceX = self.after, endX
+            else:
+                pixmap, sourceX = self.before, startX
+            ratio = pixmap.devicePixelRatio()
+            source = QRectF(sourceX * ratio, 0, width * ratio, height * ratio)
+            painter.drawPixmap(QRectF(x, 0, width, height), pixmap, source)
+        painter.end()
@@ -21,8 +21,13 @@ from PySide6.QtWidgets import (QApplication, QCheckBox, QComboBox, QDateEdit,
                              QPushButton, QRadioButton, QSlider, QSpinBox,
                              QTimeEdit, QVBoxLayout, QWidget)
 
+from src.app_resources import loadResources
+from src.app_themes import applicationSheet, installThemes
+from src.app_settings import Settings
+from src.gui.window_shadow import WindowShadow
+from src.models.transaction_store import TransactionStore
 from src.qtdesigner.ui_splashscreen import Ui_SplashScreen
-from .mainwindow import MainWindow
+from src.startup_pipeline import StartupPipeline
 
 
 class SplashScreen(QMainWindow):    
@@ -35,24 +40,24 @@ class SplashScreen(QMainWindow):
 
         # INITIALISE COMPONENTS
         self.ui.label_stage.setText("WELCOME TO <strong>DAISYCATTAX</strong>")
+        self.ui.progressBar.setValue(0)
         self.initialiseTitleBar()
         self.initialiseDropShadowEffect()
 
-        # SET UP TIMER PROGRESS BAR
-        self.counter = 0
-        self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.progress)
-
-        # BUILD STEPS
-        milliseconds = 20
-        self.timer.start(milliseconds)
-        self.timer.singleShot(800, lambda: self.ui.label_stage.setText("LOADING <strong>DATABASE</strong>"))
-        self.timer.singleShot(1200, lambda: self.ui.label_stage.setText("MATCHING <strong>TRANSACTIONS</strong>"))
-        self.timer.singleShot(1500, lambda: self.ui.label_stage.setText("LOADING <strong>USER INTERFACE</strong>"))
-        # TODO Replace with build steps (split into stages & use a timer/pause for each stage to match to progress)
+        # BUILD STEPS - PROGRESS BAR AND STAGE LABEL FOLLOW THE REAL WORK
+        self.main = None
+        self.pipeline = StartupPipeline(self)
+        self.pipeline.progressChanged.connect(self.ui.progressBar.setValue)
+        self.pipeline.stageStarted.connect(self.ui.label_stage.setText)
+        self.pipeline.finished.connect(self.showMainWindow)
+        self.pipeline.failed.connect(self.stageFailed)
+        self.initialiseStages()
 
         self.show()
 
+        # START ONCE THE SPLASH HAS BEEN PAINTED
+        QtCore.QTimer.singleShot(0, self.pipeline.start)
+
     ## CLASS METHODS ==> INITIALISATION
     ######################################################################## 
     def initialiseTitleBar(self):
@@ -60,22 +65,57 @@ class SplashScreen(QMainWindow):
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
      
     def initialiseDropShadowEffect(self):
+        if Settings.WINDOW_SHADOW == "nineslice":
+            self.shadow = WindowShadow(self.ui.dropShadowFrame, 20, QColor(0, 0, 0, 60))
+            return
         self.shadow = QGraphicsDropShadowEffect(self)
         self.shadow.setBlurRadius(20)
         self.shadow.setXOffset(0)
         self.shadow.setYOffset(0)
         self.shadow.setColor(QColor(0, 0, 0, 60))
         self.ui.dropShadowFrame.setGraphicsEffect(self.shadow)
-        
-    ## CLASS METHODS ==> PROGRESS BAR
+
+    def initialiseStages(self):
+        self.pipeline.addStage("resources", "LOADING <strong>RESOURCES</strong>",
+                               self.loadResources, weight=1)
+        self.pipeline.addStage("theme", "LOADING <strong>THEME</strong>",
+                               self.compileTheme, weight=1)
+        if Settings.TRANSACTION_STORE:
+            self.pipeline.addStage("store", "OPENING <strong>TRANSACTIONS</strong>",
+                                   self.openStore, weight=1)
+        self.pipeline.addStage("ui", "LOADING <strong>USER INTERFACE</strong>",
+                               self.buildMainWindow, weight=4, threaded=False)
+
+    ## CLASS METHODS ==> BUILD STAGES
+    ########################################################################
+    def loadResources(self, progress):
+        return loadResources()
+
+    def compileTheme(self, progress):
+        # COMPILED OFF THE GUI THREAD - installThemes() THEN GETS IT FROM THE CACHE
+        return applicationSheet()
+
+    def openStore(self, progress):
+        # ONLY THE SCHEMA AND TICKERS ARE READ - THE TABLE PAGES THE ROWS IN LATER
+        return TransactionStore(Settings.TRANSACTION_STORE)
+
+    def buildMainWindow(self, progress):
+        # IMPORTED HERE SO THE UI MODULES ARE PARSED WHILE THE SPLASH IS VISIBLE
+        from .mainwindow import MainWindow
+        progress(0.5)
+        installThemes()
+        self.main = MainWindow()
+        store = self.pipeline.results.get("store")
+        if store is not None:
+            self.main.openTransactionStore(store)
+        return self.main
+
+    ## CLASS METHODS ==> PROGRESS
     ########################################################################  
-    def progress(self):
-        self.ui.progressBar.setValue(self.counter)
-        self.counter += 1
-        
-        if self.counter > 100:
-            self.timer.stop()
-            self.main = MainWindow()
-            self.main.show()
-            self.close()
+    def showMainWindow(self):
+        self.main.show()
+        self.close()
 
+    def stageFailed(self, stage, message):
+        print(message, file=sys.stderr)
+        self.ui.label_stage.setText(f"FAILED: <strong>{stage.upper()}</strong>")
@@ -0,0 +1,117 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Window shadow - cached nine-slice shadow painted around a frame
+##
+################################################################################
+
+import math
+
+from PySide6.QtCore import QEvent, QRect, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QRegion
+from PySide6.QtWidgets import QWidget
+
+
+# NINE-SLICE TILES SHARED BY EVERY SHADOW - KEY: (BLUR, RGBA, DEVICE PIXEL RATIO)
+_tileCache = {}
+
+
+# RENDER THE TILE FOR A BLURRED RECTANGLE ONCE
+# A GAUSSIAN BLUR OF A RECTANGLE IS SEPARABLE, SO THE ALPHA AT (x, y) IS THE PRODUCT OF
+# TWO BLURRED 1D EDGES. THE TILE HOLDS THE FOUR CORNERS (THE SPILL OUTSIDE THE FRAME PLUS
+# AS MUCH FALL-OFF INSIDE IT) AROUND A ONE PIXEL MIDDLE THAT IS STRETCHED ALONG EACH EDGE,
+# SO ONE SMALL PIXMAP SERVES EVERY WINDOW SIZE. RETURNS (TILE, SPILL, CORNER) WITH THE
+# SIZES IN LOGICAL PIXELS
+# ///////////////////////////////////////////////////////////////
+def shadowTile(blur, color, ratio=1.0):
+    key = (blur, color.rgba(), ratio)
+    if key in _tileCache:
+        return _tileCache[key]
+
+    # 3 SIGMA EACH SIDE OF THE EDGE - SIGMA = blur / 3 MATCHES THE FALL-OFF OF
+    # QGraphicsDropShadowEffect WITH THE SAME BLUR RADIUS
+    spill = int(math.ceil(blur))
+    corner = 2 * spill
+    sigma = max(blur * ratio / 3.0, 0.5)
+    scale = 1.0 / (sigma * math.sqrt(2.0))
+    deviceSpill = spill * ratio
+    deviceCorner = int(round(corner * ratio))
+
+    # ALPHA ACROSS ONE EDGE, MIRRORED FOR THE FAR SIDE; 1.0 IN THE STRETCHED MIDDLE
+    edge = [0.5 * (1.0 + math.erf((i + 0.5 - deviceSpill) * scale)) for i in range(deviceCorner)]
+    profile = edge + [1.0] + edge[::-1]
+    size = len(profile)
+
+    # PREMULTIPLIED ARGB32 PIXELS, WRITTEN AS ONE BUFFER
+    pixels = bytearray(size * size * 4)
+    red, green, blue, alpha = color.red(), color.green(), color.blue(), color.alpha()
+    offset = 0
+    for y in range(size):
+        for x in range(size):
+            a = int(round(alpha * profile[x] * profile[y]))
+            pixels[offset:offset + 4] = (blue * a // 255, green * a // 255, red * a // 255, a)
+            offset += 4
+    image = QImage(bytes(pixels), size, size, size * 4, QImage.Format_ARGB32_Premultiplied)
+
+    tile = QPixmap.fromImage(image)
+    _tileCache[key] = (tile, spill, corner)
+    return _tileCache[key]
+
+
+# PAINTS THE SHADOW OF content INTO THE MARGINS OF ITS PARENT. UNLIKE
+# QGraphicsDropShadowEffect ON THE CONTENT, REPAINTS OF THE CONTENT'S CHILDREN (TABLE
+# SCROLLING ETC.) DO NOT GO THROUGH AN OFFSCREEN PIXMAP AND A BLUR PASS - THE SHADOW IS
+# ONLY REPAINTED WHEN THE CONTENT MOVES OR CHANGES SIZE
+# ///////////////////////////////////////////////////////////////
+class WindowShadow(QWidget):
+    def __init__(self, content, blurRadius, color):
+        super().__init__(content.parentWidget())
+        self.content = content
+        self.blurRadius = blurRadius
+        self.color = QColor(color)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+
+        # FOLLOW THE CONTENT AND THE AREA AROUND IT
+        content.installEventFilter(self)
+        self.parentWidget().installEventFilter(self)
+        self.setGeometry(self.parentWidget().rect())
+        self.lower()
+        self.show()
+
+    def eventFilter(self, watched, event):
+        if event.type() in (QEvent.Resize, QEvent.Move, QEvent.Show, QEvent.Hide):
+            if watched is self.parentWidget():
+                self.setGeometry(watched.rect())
+            self.update()
+        return False
+
+    def paintEvent(self, event):
+        if not self.content.isVisible():
+            return
+        tile, spill, c = shadowTile(self.blurRadius, self.color, self.devicePixelRatioF())
+        s = (tile.width() - 1) // 2  # CORNER SIZE IN TILE PIXELS
+
+        # TILE AREA AROUND THE CONTENT - THE SHADOW SPILLS OUT OF THE FRAME BY spill
+        frame = self.content.geometry()
+        outer = frame.adjusted(-spill, -spill, spill, spill)
+        left, top, right, bottom = outer.left(), outer.top(), outer.right() + 1, outer.bottom() + 1
+        middleW = max(right - left - 2 * c, 0)
+        middleH = max(bottom - top - 2 * c, 0)
+
+        painter = QPainter(self)
+        painter.setClipRegion(QRegion(self.rect()).subtracted(QRegion(frame)))
+        pieces = (
+            (QRect(left, top, c, c), QRect(0, 0, s, s)),
+            (QRect(right - c, top, c, c), QRect(s + 1, 0, s, s)),
+            (QRect(left, bottom - c, c, c), QRect(0, s + 1, s, s)),
+            (QRect(right - c, bottom - c, c, c), QRect(s + 1, s + 1, s, s)),
+            (QRect(left + c, top, middleW, c), QRect(s, 0, 1, s)),
+            (QRect(left + c, bottom - c, middleW, c), QRect(s, s + 1, 1, s)),
+            (QRect(left, top + c, c, middleH), QRect(0, s, s, 1)),
+            (QRect(right - c, top + c, c, middleH), QRect(s + 1, s, s, 1)),
+        )
+        for target, source in pieces:
+            if target.isValid():
+                painter.drawPixmap(target, tile, source)
+        painter.end()
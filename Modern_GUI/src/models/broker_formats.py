@@ -0,0 +1,451 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Broker formats - which columns of a broker's CSV export hold what
+##
+## EACH BrokerFormat DECLARES THE HEADER NAMES ITS FIELDS GO BY (ITS SIGNATURE), HOW ITS
+## DATES AND ACTIONS ARE WRITTEN AND WHETHER A SELL IS A NEGATIVE QUANTITY. detectFormat
+## READS ONLY THE FIRST SNIFF_BYTES OF A FILE, FINDS THE FIRST REGISTERED FORMAT WHOSE
+## SIGNATURE THE HEADER HAS, AND COMPILES IT FOR THAT HEADER INTO A ColumnMapper - HEADER
+## POSITIONS AND VALUE PARSERS FIXED ONCE, SO A CHUNK OF ROWS IS CONVERTED WITH maps AND NO
+## PER-ROW LOOKUPS. MAPPERS ARE CACHED BY A HASH OF THE HEADER LINE: THE NEXT FILE FROM THE
+## SAME BROKER SKIPS DETECTION ALTOGETHER.
+##
+## THE DECIMAL MARK ("12.50" OR "12,50") IS DECLARED BY THE FORMAT OR SNIFFED FROM EACH FILE'S
+## SAMPLED NUMBERS. A FILE WHOSE SAMPLE DOES NOT SETTLE IT HAS EACH NUMBER READ BY ITS OWN
+## MARKS, AND ONE THAT COULD BE READ EITHER WAY ("1,234", "1.234") IS REJECTED
+##
+################################################################################
+
+import copy
+import csv
+import hashlib
+import io
+import re
+import threading
+from array import array
+from datetime import date, datetime
+from decimal import ROUND_HALF_EVEN, Decimal
+from itertools import compress, repeat
+from operator import itemgetter, mul, not_
+
+from src.models.transaction_columns import (BUY, FEE_SCALE, PRICE_SCALE, QUANTITY_SCALE, SELL,
+                                            TransactionColumns, toFixed)
+
+
+FIELDS = ("date", "ticker", "action", "quantity", "price", "fee")
+
+# ROWS WITH THIS ACTION (DEPOSITS, DIVIDENDS...) ARE LEFT OUT WITHOUT BEING REJECTED
+IGNORE = -1
+
+ACTION_NAMES = {"BUY": BUY, "B": BUY, "BOUGHT": BUY, "PURCHASE": BUY,
+                "SELL": SELL, "S": SELL, "SOLD": SELL, "SALE": SELL}
+DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%Y/%m/%d")
+
+# A TIME AFTER THE DATE ("2021-01-05T10:00:00", "2021-01-05, 10:00:00", "20210104;103000")
+TIME_PART = re.compile(r"(?:[ T,]\s*\d{1,2}:\d{2}|;\d{4}).*$")
+
+# AN ISO DATE WITH A TIME - A COLUMN OF THEM (EXCHANGE FILLS, EACH AT ITS OWN SECOND) HAS ITS
+# TIMES CUT OFF IN ONE map, SO THE FILLS OF ONE DAY SHARE ONE MEMOISED DATE
+ISO_DATE_TIME = re.compile(r"\d{4}-\d{2}-\d{2}[ T]").match
+DATE_PART = itemgetter(slice(0, 10))
+
+SNIFF_BYTES = 4096
+DELIMITERS = ",;\t|"
+
+# A DECIMAL-COMMA NUMBER ("1.234,5") WITH ITS MARKS SWAPPED ("1,234.5") FOR THE PARSERS
+DECIMAL_COMMA = str.maketrans(",.", ".,")
+NUMBER_FIELDS = ("quantity", "price", "fee")
+
+# A WHOLE PART WITH THOUSANDS SEPARATORS - ANY OTHER COMMA MAKES A NUMBER BAD, NOT RESCALED
+GROUPED = re.compile(r"-?\d{1,3}(?:,\d{3})+").fullmatch
+
+# ONE MARK BETWEEN A NON-ZERO GROUP AND EXACTLY THREE DIGITS - A DECIMAL OR A THOUSANDS MARK
+EITHER_WAY = re.compile(r"-?[1-9]\d{0,2}[.,]\d{3}").fullmatch
+UNCLEAR = "?"
+
+# TEXTS MEMOISED PER FIELD (FEW DISTINCT DATES, TICKERS AND ACTIONS) - DROPPED ONCE THIS
+# MANY ARE HELD, SO THE MEMO CANNOT GROW WITH THE FILE
+MEMO_LIMIT = 65536
+MAPPER_LIMIT = 64
+
+
+## VALUES - EACH TAKES ONE CELL'S TEXT AND RETURNS THE STORED VALUE, OR None IF IT IS BAD
+########################################################################
+# dateFormats None - ISO DATES, THEN DATE_FORMATS
+def dateParser(dateFormats=None):
+    patterns = DATE_FORMATS if dateFormats is None else dateFormats
+
+    def parse(text):
+        text = TIME_PART.sub("", text.strip())
+        if dateFormats is None:
+            try:
+                return date.fromisoformat(text).toordinal()
+            except ValueError:
+                pass
+        for pattern in patterns:
+            try:
+                return datetime.strptime(text, pattern).toordinal()
+            except ValueError:
+                pass
+        return None
+    return parse
+
+
+# A DATE COLUMN'S TEXTS READY FOR THE MEMO
+def dateTexts(texts):
+    if all(map(ISO_DATE_TIME, texts)):
+        return list(map(DATE_PART, texts))
+    return texts
+
+
+def parseTicker(text):
+    return text.strip().upper() or None
+
+
+def actionParser(actions):
+    def parse(text):
+        return actions.get(text.strip().upper())
+    return parse
+
+
+# DECIMAL TEXT ("1,234.5", "£0.99") -> FIXED POINT WITH INTEGER ARITHMETIC ONLY; MORE
+# DECIMAL PLACES THAN scale HOLDS GO THROUGH toFixed TO ROUND. minimum IS THE SMALLEST
+# VALUE ALLOWED (None - ANY), blank THE VALUE OF AN EMPTY CELL
+def fixedParser(scale, minimum, blank=None):
+    places = len(str(scale)) - 1
+
+    def parse(text):
+        text = text.strip().lstrip("£$€")
+        if not text:
+            return blank
+        whole, point, fraction = text.partition(".")
+        if "," in whole:
+            if not GROUPED(whole):
+                return None
+            whole = whole.replace(",", "")
+            text = whole + point + fraction
+        try:
+            if len(fraction) > places:
+                value = toFixed(text, scale)
+            elif whole.startswith("-"):
+                value = int(whole) * scale - int(fraction.ljust(places, "0") or "0")
+            else:
+                value = int(whole or "0") * scale + int(fraction.ljust(places, "0") or "0")
+        except (ValueError, ArithmeticError):
+            return None
+        return value if minimum is None or value >= minimum else None
+    return parse
+
+
+# A WHOLE COLUMN AT ONCE - PLAIN DECIMALS (THE USUAL CASE) GO THROUGH float WITH C-LEVEL
+# maps: WITH AT MOST 9 WHOLE DIGITS AND scale'S PLACES value * scale STAYS UNDER 1e15, WHERE
+# round GIVES THE EXACT FIXED POINT. DECIMALS WITH MORE PLACES (CRYPTO QUANTITIES AND FEES)
+# GO THROUGH Decimal THE SAME WAY, ROUNDED AS toFixed ROUNDS. A COLUMN WITH ANYTHING ELSE IS
+# PARSED TEXT BY TEXT
+def fixedColumn(scale, minimum, blank=None):
+    sign = "-?" if minimum is None else ""
+    plain = re.compile(rf"{sign}\d{{1,9}}(?:\.\d{{0,{len(str(scale)) - 1}}})?").fullmatch
+    decimal = re.compile(rf"{sign}\d{{1,18}}(?:\.\d*)?").fullmatch
+    parse = fixedParser(scale, minimum, blank)
+
+    def column(texts):
+        if blank is not None and not any(texts):
+            return [blank] * len(texts)
+        if all(map(plain, texts)):
+            values = list(map(round, map(mul, map(float, texts), repeat(scale))))
+        elif all(map(decimal, texts)):
+            scaled = map(mul, map(Decimal, texts), repeat(Decimal(scale)))
+            values = list(map(int, map(Decimal.to_integral_value, scaled, repeat(ROUND_HALF_EVEN))))
+        else:
+            return list(map(parse, texts))
+        if minimum is None or min(values, default=minimum) >= minimum:
+            return values
+        return list(map(parse, texts))
+    return column
+
+
+parseQuantities = fixedColumn(QUANTITY_SCALE, 1)
+parseSignedQuantities = fixedColumn(QUANTITY_SCALE, None)
+parsePrices = fixedColumn(PRICE_SCALE, 0)
+parseFees = fixedColumn(FEE_SCALE, None, 0)
+
+
+# THE DECIMAL MARK A NUMBER'S TEXT IS WRITTEN WITH: "." OR ",", None IF IT HAS NO MARK, OR
+# UNCLEAR IF IT COULD BE EITHER. WITH BOTH MARKS THE LAST IS THE DECIMAL ONE, AND A MARK
+# SEEN MORE THAN ONCE SEPARATES THOUSANDS
+def decimalMark(text):
+    text = text.strip().lstrip("£$€")
+    point, comma = text.rfind("."), text.rfind(",")
+    if point >= 0 and comma >= 0:
+        return "." if point > comma else ","
+    if point < 0 and comma < 0:
+        return None
+    mark = "." if point >= 0 else ","
+    if text.count(mark) > 1:
+        return "," if mark == "." else "."
+    return UNCLEAR if EITHER_WAY(text) else mark
+
+
+# A NUMBER FROM A FILE WHOSE DECIMAL MARK IS NOT KNOWN, READY FOR THE PARSERS - ONE THAT
+# COULD BE READ EITHER WAY BECOMES A TEXT THEY REJECT
+def ownMarkText(text):
+    mark = decimalMark(text)
+    if mark == ",":
+        return text.translate(DECIMAL_COMMA)
+    return UNCLEAR if mark == UNCLEAR else text
+
+
+# THE DECIMAL MARK OF THE NUMBERS IN A FILE'S SAMPLE ROWS - None IF THEY HAVE NONE, OR BOTH
+def sampleDecimalMark(rows, positions):
+    marks = {decimalMark(row[position]) for row in rows for field in NUMBER_FIELDS
+             for position in positions.get(field, ()) if position < len(row)}
+    marks -= {None, UNCLEAR}
+    return marks.pop() if len(marks) == 1 else None
+
+
+class Memo(dict):
+    def __init__(self, parse):
+        super().__init__()
+        self.parse = parse
+
+    def __missing__(self, text):
+        if len(self) > MEMO_LIMIT:
+            self.clear()
+        value = self[text] = self.parse(text)
+        return value
+
+
+## FORMATS
+########################################################################
+class BrokerFormat():
+    def __init__(self, name, columns, actions=ACTION_NAMES, dateFormats=None, signedQuantity=False,
+                 decimalMark=None):
+        self.name = name
+
+        # FIELD -> THE HEADER NAMES IT MAY GO BY. THE FIRST ONE PRESENT IS USED, EXCEPT FOR
+        # THE FEES - EVERY FEE COLUMN PRESENT (COMMISSION, STAMP DUTY...) IS ADDED UP
+        self.columns = {field: tuple(name.casefold() for name in ((names,) if isinstance(names, str) else names))
+                        for field, names in columns.items()}
+        self.actions = actions                  # UPPER CASE TEXT -> BUY / SELL / IGNORE
+        self.dateFormats = dateFormats          # strptime PATTERNS, None - ISO OR DATE_FORMATS
+        self.signedQuantity = signedQuantity    # NO ACTION COLUMN - A NEGATIVE QUANTITY IS A SELL
+        self.decimalMark = decimalMark          # "." OR ",", None - SNIFFED FROM EACH FILE
+
+    def required(self):
+        return ("date", "ticker", "quantity", "price") + (() if self.signedQuantity else ("action",))
+
+    # FIELD -> HEADER POSITIONS (ONE, OR EVERY FEE COLUMN), OR None IF header IS NOT THIS FORMAT'S
+    def match(self, header):
+        names = {}
+        for position, name in enumerate(header):
+            names.setdefault(name.strip().casefold(), position)
+        positions = {field: [names[name] for name in aliases if name in names]
+                     for field, aliases in self.columns.items()}
+        if not all(positions.get(field) for field in self.required()):
+            return None
+        return {field: found if field == "fee" else found[:1] for field, found in positions.items() if found}
+
+    def compile(self, positions, delimiter):
+        return ColumnMapper(self, positions, delimiter)
+
+
+# ONE FORMAT FOR ONE HEADER - POSITIONS AND PARSERS BOUND ONCE
+class ColumnMapper():
+    def __init__(self, format, positions, delimiter):
+        self.format = format
+        self.delimiter = delimiter
+        self.decimalMark = format.decimalMark   # None - EACH NUMBER READ BY ITS OWN MARKS
+        self.variants = {self.decimalMark: self}
+        self.positions = positions              # FIELD -> HEADER POSITIONS (SEE BrokerFormat.match)
+        self.width = max(max(found) for found in positions.values()) + 1
+        self.dates = Memo(dateParser(format.dateFormats))
+        self.tickers = Memo(parseTicker)
+        self.actions = Memo(actionParser(format.actions))
+
+        # THE ONLY COLUMNS READ - A TOKENIZER NEED NOT PULL OUT ANY OTHER
+        self.needed = sorted({position for found in positions.values() for position in found})
+
+    # THIS MAPPER FOR A FILE WHOSE NUMBERS ARE WRITTEN WITH mark - THE FORMAT'S OWN MARK WINS
+    def withDecimalMark(self, mark):
+        if self.format.decimalMark is not None:
+            return self
+        variant = self.variants.get(mark)
+        if variant is None:
+            variant = self.variants[mark] = copy.copy(self)
+            variant.decimalMark = mark
+        return variant
+
+    # (LINE NUMBERS, csv ROWS) -> A TransactionColumns OF THE GOOD ROWS. reject(line, reason) IS
+    # CALLED FOR EACH BAD ONE; ROWS WHOSE ACTION THE FORMAT IGNORES ARE LEFT OUT QUIETLY
+    def convert(self, lines, rows, reject):
+        return self.convertCells(*self.cells(lines, rows, reject), reject)
+
+    # (LINE NUMBERS, POSITION -> CELL TEXTS OF THE needed COLUMNS) OF THE ROWS WIDE ENOUGH
+    def cells(self, lines, rows, reject):
+        if min(map(len, rows), default=self.width) < self.width:
+            keep = [len(row) >= self.width for row in rows]
+            for line in compress(lines, map(not_, keep)):
+                reject(line, "missing columns")
+            rows, lines = list(compress(rows, keep)), list(compress(lines, keep))
+        return lines, {position: list(map(itemgetter(position), rows)) for position in self.needed}
+
+    # THE SAME AS convert, FROM COLUMNS ALREADY PULLED OUT (cells, OR A TOKENIZER THAT SPLITS
+    # COLUMNS STRAIGHT FROM THE FILE)
+    def convertCells(self, lines, cells, reject):
+        texts = {field: self.texts(field, cells[found[0]]) for field, found in self.positions.items() if field != "fee"}
+        if self.format.signedQuantity:
+            signed = parseSignedQuantities(texts["quantity"])
+            actions = [None if value is None else SELL if value < 0 else BUY for value in signed]
+            quantities = [None if value is None or value == 0 else abs(value) for value in signed]
+        else:
+            actions = list(map(self.actions.__getitem__, texts["action"]))
+            quantities = parseQuantities(texts["quantity"])
+        values = [list(map(self.dates.__getitem__, dateTexts(texts["date"]))),
+                  list(map(self.tickers.__getitem__, texts["ticker"])),
+                  actions,
+                  quantities,
+                  parsePrices(texts["price"]),
+                  self.fees(cells, len(lines))]
+
+        # indexes - EACH ROW LEFT'S INDEX IN cells, FOR THE TEXT OF A BAD ONE
+        indexes = range(len(lines))
+        if IGNORE in actions:
+            keep = list(map(IGNORE.__ne__, actions))
+            values = [list(compress(column, keep)) for column in values]
+            lines = list(compress(lines, keep))
+            indexes = list(compress(indexes, keep))
+        if any(None in column for column in values):
+            bad = [index for index, row in enumerate(zip(*values)) if None in row]
+            for index in bad:
+                field = FIELDS[next(field for field, column in enumerate(values) if column[index] is None)]
+                text = self.cellText(field, cells, indexes[index])
+                unclear = self.decimalMark is None and field in NUMBER_FIELDS and UNCLEAR in map(
+                    decimalMark, text.split(", "))
+                reject(lines[index], f"bad {field} '{text}'" + (" (decimal mark unclear)" if unclear else ""))
+            keep = bytearray(b"\x01") * len(lines)
+            for index in bad:
+                keep[index] = 0
+            values = [list(compress(column, keep)) for column in values]
+        return columnsBlock(*values)
+
+    # FEES ARE TAKEN AS CHARGES WHATEVER THEIR SIGN (SOME BROKERS SHOW THEM AS NEGATIVE CASH)
+    def fees(self, cells, rows):
+        columns = [parseFees(self.texts("fee", cells[position])) for position in self.positions.get("fee", ())]
+        if not columns:
+            return [0] * rows
+        if len(columns) == 1 and None not in columns[0]:
+            return list(map(abs, columns[0]))
+        return [None if None in fees else sum(map(abs, fees)) for fees in zip(*columns)]
+
+    def texts(self, field, column):
+        if field not in NUMBER_FIELDS or self.decimalMark == ".":
+            return column
+        if self.decimalMark == ",":
+            return list(map(str.translate, column, repeat(DECIMAL_COMMA)))
+        return list(map(ownMarkText, column))
+
+    def cellText(self, field, cells, index):
+        if field == "action" and self.format.signedQuantity:
+            field = "quantity"
+        return ", ".join(cells[position][index] for position in self.positions[field])
+
+
+def columnsBlock(dates, tickers, actions, quantities, prices, fees):
+    block = TransactionColumns()
+    ids = Memo(block.tickerId)
+    block.dates = array("i", dates)
+    block.tickerIds = array("I", map(ids.__getitem__, tickers))
+    block.actions = array("B", actions)
+    block.quantities = array("q", quantities)
+    block.prices = array("q", prices)
+    block.fees = array("q", fees)
+    return block
+
+
+## REGISTRY - FORMATS ARE TRIED IN ORDER, THE GENERIC ONE (ANY COLUMN ORDER, COMMON NAMES) LAST
+########################################################################
+GENERIC = BrokerFormat("Generic CSV", {
+    "date": ("date", "trade date"),
+    "ticker": ("ticker", "symbol", "epic"),
+    "action": ("action", "type", "side", "buy/sell"),
+    "quantity": ("quantity", "shares", "units"),
+    "price": ("price", "unit price", "price per share"),
+    "fee": ("fees", "fee", "commission", "charges"),
+})
+
+FORMATS = [
+    # FLEX QUERY TRADES - yyyymmdd DATES, SELLS AS NEGATIVE QUANTITIES, COMMISSION NEGATIVE
+    BrokerFormat("Interactive Brokers Flex", {
+        "date": ("TradeDate", "Date/Time"),
+        "ticker": "Symbol",
+        "quantity": "Quantity",
+        "price": ("TradePrice", "T. Price"),
+        "fee": ("IBCommission", "Comm/Fee"),
+    }, dateFormats=("%Y%m%d", "%Y-%m-%d"), signedQuantity=True),
+
+    # HISTORY EXPORT - ORDER TYPES IN THE ACTION, DEPOSITS AND DIVIDENDS IN THE SAME FILE
+    BrokerFormat("Trading 212", {
+        "date": "Time",
+        "ticker": "Ticker",
+        "action": "Action",
+        "quantity": "No. of shares",
+        "price": "Price / share",
+        "fee": ("Stamp duty reserve tax", "Currency conversion fee", "Transaction fee", "Finra fee"),
+    }, actions={**ACTION_NAMES,
+                "MARKET BUY": BUY, "LIMIT BUY": BUY, "STOP BUY": BUY, "STOP LIMIT BUY": BUY,
+                "MARKET SELL": SELL, "LIMIT SELL": SELL, "STOP SELL": SELL, "STOP LIMIT SELL": SELL,
+                "DEPOSIT": IGNORE, "WITHDRAWAL": IGNORE, "INTEREST ON CASH": IGNORE,
+                "DIVIDEND (ORDINARY)": IGNORE, "DIVIDEND (DIVIDEND)": IGNORE}),
+
+    GENERIC,
+]
+
+# HEADER LINE HASH -> ColumnMapper
+mapperCache = {}
+mapperLock = threading.Lock()
+
+
+# A FORMAT REGISTERED LATER IS TRIED BEFORE THE BUILT-IN ONES
+def registerFormat(format):
+    with mapperLock:
+        FORMATS.insert(0, format)
+        mapperCache.clear()
+
+
+## DETECTION
+########################################################################
+# THE MAPPER FOR AN OPEN (BINARY) FILE, WHICH IS LEFT AT ITS START
+def detectFormat(file):
+    sample = file.read(SNIFF_BYTES)
+    file.seek(0)
+    if len(sample) == SNIFF_BYTES:
+        sample = sample[:sample.rfind(b"\n") + 1] or sample
+    headerLine = sample.split(b"\n", 1)[0].rstrip(b"\r")
+    key = hashlib.blake2b(headerLine, digest_size=16).digest()
+    mapper = mapperCache.get(key)
+    if mapper is None:
+        mapper = compileHeader(headerLine.decode("utf-8-sig", errors="replace"),
+                               sample.decode("utf-8-sig", errors="replace"))
+        with mapperLock:
+            if len(mapperCache) >= MAPPER_LIMIT:
+                mapperCache.clear()
+            mapperCache[key] = mapper
+    rows = list(csv.reader(io.StringIO(sample.decode("utf-8-sig", errors="replace")), delimiter=mapper.delimiter))
+    return mapper.withDecimalMark(sampleDecimalMark(rows[1:], mapper.positions))
+
+
+# THE DELIMITER IS SNIFFED FROM THE SAMPLE'S WHOLE LINES
+def compileHeader(headerText, sample):
+    try:
+        delimiter = csv.Sniffer().sniff(sample, DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ","
+    header = next(csv.reader([headerText], delimiter=delimiter), [])
+    for format in FORMATS:
+        positions = format.match(header)
+        if positions is not None:
+            return format.compile(positions, delimiter)
+    missing = [field for field in GENERIC.required() if not any(name.strip().casefold() in GENERIC.columns[field]
+                                                                for name in header)]
+    raise ValueError(f"No broker format matches the header (no {', '.join(missing)} column): {', '.join(header)}")
@@ -0,0 +1,318 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Capital gains - UK share matching rules over TransactionColumns
+##
+## EVERY DISPOSAL IS MATCHED, IN THIS ORDER, AGAINST ACQUISITIONS ON THE SAME DAY, THEN
+## ACQUISITIONS IN THE FOLLOWING 30 DAYS (BED AND BREAKFAST, EARLIEST FIRST), THEN THE
+## SECTION 104 POOL AT ITS AVERAGE COST. A DAY'S ACQUISITIONS OF AN ASSET ARE ONE
+## ACQUISITION AT THEIR AVERAGE COST, AND A DAY'S DISPOSALS ONE DISPOSAL (TCGA 1992 s105).
+## A DISPOSAL THE HISTORY CANNOT COVER KEEPS ITS SHORTFALL AS AN UNMATCHED QUANTITY AT NO
+## COST. MONEY IS FIXED POINT IN PENCE
+##
+## THE RESULT IS COLUMNAR LIKE TransactionColumns - ONE array PER FIELD FOR THE ASSETS,
+## THEIR DISPOSALS, THEIR POOL ENTRIES AND THE MATCHES, WITH START OFFSETS LINKING EACH
+## LEVEL TO THE NEXT, SO A VIEW CAN POINT INTO IT BY POSITION INSTEAD OF COPYING IT. ONE
+## ASSET'S MATCHING NEVER LOOKS AT ANOTHER'S ROWS, SO AFTER AN EDIT ONLY THE ASSETS IT
+## TOUCHED ARE MATCHED AGAIN (matchAssets) AND SPLICED INTO THE RESULTS (replaceAssets)
+##
+################################################################################
+
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+from operator import add, floordiv, mul, sub
+
+from src.models.transaction_columns import BUY, FEE_SCALE, PRICE_SCALE, QUANTITY_SCALE, SELL
+
+
+MONEY_SCALE = FEE_SCALE          # 2 DP - PENCE / CENTS
+BED_AND_BREAKFAST_DAYS = 30
+NO_ROW = 0xFFFFFFFF              # A MATCH AGAINST THE POOL (OR NOTHING) HAS NO ACQUISITION ROW
+
+SAME_DAY, BED_AND_BREAKFAST, SECTION_104, UNMATCHED = range(4)
+RULES = ("Same day", "Bed & breakfast", "Section 104", "Unmatched")
+
+SELL_TABLE = bytes(int(action == SELL) for action in range(256))
+
+
+# numerator / denominator TO THE NEAREST WHOLE NUMBER, HALVES UP
+def divideRounded(numerator, denominator):
+    return (numerator * 2 + denominator) // (denominator * 2)
+
+
+# QUANTITY x PRICE IN MONEY_SCALE
+def tradeValue(quantity, price):
+    return divideRounded(quantity * price * MONEY_SCALE, QUANTITY_SCALE * PRICE_SCALE)
+
+
+# PROCEEDS OF ROWS first..end - 1 AS disposalProceeds HAS THEM, 0 FOR AN ACQUISITION - THE
+# SAME ROUNDING AS tradeValue, WITH EVERY STEP A map SO NO PYTHON RUNS PER ROW
+def rowProceeds(columns, first, end):
+    return fieldProceeds(columns.quantities[first:end], columns.prices[first:end],
+                         columns.actions[first:end], columns.fees[first:end])
+
+
+# THE SAME FOR ANY ROWS (E.G. THE ROWS AN EDIT WROTE), IN THE ORDER GIVEN
+def selectedProceeds(columns, rows):
+    def values(column):
+        return array(column.typecode, map(column.__getitem__, rows))
+    return fieldProceeds(values(columns.quantities), values(columns.prices),
+                         values(columns.actions), values(columns.fees))
+
+
+def fieldProceeds(quantities, prices, actions, fees):
+    divisor = QUANTITY_SCALE * PRICE_SCALE
+    products = map(mul, quantities, prices)
+    values = map(floordiv, map(add, map(mul, products, repeat(MONEY_SCALE * 2)), repeat(divisor)),
+                 repeat(divisor * 2))
+    sells = actions.tobytes().translate(SELL_TABLE)
+    # FEES ARE STORED IN FEE_SCALE, WHICH IS MONEY_SCALE
+    return array("q", map(mul, map(sub, values, fees), sells))
+
+
+# ONE ACQUISITION AT AVERAGE COST - A DAY'S BUYS (add), OR THE POOL AS A DAY'S DISPOSALS FIND
+# IT. EACH PART TAKEN IS COSTED AS THE RUNNING SHARE OF THE WHOLE COST, SO HOWEVER THE PARTS
+# FALL THEY ADD UP TO WHAT ONE TAKE OF THEIR TOTAL WOULD COST
+class Lot():
+    def __init__(self, quantity=0, cost=0):
+        self.rows = []
+        self.quantity = quantity
+        self.cost = cost
+        self.taken = 0
+        self.takenCost = 0
+
+    def add(self, row, quantity, cost):
+        self.rows.append(row)
+        self.quantity += quantity
+        self.cost += cost
+
+    def take(self, quantity):
+        self.taken += quantity
+        cost = divideRounded(self.cost * self.taken, self.quantity) - self.takenCost
+        self.takenCost += cost
+        return cost
+
+
+# THE GainsResults ARRAYS OF EACH LEVEL
+ASSET_FIELDS = ("poolQuantities", "poolCosts", "proceeds", "allowableCosts")
+DISPOSAL_FIELDS = ("disposalRows", "disposalProceeds", "disposalCosts")
+POOL_FIELDS = ("poolRows", "poolEntryQuantities", "poolEntryCosts")
+MATCH_FIELDS = ("matchRules", "matchRows", "matchQuantities", "matchCosts")
+
+
+class GainsResults():
+    def __init__(self, columns):
+        self.columns = columns                  # THE TransactionColumns THE ROWS BELOW ARE IN
+
+        # PER ASSET, ALPHABETICAL - POOL AND TOTALS AFTER THE LAST TRANSACTION
+        self.assets = array("I")                # TICKER ID
+        self.poolQuantities = array("q")        # x QUANTITY_SCALE
+        self.poolCosts = array("q")             # x MONEY_SCALE
+        self.proceeds = array("q")
+        self.allowableCosts = array("q")
+        self.disposalStarts = array("I", [0])   # ASSET a HAS DISPOSALS disposalStarts[a]..[a + 1] - 1
+        self.poolStarts = array("I", [0])       # ASSET a HAS POOL ENTRIES poolStarts[a]..[a + 1] - 1
+
+        # PER DISPOSAL, IN DATE ORDER WITHIN ITS ASSET
+        self.disposalRows = array("I")          # SOURCE ROW
+        self.disposalProceeds = array("q")      # QUANTITY x PRICE - FEES
+        self.disposalCosts = array("q")         # SUM OF ITS MATCHES
+        self.matchStarts = array("I", [0])      # DISPOSAL d HAS MATCHES matchStarts[d]..[d + 1] - 1
+
+        # PER POOL ENTRY - WHAT EACH ACQUISITION LEFT IN THE POOL AFTER THE OTHER RULES
+        self.poolRows = array("I")
+        self.poolEntryQuantities = array("q")
+        self.poolEntryCosts = array("q")
+
+        # PER MATCH
+        self.matchRules = array("B")
+        self.matchRows = array("I")             # ACQUISITION ROW, NO_ROW FOR THE POOL / UNMATCHED
+        self.matchQuantities = array("q")
+        self.matchCosts = array("q")
+
+    def __len__(self):
+        return len(self.assets)
+
+    def gain(self, asset):
+        return self.proceeds[asset] - self.allowableCosts[asset]
+
+    def disposalGain(self, disposal):
+        return self.disposalProceeds[disposal] - self.disposalCosts[disposal]
+
+    # PUT EACH ASSET OF partial (THE SAME ASSETS MATCHED AGAIN) IN PLACE OF ITS OLD ENTRIES.
+    # SLICE ASSIGNMENTS - ONLY THOSE ENTRIES ARE WRITTEN, THE ONES AFTER THEM MOVE IN C AND
+    # THEIR START OFFSETS ARE ONLY SHIFTED IF THE COUNT CHANGED. FALSE IF ANY ASSET NOW HAS
+    # A DIFFERENT NUMBER OF DISPOSALS, POOL ENTRIES OR MATCHES
+    def replaceAssets(self, partial):
+        sameShape = True
+        for part, tickerId in enumerate(partial.assets):
+            asset = self.assets.index(tickerId)
+            for field in ASSET_FIELDS:
+                getattr(self, field)[asset] = getattr(partial, field)[part]
+            first, end = self.disposalStarts[asset], self.disposalStarts[asset + 1]
+            partFirst, partEnd = partial.disposalStarts[part], partial.disposalStarts[part + 1]
+            sameShape &= self.splice(partial, MATCH_FIELDS, self.matchStarts[first], self.matchStarts[end],
+                                     partial.matchStarts[partFirst], partial.matchStarts[partEnd])
+            self.spliceStarts(self.matchStarts, first, end, partial.matchStarts[partFirst:partEnd + 1])
+            sameShape &= self.splice(partial, DISPOSAL_FIELDS, first, end, partFirst, partEnd)
+            self.spliceStarts(self.disposalStarts, asset, asset + 1, partial.disposalStarts[part:part + 2])
+            sameShape &= self.splice(partial, POOL_FIELDS, self.poolStarts[asset], self.poolStarts[asset + 1],
+                                     partial.poolStarts[part], partial.poolStarts[part + 1])
+            self.spliceStarts(self.poolStarts, asset, asset + 1, partial.poolStarts[part:part + 2])
+        return sameShape
+
+    def splice(self, partial, fields, first, end, partFirst, partEnd):
+        for field in fields:
+            getattr(self, field)[first:end] = getattr(partial, field)[partFirst:partEnd]
+        return end - first == partEnd - partFirst
+
+    # starts[first..end] BECOMES partStarts MOVED TO BEGIN WHERE IT DID, AND THE STARTS
+    # AFTER IT MOVE BY THE CHANGE IN LENGTH
+    @staticmethod
+    def spliceStarts(starts, first, end, partStarts):
+        base = starts[first]
+        delta = (partStarts[-1] - partStarts[0]) - (starts[end] - base)
+        if delta:
+            starts[end + 1:] = array("I", map(add, starts[end + 1:], repeat(delta)))
+        starts[first:end + 1] = array("I", map(add, partStarts, repeat(base - partStarts[0])))
+
+
+## MATCHING
+########################################################################
+# MATCH THE FIRST rows ROWS OF columns (ALL BY DEFAULT)
+def matchDisposals(columns, rows=None):
+    rows = len(columns) if rows is None else rows
+    results = GainsResults(columns)
+
+    # ROWS BY DATE, ACQUISITIONS BEFORE DISPOSALS ON A DAY, THEN IN IMPORT ORDER - THE KEYS
+    # AND THE SORT RUN IN C
+    keys = array("q", map(add, map((2).__mul__, columns.dates[:rows]), columns.actions[:rows]))
+    byTicker = {}
+    for row in sorted(range(rows), key=keys.__getitem__):
+        byTicker.setdefault(columns.tickerIds[row], []).append(row)
+
+    for tickerId in sorted(byTicker, key=columns.tickers.__getitem__):
+        matchAsset(columns, tickerId, byTicker[tickerId], results)
+    return results
+
+
+# MATCH ONLY THE ASSETS IN assetRows (TICKER ID -> ITS ROWS, ASCENDING) - THE RESULTS HOLD
+# THOSE ASSETS, READY FOR GainsResults.replaceAssets
+def matchAssets(columns, assetRows):
+    results = GainsResults(columns)
+    dates, actions = columns.dates, columns.actions
+    for tickerId in sorted(assetRows, key=columns.tickers.__getitem__):
+        rows = assetRows[tickerId]
+        keys = array("q", map(add, map((2).__mul__, map(dates.__getitem__, rows)), map(actions.__getitem__, rows)))
+        order = sorted(range(len(rows)), key=keys.__getitem__)
+        matchAsset(columns, tickerId, list(map(rows.__getitem__, order)), results)
+    return results
+
+
+def matchAsset(columns, tickerId, rows, results):
+    dates, actions, quantities, prices, fees = (columns.dates, columns.actions, columns.quantities,
+                                                columns.prices, columns.fees)
+    acquisitions = [row for row in rows if actions[row] == BUY]
+    disposals = [row for row in rows if actions[row] != BUY]
+    remaining = {row: quantities[row] for row in rows}
+    matches = {row: [] for row in disposals}
+    costs = {row: tradeValue(quantities[row], prices[row]) + fees[row] * MONEY_SCALE // FEE_SCALE
+             for row in acquisitions}
+
+    # EACH DAY'S ACQUISITIONS AS ONE - A PART OF ANY OF THEM IS COSTED AT THE DAY'S AVERAGE
+    days = {}
+    for row in acquisitions:
+        days.setdefault(dates[row], Lot()).add(row, quantities[row], costs[row])
+
+    def match(disposal, acquisition, rule):
+        quantity = min(remaining[disposal], remaining[acquisition])
+        if quantity > 0:
+            remaining[disposal] -= quantity
+            remaining[acquisition] -= quantity
+            matches[disposal].append((rule, acquisition, quantity, days[dates[acquisition]].take(quantity)))
+
+    # SAME DAY
+    for disposal in disposals:
+        lot = days.get(dates[disposal])
+        for acquisition in (lot.rows if lot else ()):
+            if not remaining[disposal]:
+                break
+            match(disposal, acquisition, SAME_DAY)
+
+    # BED AND BREAKFAST - nextLive[i] LEADS PAST USED-UP ACQUISITIONS, SO EACH IS
+    # STEPPED OVER ONCE NO MATTER HOW MANY DISPOSALS LOOK AT ITS 30 DAYS
+    acquisitionDates = [dates[row] for row in acquisitions]
+    nextLive = list(range(len(acquisitions) + 1))
+
+    def live(i):
+        root = i
+        while nextLive[root] != root:
+            root = nextLive[root]
+        while nextLive[i] != root:
+            nextLive[i], i = root, nextLive[i]
+        return root
+
+    for disposal in disposals:
+        if not remaining[disposal]:
+            continue
+        day = dates[disposal]
+        i = live(bisect_right(acquisitionDates, day))
+        last = bisect_right(acquisitionDates, day + BED_AND_BREAKFAST_DAYS)
+        while i < last and remaining[disposal]:
+            match(disposal, acquisitions[i], BED_AND_BREAKFAST)
+            if not remaining[acquisitions[i]]:
+                nextLive[i] = i + 1
+            i = live(i + 1)
+
+    # SECTION 104 POOL - WHAT IS LEFT OF EACH ACQUISITION JOINS IT, DISPOSALS TAKE FROM IT
+    # AT THE AVERAGE COST, A DAY'S DISPOSALS AS ONE (sold - THE POOL AS THE DAY FOUND IT)
+    poolQuantity = poolCost = 0
+    soldDay, sold = None, None
+    for row in rows:
+        quantity = remaining[row]
+        if not quantity:
+            continue
+        if actions[row] == BUY:
+            cost = days[dates[row]].take(quantity)
+            poolQuantity += quantity
+            poolCost += cost
+            results.poolRows.append(row)
+            results.poolEntryQuantities.append(quantity)
+            results.poolEntryCosts.append(cost)
+            continue
+        taken = min(quantity, poolQuantity)
+        if taken:
+            if dates[row] != soldDay:
+                soldDay, sold = dates[row], Lot(poolQuantity, poolCost)
+            cost = sold.take(taken)
+            poolQuantity -= taken
+            poolCost -= cost
+            matches[row].append((SECTION_104, NO_ROW, taken, cost))
+        if quantity > taken:
+            matches[row].append((UNMATCHED, NO_ROW, quantity - taken, 0))
+
+    proceeds = allowable = 0
+    for disposal in disposals:
+        value = tradeValue(quantities[disposal], prices[disposal]) - fees[disposal] * MONEY_SCALE // FEE_SCALE
+        cost = 0
+        for rule, acquisition, quantity, matchCost in matches[disposal]:
+            results.matchRules.append(rule)
+            results.matchRows.append(NO_ROW if rule >= SECTION_104 else acquisition)
+            results.matchQuantities.append(quantity)
+            results.matchCosts.append(matchCost)
+            cost += matchCost
+        results.disposalRows.append(disposal)
+        results.disposalProceeds.append(value)
+        results.disposalCosts.append(cost)
+        results.matchStarts.append(len(results.matchRules))
+        proceeds += value
+        allowable += cost
+
+    results.assets.append(tickerId)
+    results.poolQuantities.append(poolQuantity)
+    results.poolCosts.append(poolCost)
+    results.proceeds.append(proceeds)
+    results.allowableCosts.append(allowable)
+    results.disposalStarts.append(len(results.disposalRows))
+    results.poolStarts.append(len(results.poolRows))
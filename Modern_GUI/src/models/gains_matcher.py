@@ -0,0 +1,163 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Gains matcher - keeps the capital gains matching in step with the transactions
+##
+## ONE MATCHING RUN FOR EVERYTHING THAT SHOWS GAINS (HOLDINGS TREE, TOTALS FOOTER). IT RUNS
+## ON THE THREAD POOL ONCE AFTER EACH BURST OF CHANGES TO THE PortfolioModel - A RUN
+## OVERTAKEN BY ANOTHER CHANGE IS DROPPED. APPENDS AND EDITS ONLY MATCH THE ASSETS THEIR
+## CHANGE SETS TOUCHED AGAIN AND SPLICE THEM INTO THE RESULTS (rematched, A GainsUpdate);
+## A LOAD, A REMOVAL OR A NEW ASSET MATCHES EVERYTHING (matched, THE GainsResults)
+##
+################################################################################
+
+import sys
+import traceback
+from array import array
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from src import tracing
+from src.models.capital_gains import matchAssets, matchDisposals
+from src.models.portfolio_model import INSERTED, UPDATED
+
+
+# SIGNALS FOR A MATCHING RUN ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class MatchingSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+# assetRows (TICKER ID -> ITS ROWS) MATCHES ONLY THOSE ASSETS, None MATCHES THE FIRST rows ROWS
+class MatchingRunner(QRunnable):
+    def __init__(self, columns, rows, assetRows=None):
+        super().__init__()
+        self.columns = columns
+        self.rows = rows
+        self.assetRows = assetRows
+        self.results = None
+        self.signals = MatchingSignals()
+
+    def run(self):
+        try:
+            with tracing.span("matchDisposals", rows=self.rows):
+                if self.assetRows is None:
+                    self.results = matchDisposals(self.columns, self.rows)
+                else:
+                    self.results = matchAssets(self.columns, self.assetRows)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.finished.emit(self)
+
+
+# ASSETS MATCHED AGAIN AND SPLICED INTO results - THE DISPOSAL ROWS AND COSTS THEY HAD
+# BEFORE AND HAVE NOW, SO A VIEW CAN SWAP ONE FOR THE OTHER
+class GainsUpdate():
+    def __init__(self, results, assets, sameShape, oldRows, oldCosts, rows, costs):
+        self.results = results
+        self.assets = assets            # TICKER IDS
+        self.sameShape = sameShape      # NO ASSET GAINED OR LOST A DISPOSAL, POOL ENTRY OR MATCH
+        self.oldRows = oldRows
+        self.oldCosts = oldCosts
+        self.rows = rows
+        self.costs = costs
+
+
+class GainsMatcher(QObject):
+    matched = Signal(object)
+    rematched = Signal(object)
+
+    def __init__(self, portfolio, parent=None):
+        super().__init__(parent)
+        self.portfolio = portfolio
+        self.results = None
+        self.runner = None
+
+        # WHAT THE NEXT RUN MUST COVER - EVERY ASSET, OR THE ASSETS CHANGED SINCE THE RESULTS
+        self.matchAll = True
+        self.changedAssets = set()
+
+        # HELD WHILE AN IMPORT IS INSERTING BLOCKS - CHANGES ARE ONLY NOTED UNTIL release
+        self.held = False
+
+        # TRANSACTIONS ARRIVE IN BURSTS (ONE PER IMPORTED BLOCK) - MATCH ONCE AFTER THEM
+        self.matchTimer = QTimer(self)
+        self.matchTimer.setSingleShot(True)
+        self.matchTimer.timeout.connect(self.rematch)
+        portfolio.changed.connect(self.scheduleMatch)
+        self.rematch()
+
+    # A RUN ALREADY ON THE THREAD POOL IS NOW OUT OF DATE - FORGETTING IT DROPS ITS RESULTS
+    def scheduleMatch(self, change):
+        if change.kind == INSERTED or change.kind == UPDATED:
+            self.changedAssets |= change.assets
+        else:
+            self.matchAll = True
+        self.runner = None
+        if not self.held:
+            self.matchTimer.start(0)
+
+    def hold(self):
+        self.held = True
+
+    def release(self):
+        self.held = False
+        if self.matchAll or self.changedAssets or self.results is None:
+            self.matchTimer.start(0)
+
+    # TRUE UNTIL results MATCH THE MODEL'S CURRENT ROWS
+    def pending(self):
+        return self.held or self.runner is not None or self.matchTimer.isActive()
+
+    def rematch(self):
+        columns = self.portfolio.columns
+        assets = self.changedAssets
+        if self.results is not None and not assets.issubset(self.results.assets):
+            self.matchAll = True
+        # A CHANGE TOUCHING MOST OF THE ROWS (A BLOCK SPREAD OVER EVERY ASSET) IS QUICKER
+        # MATCHED AFRESH THAN SPLICED IN ASSET BY ASSET
+        if not (self.matchAll or self.results is None):
+            if not assets:
+                return
+            if sum(len(self.portfolio.assetRows(tickerId)) for tickerId in assets) * 2 > len(columns):
+                self.matchAll = True
+        if self.matchAll or self.results is None:
+            self.runner = MatchingRunner(columns, len(columns))
+        else:
+            # COPIES - THE PORTFOLIO KEEPS APPENDING TO ITS OWN ARRAYS
+            assetRows = {tickerId: array("I", self.portfolio.assetRows(tickerId)) for tickerId in assets}
+            self.runner = MatchingRunner(columns, sum(map(len, assetRows.values())), assetRows)
+        self.runner.signals.finished.connect(self.finished)
+        self.runner.signals.failed.connect(self.failed)
+        QThreadPool.globalInstance().start(self.runner)
+
+    def finished(self, runner):
+        if runner is not self.runner:
+            return
+        self.runner = None
+        self.changedAssets = set()
+        if runner.assetRows is None:
+            self.matchAll = False
+            self.results = runner.results
+            self.matched.emit(runner.results)
+        else:
+            self.rematched.emit(self.replaceAssets(runner.results))
+
+    def replaceAssets(self, partial):
+        results = self.results
+        oldRows, oldCosts = array("I"), array("q")
+        for tickerId in partial.assets:
+            asset = results.assets.index(tickerId)
+            first, end = results.disposalStarts[asset], results.disposalStarts[asset + 1]
+            oldRows.extend(results.disposalRows[first:end])
+            oldCosts.extend(results.disposalCosts[first:end])
+        with tracing.span("replaceAssets", assets=len(partial)):
+            sameShape = results.replaceAssets(partial)
+        return GainsUpdate(results, set(partial.assets), sameShape, oldRows, oldCosts,
+                           partial.disposalRows, partial.disposalCosts)
+
+    def failed(self, message):
+        self.runner = None
+        print(message, file=sys.stderr)
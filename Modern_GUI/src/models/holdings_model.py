@@ -0,0 +1,272 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Holdings model - assets, their Section 104 pool and disposal matches as a tree
+##
+## ASSET
+##   SECTION 104 POOL
+##     ACQUISITION LEFT IN THE POOL ...
+##   DISPOSAL ...
+##     MATCH (SAME DAY / BED & BREAKFAST / SECTION 104 / UNMATCHED) ...
+##
+## THE TREE SHOWS THE GainsMatcher'S LATEST RESULTS - ASSETS MATCHED AGAIN AFTER AN EDIT
+## ONLY REPAINT THE NODES MADE UNDER THEM, UNLESS THEIR ENTRIES CHANGED IN NUMBER (THEN
+## THE POSITIONS AFTER THEM MOVED AND THE TREE IS RESET). A NODE IS ITS KIND AND A POSITION IN
+## THE GainsResults ARRAYS (__slots__, NO __dict__) - EVERY VALUE SHOWN IS READ FROM THE
+## RESULTS WHEN THE VIEW ASKS. ROW COUNTS COME FROM THE START OFFSETS AND A NODE IS ONLY
+## MADE WHEN THE VIEW FIRST ASKS FOR ITS INDEX. QTreeView LAYS OUT EVERY CHILD OF A NODE IT
+## EXPANDS, SO MORE THAN Settings.HOLDINGS_GROUP_ROWS DISPOSALS (OR POOL ENTRIES) ARE SHOWN
+## IN RANGES OF THAT MANY - AN ASSET WITH 50K TRADES OPENS AS A FEW DOZEN RANGE ROWS
+##
+################################################################################
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from src.app_settings import Settings
+from src.models.capital_gains import MONEY_SCALE, NO_ROW, RULES
+from src.models.transaction_columns import QUANTITY_SCALE, formatFixed, formatOrdinal
+
+
+ROOT, ASSET, POOL, POOL_ENTRY, DISPOSAL, MATCH, RANGE = range(7)
+
+# EACH Qt.<ENUM> LOOKUP COSTS MICROSECONDS IN PySide6 - data() RUNS FOR EVERY ROLE OF
+# EVERY PAINTED CELL, SO IT COMPARES AGAINST THESE
+DISPLAY_ROLE, ALIGNMENT_ROLE = Qt.DisplayRole, Qt.TextAlignmentRole
+
+
+class Node():
+    __slots__ = ("parent", "kind", "position", "row", "children")
+
+    def __init__(self, parent, kind, position, row):
+        self.parent = parent
+        self.kind = kind
+        self.position = position    # INDEX INTO THE GainsResults ARRAYS FOR ITS KIND
+        self.row = row              # ROW UNDER ITS PARENT
+        self.children = None        # ROW -> Node OR None, ALLOCATED WHEN FIRST ASKED FOR
+
+
+class HoldingsTreeModel(QAbstractItemModel):
+    HEADERS = ("Holding", "Date", "Quantity", "Cost", "Proceeds", "Gain")
+    COLUMNS = len(HEADERS)
+
+    def __init__(self, matcher, parent=None):
+        super().__init__(parent)
+        self.matcher = matcher
+        self.groupRows = Settings.HOLDINGS_GROUP_ROWS
+        self.results = None
+        self.root = Node(None, ROOT, 0, 0)
+
+        left = Qt.AlignLeft | Qt.AlignVCenter
+        right = Qt.AlignRight | Qt.AlignVCenter
+        self.alignments = (left, left, right, right, right, right)
+
+        # ONE ROW OF TEXTS PER KIND - data() IS A TUPLE LOOKUP AND A CALL
+        self.texts = {
+            ASSET: self.assetTexts,
+            POOL: self.poolTexts,
+            POOL_ENTRY: self.poolEntryTexts,
+            DISPOSAL: self.disposalTexts,
+            MATCH: self.matchTexts,
+            RANGE: self.rangeTexts,
+        }
+        self.textsNode = None
+        self.rowTexts = ()
+
+        matcher.matched.connect(self.setResults)
+        matcher.rematched.connect(self.assetsRematched)
+        if matcher.results is not None:
+            self.setResults(matcher.results)
+
+    ## CLASS METHODS ==> RESULTS
+    ########################################################################
+    def setResults(self, results):
+        self.beginResetModel()
+        self.results = results
+        self.textsNode = None
+        self.root = Node(None, ROOT, 0, 0)
+        self.root.children = [Node(self.root, ASSET, asset, asset) for asset in range(len(results))]
+        self.endResetModel()
+
+    def assetsRematched(self, update):
+        if not update.sameShape or self.results is not update.results:
+            self.setResults(update.results)
+            return
+        self.textsNode = None
+        for tickerId in update.assets:
+            self.nodesChanged(self.root.children[self.results.assets.index(tickerId)])
+
+    # dataChanged FOR node AND EVERY NODE MADE BELOW IT - THE ONES NEVER ASKED FOR HAVE NOTHING
+    # TO REPAINT
+    def nodesChanged(self, node):
+        last = self.COLUMNS - 1
+        self.dataChanged.emit(self.createIndex(node.row, 0, node), self.createIndex(node.row, last, node))
+        pending = [node]
+        while pending:
+            parent = pending.pop()
+            children = [child for child in parent.children or () if child is not None]
+            if children:
+                first = min(child.row for child in children)
+                end = max(child.row for child in children)
+                self.dataChanged.emit(self.createIndex(first, 0, parent.children[first]),
+                                      self.createIndex(end, last, parent.children[end]))
+                pending.extend(children)
+
+    ## CLASS METHODS ==> TREE STRUCTURE
+    ########################################################################
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self.root
+
+    # (KIND, FIRST, END) OF THE RESULTS ENTRIES UNDER node, BEFORE ANY GROUPING INTO RANGES
+    def childSpan(self, node):
+        results, kind, position = self.results, node.kind, node.position
+        if kind == ASSET:
+            return DISPOSAL, results.disposalStarts[position], results.disposalStarts[position + 1]
+        if kind == POOL:
+            return POOL_ENTRY, results.poolStarts[position], results.poolStarts[position + 1]
+        if kind == DISPOSAL:
+            return MATCH, results.matchStarts[position], results.matchStarts[position + 1]
+        if kind == RANGE:
+            itemKind, first, end = self.childSpan(node.parent)
+            return itemKind, position, min(position + self.groupRows, end)
+        return None, 0, 0
+
+    # HOW MANY CHILDREN node HAS - KNOWN FROM THE START OFFSETS, NONE MADE
+    def childTotal(self, node):
+        if self.results is None:
+            return 0
+        if node.kind == ROOT:
+            return len(self.results)
+        itemKind, first, end = self.childSpan(node)
+        count = end - first
+        if count > self.groupRows and node.kind != RANGE:
+            count = -(-count // self.groupRows)
+        return count + 1 if node.kind == ASSET else count
+
+    # THE CHILD AT row OF node, MADE THE FIRST TIME THE VIEW ASKS FOR IT - AN ASSET'S POOL
+    # COMES BEFORE ITS DISPOSALS
+    def makeChild(self, node, row):
+        item = row
+        if node.kind == ASSET:
+            if row == 0:
+                child = node.children[row] = Node(node, POOL, node.position, row)
+                return child
+            item -= 1
+        itemKind, first, end = self.childSpan(node)
+        if end - first > self.groupRows and node.kind != RANGE:
+            child = Node(node, RANGE, first + item * self.groupRows, row)
+        else:
+            child = Node(node, itemKind, first + item, row)
+        node.children[row] = child
+        return child
+
+    # CALLED FOR EVERY CHILD WHEN A NODE IS EXPANDED - KEPT TO A FEW ATTRIBUTE LOOKUPS
+    def index(self, row, column, parent=QModelIndex()):
+        node = parent.internalPointer() if parent.isValid() else self.root
+        children = node.children
+        if children is None:
+            children = node.children = [None] * self.childTotal(node)
+        if not (0 <= row < len(children) and 0 <= column < self.COLUMNS):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row] or self.makeChild(node, row))
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self.childTotal(self.node(parent))
+
+    def columnCount(self, parent=QModelIndex()):
+        return self.COLUMNS
+
+    # AN ASSET ALWAYS HAS ITS POOL, A DISPOSAL AT LEAST ONE MATCH AND A RANGE ITS ENTRIES
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self.results is not None and len(self.results) > 0
+        if parent.column() > 0:
+            return False
+        kind = parent.internalPointer().kind
+        if kind == POOL:
+            return self.childTotal(parent.internalPointer()) > 0
+        return kind == DISPOSAL or kind == ASSET or kind == RANGE
+
+    ## CLASS METHODS ==> DATA
+    ########################################################################
+    def data(self, index, role=DISPLAY_ROLE):
+        if role == DISPLAY_ROLE:
+            # THE VIEW PAINTS A ROW CELL BY CELL - ITS TEXTS ARE MADE ONCE
+            node = index.internalPointer()
+            if node is not self.textsNode:
+                self.textsNode = node
+                self.rowTexts = self.texts[node.kind](node)
+            return self.rowTexts[index.column()]
+        if role == ALIGNMENT_ROLE:
+            return self.alignments[index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+        if role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.TextAlignmentRole:
+            return self.alignments[section]
+        return None
+
+    def assetTexts(self, node):
+        results, asset = self.results, node.position
+        return (results.columns.tickers[results.assets[asset]], "",
+                formatFixed(results.poolQuantities[asset], QUANTITY_SCALE, 0),
+                formatFixed(results.poolCosts[asset], MONEY_SCALE),
+                formatFixed(results.proceeds[asset], MONEY_SCALE),
+                formatFixed(results.gain(asset), MONEY_SCALE))
+
+    def poolTexts(self, node):
+        results, asset = self.results, node.position
+        return ("Section 104 pool", "",
+                formatFixed(results.poolQuantities[asset], QUANTITY_SCALE, 0),
+                formatFixed(results.poolCosts[asset], MONEY_SCALE), "", "")
+
+    def poolEntryTexts(self, node):
+        results, entry = self.results, node.position
+        return ("Acquisition", formatOrdinal(results.columns.dates[results.poolRows[entry]]),
+                formatFixed(results.poolEntryQuantities[entry], QUANTITY_SCALE, 0),
+                formatFixed(results.poolEntryCosts[entry], MONEY_SCALE), "", "")
+
+    def disposalTexts(self, node):
+        results, disposal = self.results, node.position
+        row = results.disposalRows[disposal]
+        columns = results.columns
+        return ("Disposal", formatOrdinal(columns.dates[row]),
+                formatFixed(columns.quantities[row], QUANTITY_SCALE, 0),
+                formatFixed(results.disposalCosts[disposal], MONEY_SCALE),
+                formatFixed(results.disposalProceeds[disposal], MONEY_SCALE),
+                formatFixed(results.disposalGain(disposal), MONEY_SCALE))
+
+    def matchTexts(self, node):
+        results, match = self.results, node.position
+        row = results.matchRows[match]
+        day = "" if row == NO_ROW else formatOrdinal(results.columns.dates[row])
+        return (RULES[results.matchRules[match]], day,
+                formatFixed(results.matchQuantities[match], QUANTITY_SCALE, 0),
+                formatFixed(results.matchCosts[match], MONEY_SCALE), "", "")
+
+    # "Disposals 1,001 - 2,000" WITH THE DATES THEY SPAN
+    def rangeTexts(self, node):
+        results = self.results
+        itemKind, start, end = self.childSpan(node)
+        itemKind, parentFirst, parentEnd = self.childSpan(node.parent)
+        if itemKind == DISPOSAL:
+            label, rows = "Disposals", results.disposalRows
+        else:
+            label, rows = "Acquisitions", results.poolRows
+        dates = results.columns.dates
+        return (f"{label} {start - parentFirst + 1:,} - {end - parentFirst:,}",
+                f"{formatOrdinal(dates[rows[start]])} - {formatOrdinal(dates[rows[end - 1]])}",
+                "", "", "", "")
@@ -0,0 +1,140 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Import index - what has been imported already, so a re-import adds only new rows
+##
+## EVERY ROW HAS A FINGERPRINT - THE FIRST 8 BYTES OF A blake2b OF ITS DATE, TICKER, ACTION,
+## QUANTITY, PRICE AND FEE PACKED AS FIXED-WIDTH LITTLE-ENDIAN INTEGERS (THE TICKER AS A
+## blake2b OF ITS TEXT), SO IT IS THE SAME IN EVERY RUN, PROCESS, BUILD AND PYTHON VERSION
+## (FINGERPRINT_VERSION CHANGES WITH IT). THE INDEX COUNTS THE ROWS HELD PER FINGERPRINT:
+## A FILE'S n-TH COPY OF A ROW IS NEW ONLY IF FEWER THAN n ARE HELD, SO AN OVERLAPPING
+## STATEMENT ADDS ITS NEW ROWS AND TWO GENUINELY IDENTICAL FILLS IN ONE FILE STAY TWO.
+## WHOLE FILES ARE KNOWN BY A blake2b DIGEST OF THEIR BYTES - A FILE WHOSE PATH, SIZE AND
+## MODIFICATION TIME MATCH AN EARLIER IMPORT IS SKIPPED WITHOUT BEING READ AT ALL
+##
+################################################################################
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+
+from src.models.transaction_columns import TransactionColumns
+
+
+DIGEST_CHUNK_BYTES = 1 << 20
+
+# STORED FINGERPRINTS WERE MADE BY AN OLDER VERSION OF fingerprints - A STORE WITH THEM IS
+# FINGERPRINTED AGAIN WHEN OPENED
+FINGERPRINT_VERSION = 1
+
+# DATE ORDINAL, TICKER CODE, ACTION, QUANTITY, PRICE, FEE
+ROW = struct.Struct("<iqBqqq")
+
+
+## FINGERPRINTS
+########################################################################
+def tickerCode(ticker):
+    return int.from_bytes(hashlib.blake2b(ticker.encode(), digest_size=8).digest(), "little", signed=True)
+
+
+def rowDigest(packed):
+    return hashlib.blake2b(packed, digest_size=8).digest()
+
+
+# THE DIGESTS JOINED ARE THE FINGERPRINTS' LITTLE-ENDIAN BYTES
+def fingerprints(columns):
+    codes = list(map(tickerCode, columns.tickers))
+    rows = map(ROW.pack, columns.dates, map(codes.__getitem__, columns.tickerIds), columns.actions,
+               columns.quantities, columns.prices, columns.fees)
+    keys = array("q", b"".join(map(rowDigest, rows)))
+    if sys.byteorder == "big":
+        keys.byteswap()
+    return keys
+
+
+def fileDigest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while data := file.read(DIGEST_CHUNK_BYTES):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+# WHAT ONE FILE'S IMPORT IS RECORDED AS
+class ImportedFile():
+    def __init__(self, digest, path, size, mtime, format=None, rows=0):
+        self.digest = digest
+        self.path = path
+        self.size = size
+        self.mtime = mtime          # st_mtime_ns
+        self.format = format
+        self.rows = rows            # ROWS IT ADDED
+
+
+## INDEX
+########################################################################
+# files - THE ImportedFile RECORDS SO FAR. loadCounts IS ONLY CALLED (ON THE IMPORT'S THREAD)
+# ONCE A FILE TURNS OUT TO BE NEW - A RE-IMPORT OF UNCHANGED FILES NEVER COUNTS THE ROWS
+class ImportIndex():
+    def __init__(self, files, loadCounts):
+        self.digests = {record.digest for record in files}
+        self.stats = {(record.path, record.size, record.mtime): record.digest for record in files}
+        self.loadCounts = loadCounts
+        self.counts = None
+
+    # (DIGEST, SIZE, MTIME) OF path - THE DIGEST IS ONLY COMPUTED IF THE STAT HAS NOT BEEN SEEN
+    def identify(self, path):
+        stat = os.stat(path)
+        digest = self.stats.get((path, stat.st_size, stat.st_mtime_ns))
+        return (digest or fileDigest(path)), stat.st_size, stat.st_mtime_ns
+
+    def known(self, digest):
+        return digest in self.digests
+
+    def fileFilter(self):
+        if self.counts is None:
+            self.counts = self.loadCounts()
+        return FileFilter(self.counts)
+
+
+# ONE FILE'S ROWS AGAINST THE INDEX - THE COPIES OF EACH FINGERPRINT SEEN SO FAR IN THE FILE
+class FileFilter():
+    def __init__(self, counts):
+        self.counts = counts
+        self.seen = Counter()
+        self.duplicates = 0
+
+    # block WITHOUT THE ROWS ALREADY HELD - THE COUNTS TAKE IN THE ROWS KEPT
+    def newRows(self, block, blockFingerprints=None):
+        keys = fingerprints(block) if blockFingerprints is None else blockFingerprints
+        counts, seen = self.counts, self.seen
+        if counts.keys().isdisjoint(keys):
+            seen.update(keys)
+            counts.update(keys)
+            return block
+        keep = bytearray(len(keys))
+        for index, key in enumerate(keys):
+            seen[key] += 1
+            if seen[key] > counts.get(key, 0):
+                counts[key] += 1
+                keep[index] = 1
+        kept = keep.count(1)
+        self.duplicates += len(keys) - kept
+        return block if kept == len(keys) else selectRows(block, keep)
+
+
+def selectRows(block, keep):
+    selected = TransactionColumns()
+    selected.tickers, selected.tickerIndex = block.tickers, block.tickerIndex
+    for field in ("dates", "tickerIds", "actions", "quantities", "prices", "fees"):
+        column = getattr(block, field)
+        setattr(selected, field, array(column.typecode, compress(column, keep)))
+    return selected
+
+
+def fingerprintCounts(columns):
+    return Counter(fingerprints(columns))
@@ -0,0 +1,188 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Paged transaction model - a TransactionStore shown without loading it
+##
+## OPENING ONLY COUNTS THE ROWS. THE VIEW IS GIVEN STORE_BLOCK_ROWS MORE ROWS EACH TIME
+## IT SCROLLS TO THE END (canFetchMore / fetchMore) AND THEIR VALUES ARE READ IN BLOCKS
+## ON A WORKER THREAD - THE BLOCK ON SCREEN FIRST, THEN THE NEXT ONES IN THE DIRECTION
+## OF SCROLLING. AT MOST STORE_CACHE_BLOCKS STAY IN MEMORY, THE LEAST RECENTLY SHOWN
+## ARE DROPPED AND READ AGAIN IF THE VIEW RETURNS TO THEM
+##
+################################################################################
+
+import sys
+import traceback
+from collections import OrderedDict
+
+from PySide6.QtCore import QModelIndex, QObject, QRunnable, QThreadPool, Qt, Signal
+
+from src.app_settings import Settings
+from src.models.transaction_model import TransactionTableModel
+
+
+# SIGNALS FOR A BLOCK READ ON THE MODEL'S THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class BlockSignals(QObject):
+    loaded = Signal(object)
+    failed = Signal(object)
+
+
+class BlockLoader(QRunnable):
+    def __init__(self, store, block, first, count):
+        super().__init__()
+        self.store = store
+        self.block = block
+        self.first = first
+        self.count = count
+        self.columns = None
+        self.error = None
+        self.signals = BlockSignals()
+
+    def run(self):
+        try:
+            self.columns = self.store.readBlock(self.first, self.count)
+        except Exception:
+            self.error = traceback.format_exc()
+            self.signals.failed.emit(self)
+        else:
+            self.signals.loaded.emit(self)
+
+
+class PagedTransactionModel(TransactionTableModel):
+    def __init__(self, store, parent=None):
+        super().__init__(None, parent)
+        self.store = store
+        self.blockRows = Settings.STORE_BLOCK_ROWS
+        self.totalRows = store.rowCount()
+        self.fetchedRows = 0
+
+        # BLOCK NUMBER -> TransactionColumns, LEAST RECENTLY SHOWN FIRST
+        self.blocks = OrderedDict()
+        self.loaders = {}
+        self.shownBlock = -1
+        self.blankBlocks = set()        # ASKED FOR BEFORE THEY WERE READ - REPAINT WHEN THEY ARRIVE
+
+        # ONE READER - sqlite SERIALISES THE READS ANYWAY AND THE QUEUE STAYS IN PRIORITY ORDER
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.requestBlock(0, priority=1)
+
+    ## CLASS METHODS ==> MODEL INTERFACE
+    ########################################################################
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.fetchedRows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.fetchedRows < self.totalRows
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.blockRows, self.totalRows - self.fetchedRows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.fetchedRows, self.fetchedRows + count - 1)
+        self.fetchedRows += count
+        self.endInsertRows()
+
+        # THE BLOCK THE NEXT fetchMore WILL EXPOSE
+        self.requestBlock(self.fetchedRows // self.blockRows)
+
+    # A BLOCK NOT READ YET SHOWS EMPTY CELLS UNTIL blockLoaded REPAINTS THEM
+    def cellData(self, row, column, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole and role != self.RawValueRole:
+            return super().cellData(row, column, role)
+        block = row // self.blockRows
+        if block != self.shownBlock:
+            self.showBlock(block)
+        columns = self.blocks.get(block)
+        if columns is None:
+            self.blankBlocks.add(block)
+            return None
+        if role == self.RawValueRole:
+            return self.rawValue(columns, row - block * self.blockRows, column)
+        return self.formatters[column](columns, row - block * self.blockRows)
+
+    ## CLASS METHODS ==> BLOCKS
+    ########################################################################
+    def showBlock(self, block):
+        step = 1 if block >= self.shownBlock else -1
+        self.shownBlock = block
+        if block in self.blocks:
+            self.blocks.move_to_end(block)
+        else:
+            self.requestBlock(block, priority=1)
+        for ahead in range(1, Settings.STORE_PREFETCH_BLOCKS + 1):
+            self.requestBlock(block + step * ahead)
+
+    def requestBlock(self, block, priority=0):
+        first = block * self.blockRows
+        if block < 0 or first >= self.totalRows or block in self.blocks or block in self.loaders:
+            return
+        loader = BlockLoader(self.store, block, first, min(self.blockRows, self.totalRows - first))
+        loader.signals.loaded.connect(self.blockLoaded)
+        loader.signals.failed.connect(self.blockFailed)
+        self.loaders[block] = loader
+        self.pool.start(loader, priority)
+
+    def blockLoaded(self, loader):
+        # A LOADER STARTED BEFORE reload() IS NO LONGER IN self.loaders
+        if self.loaders.get(loader.block) is not loader:
+            return
+        del self.loaders[loader.block]
+        self.blocks[loader.block] = loader.columns
+        self.trackExtremes(loader.columns)
+        while len(self.blocks) > Settings.STORE_CACHE_BLOCKS:
+            self.blocks.popitem(last=False)
+
+        # A PREFETCHED BLOCK HAS NOT BEEN PAINTED - ONLY BLANK CELLS NEED A REPAINT
+        if loader.block not in self.blankBlocks:
+            return
+        self.blankBlocks.discard(loader.block)
+        first = loader.first
+        last = min(first + loader.count, self.fetchedRows) - 1
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1),
+                                  [Qt.DisplayRole])
+
+    def blockFailed(self, loader):
+        if self.loaders.get(loader.block) is loader:
+            del self.loaders[loader.block]
+        print(loader.error, file=sys.stderr)
+
+    def tickerNames(self):
+        return self.store.tickers
+
+    ## CLASS METHODS ==> STORE CHANGES
+    ########################################################################
+    # ROWS WERE APPENDED TO THE STORE - THE LAST BLOCK MAY HAVE GROWN, THE REST ARE UNCHANGED.
+    # A VIEW ALREADY SHOWING EVERY ROW IS GIVEN THE NEW ONES (IT HAS NO END LEFT TO SCROLL TO),
+    # AND THE ROWS IT SHOWS OF THE OLD LAST BLOCK ARE READ AGAIN AND REPAINTED
+    def refresh(self):
+        lastBlock = (self.totalRows - 1) // self.blockRows
+        showingAll = self.fetchedRows == self.totalRows
+        self.totalRows = self.store.rowCount()
+        self.blocks.pop(lastBlock, None)
+        self.loaders.pop(lastBlock, None)
+        if showingAll:
+            self.fetchMore()
+        first = lastBlock * self.blockRows
+        last = min(first + self.blockRows, self.fetchedRows) - 1
+        if lastBlock >= 0 and first <= last:
+            self.blankBlocks.add(lastBlock)
+            self.requestBlock(lastBlock, priority=1)
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1), [Qt.DisplayRole])
+
+    # THE STORE WAS REPLACED OR CLEARED - START AGAIN FROM THE FIRST BLOCK
+    def reload(self):
+        self.beginResetModel()
+        self.totalRows = self.store.rowCount()
+        self.fetchedRows = 0
+        self.blocks.clear()
+        self.loaders.clear()
+        self.blankBlocks.clear()
+        self.extremes = {}
+        self.shownBlock = -1
+        self.endResetModel()
+        self.requestBlock(0, priority=1)
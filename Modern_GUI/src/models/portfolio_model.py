@@ -0,0 +1,150 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Portfolio model - the one copy of the transactions every view shares
+##
+## THE TABLE, THE TOTALS, THE GAINS MATCHING, THE HOLDINGS TREE AND THE SEARCH INDEX ALL
+## READ THE SAME TransactionColumns. EVERY CHANGE GOES THROUGH THIS MODEL, WHICH PUBLISHES
+## IT AS A ChangeSet - WHICH ROWS WERE INSERTED, UPDATED OR REMOVED, WHICH FIELDS AN UPDATE
+## WROTE (WITH THE VALUES IT REPLACED) AND WHICH ASSETS THE ROWS BELONG TO - SO EACH VIEW
+## CATCHES UP WITH THE ROWS THAT CHANGED INSTEAD OF STARTING AGAIN. aboutToChange COMES
+## BEFORE THE COLUMNS ARE TOUCHED (FOR Qt'S begin... CALLS), changed AFTER
+##
+################################################################################
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import compress
+
+from PySide6.QtCore import QObject, Signal
+
+from src import tracing
+from src.models.transaction_columns import TransactionColumns
+
+
+INSERTED, UPDATED, REMOVED, RESET = range(4)
+FIELDS = ("dates", "tickerIds", "actions", "quantities", "prices", "fees")
+
+
+class ChangeSet():
+    def __init__(self, kind, rows, assets, fields=FIELDS, before=None):
+        self.kind = kind
+        self.rows = rows            # ASCENDING SOURCE ROWS - A range FOR INSERTED / REMOVED
+        self.assets = assets        # TICKER IDS WHOSE ROWS CHANGED (BEFORE AND AFTER AN UPDATE)
+        self.fields = fields        # FIELDS WRITTEN - EVERY FIELD UNLESS UPDATED
+        self.before = before        # UPDATED: FIELD -> array OF THE VALUES THE ROWS HAD
+
+    def __len__(self):
+        return len(self.rows)
+
+    # FIRST AND LAST ROW - ONE Qt SIGNAL COVERS THE CHANGE
+    def span(self):
+        return (self.rows[0], self.rows[-1]) if len(self.rows) else (0, -1)
+
+
+class PortfolioModel(QObject):
+    aboutToChange = Signal(object)
+    changed = Signal(object)
+
+    def __init__(self, columns=None, parent=None):
+        super().__init__(parent)
+        self.columns = columns if columns is not None else TransactionColumns()
+
+        # TICKER ID -> ASCENDING array("I") OF ITS ROWS, BUILT WHEN FIRST ASKED FOR AND THEN
+        # KEPT UP TO DATE BY EACH CHANGE
+        self.assetIndex = None
+
+    def __len__(self):
+        return len(self.columns)
+
+    ## CLASS METHODS ==> ROWS BY ASSET
+    ########################################################################
+    def assetRows(self, tickerId):
+        if self.assetIndex is None:
+            with tracing.span("assetIndex", rows=len(self.columns)):
+                self.assetIndex = self.groupRows(range(len(self.columns)))
+        rows = self.assetIndex
+        return rows[tickerId] if tickerId < len(rows) else array("I")
+
+    # ASCENDING rows GROUPED BY TICKER ID
+    def groupRows(self, rows):
+        groups = [array("I") for ticker in self.columns.tickers]
+        appends = [group.append for group in groups]
+        tickerIds = self.columns.tickerIds
+        for row in rows:
+            appends[tickerIds[row]](row)
+        return groups
+
+    def assetsOf(self, rows):
+        return set(map(self.columns.tickerIds.__getitem__, rows))
+
+    ## CLASS METHODS ==> CHANGE THE ROWS
+    ########################################################################
+    def setColumns(self, columns):
+        change = ChangeSet(RESET, range(len(columns)), set(range(len(columns.tickers))))
+        self.aboutToChange.emit(change)
+        self.columns = columns
+        self.assetIndex = None
+        self.changed.emit(change)
+
+    # APPEND A BLOCK OF ROWS (ANOTHER TransactionColumns) AS ONE INSERT
+    def appendColumns(self, other):
+        if not len(other):
+            return
+        first = len(self.columns)
+        rows = range(first, first + len(other))
+        change = ChangeSet(INSERTED, rows, set())
+        self.aboutToChange.emit(change)
+        self.columns.extendColumns(other)
+        change.assets = self.assetsOf(rows)
+        if self.assetIndex is not None:
+            self.assetIndex.extend(array("I") for ticker in self.columns.tickers[len(self.assetIndex):])
+            for tickerId, group in enumerate(self.groupRows(rows)):
+                self.assetIndex[tickerId].extend(group)
+        self.changed.emit(change)
+
+    # WRITE values (FIELD -> ONE STORED VALUE PER ROW) TO THE ASCENDING rows
+    def updateRows(self, rows, values):
+        rows = array("I", rows)
+        fields = tuple(field for field in FIELDS if field in values)
+        columns = self.columns
+        before = {field: array(getattr(columns, field).typecode, map(getattr(columns, field).__getitem__, rows))
+                  for field in fields}
+        change = ChangeSet(UPDATED, rows, self.assetsOf(rows), fields, before)
+        self.aboutToChange.emit(change)
+        for field in fields:
+            deque(map(getattr(columns, field).__setitem__, rows, values[field]), maxlen=0)
+        if "tickerIds" in fields:
+            change.assets |= self.assetsOf(rows)
+            self.moveAssetRows(rows, before["tickerIds"])
+        self.changed.emit(change)
+
+    # ROWS first..end - 1 - THE ROWS AFTER THEM MOVE UP. THE COLUMNS ARE REPLACED, NOT CUT IN
+    # PLACE - A RUN ON THE THREAD POOL MAY STILL BE READING THE OLD ONES
+    def removeRows(self, first, end):
+        if end <= first:
+            return
+        rows = range(first, end)
+        change = ChangeSet(REMOVED, rows, self.assetsOf(rows))
+        self.aboutToChange.emit(change)
+        columns = TransactionColumns()
+        columns.tickers, columns.tickerIndex = self.columns.tickers, self.columns.tickerIndex
+        for field in FIELDS:
+            column = getattr(self.columns, field)
+            setattr(columns, field, column[:first] + column[end:])
+        self.columns = columns
+        self.assetIndex = None
+        self.changed.emit(change)
+
+    # UPDATED ROWS WHOSE TICKER CHANGED LEAVE ONE ASSET'S ROWS FOR ANOTHER'S
+    def moveAssetRows(self, rows, oldIds):
+        if self.assetIndex is None:
+            return
+        index = self.assetIndex
+        index.extend(array("I") for ticker in self.columns.tickers[len(index):])
+        newIds = self.columns.tickerIds
+        for row, oldId in compress(zip(rows, oldIds), map(int.__ne__, oldIds, map(newIds.__getitem__, rows))):
+            old, new = index[oldId], index[newIds[row]]
+            del old[bisect_left(old, row)]
+            new.insert(bisect_left(new, row), row)
@@ -0,0 +1,345 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Search index - live text search over the transaction table
+##
+## EVERY SEARCHABLE FIELD IS INTERNED (EACH DISTINCT TEXT STORED ONCE, ROWS HOLD ITS ID),
+## SO THE TRIGRAM INDEX COVERS THE DISTINCT TEXTS, NOT THE ROWS. BESIDE IT EACH TEXT
+## KEEPS THE ASCENDING array OF ROWS USING IT. A SEARCH LOOKS THE TERM UP AMONG THE
+## TEXTS AND RETURNS THEIR ROW ARRAYS - ONE MATCHING TEXT IS A COPY OF ITS ARRAY, WITH NO
+## PASS OVER THE TABLE. THE INDEX IS BUILT ON THE THREAD POOL AFTER A LOAD AND KEPT UP
+## TO DATE FROM THE PortfolioModel'S CHANGE SETS - APPENDED ROWS ARE ADDED, AN EDITED ROW
+## MOVES FROM ITS OLD TEXT'S ARRAY TO ITS NEW ONE. THE SEARCH BOX SEARCHES ON THE THREAD POOL
+## TOO (searchLater): THE GUI THREAD ONLY CACHES THE TERMS MATCHED AND HANDS ON THE ROWS, AND
+## A SEARCH THAT RAN WHILE THE INDEX CHANGED IS RUN AGAIN
+##
+################################################################################
+
+import sys
+import traceback
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import chain, compress
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src import tracing
+from src.models.portfolio_model import INSERTED, UPDATED
+from src.models.transaction_columns import ACTIONS
+from src.models.transaction_proxy import rowMask
+
+
+# THE SEARCHABLE FIELDS OF A TransactionColumns - (DISTINCT TEXTS, PER-ROW TEXT IDS)
+SEARCH_FIELDS = ("tickerIds", "actions")
+
+
+def searchFields(columns):
+    return ((columns.tickers, columns.tickerIds), (ACTIONS, columns.actions))
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex():
+    def __init__(self):
+        self.texts = []             # TEXT ID -> casefolded TEXT
+        self.postings = {}          # TRIGRAM -> set OF TEXT IDS
+
+    def add(self, text):
+        textId = len(self.texts)
+        text = text.casefold()
+        self.texts.append(text)
+        for gram in trigrams(text):
+            self.postings.setdefault(gram, set()).add(textId)
+        return textId
+
+    # TEXT IDS CONTAINING term - TERMS SHORTER THAN A TRIGRAM CHECK EVERY DISTINCT TEXT
+    def search(self, term):
+        term = term.casefold()
+        if len(term) < 3:
+            return [textId for textId, text in enumerate(self.texts) if term in text]
+        postings = sorted((self.postings.get(gram, set()) for gram in trigrams(term)), key=len)
+        candidates = set.intersection(*postings) if postings[0] else set()
+        return [textId for textId in candidates if term in self.texts[textId]]
+
+
+# ONE FIELD - ITS TRIGRAM INDEX AND THE ROWS OF EACH TEXT
+class FieldIndex():
+    def __init__(self):
+        self.trigrams = TrigramIndex()
+        self.rows = []              # TEXT ID -> array("I") OF ROWS, ASCENDING
+
+    def addTexts(self, texts):
+        for text in texts[len(self.trigrams.texts):]:
+            self.trigrams.add(text)
+            self.rows.append(array("I"))
+
+    def addRows(self, ids, first, last):
+        appends = [rows.append for rows in self.rows]
+        for row, textId in enumerate(ids[first:last], first):
+            appends[textId](row)
+
+    # rows NOW HAVE THE TEXTS ids[row] INSTEAD OF oldIds
+    def moveRows(self, ids, rows, oldIds):
+        for row, oldId in zip(rows, oldIds):
+            newId = ids[row]
+            if newId != oldId:
+                old, new = self.rows[oldId], self.rows[newId]
+                del old[bisect_left(old, row)]
+                new.insert(bisect_left(new, row), row)
+
+
+class SearchState():
+    def __init__(self, columns, cacheSize=64):
+        self.fields = [FieldIndex() for field in searchFields(columns)]
+        self.rowCount = 0
+        self.generation = 0         # COUNT OF CHANGES - A SEARCH STARTED BEFORE ONE IS STALE
+
+        # TERM -> MATCHES, LEAST RECENTLY USED FIRST - THE EARLIER WORDS OF A QUERY ARE SEARCHED
+        # AGAIN ON EVERY KEYSTROKE, AND BACKSPACE RETURNS TO TERMS ALREADY SEARCHED
+        self.termCache = OrderedDict()
+        self.cacheSize = cacheSize
+
+    # INDEX ROWS self.rowCount TO rows - 1 (AND ANY NEW TEXTS THEY USE)
+    def extend(self, columns, rows):
+        for index, (texts, ids) in zip(self.fields, searchFields(columns)):
+            index.addTexts(texts)
+            index.addRows(ids, self.rowCount, rows)
+        self.rowCount = rows
+        self.generation += 1
+        self.termCache.clear()
+
+    def update(self, columns, change):
+        for index, (texts, ids), field in zip(self.fields, searchFields(columns), SEARCH_FIELDS):
+            if field in change.fields:
+                index.addTexts(texts)
+                index.moveRows(ids, change.rows, change.before[field])
+        self.generation += 1
+        self.termCache.clear()
+
+    # TERMS A SEARCH MATCHED OR FOUND CACHED - ON THE GUI THREAD, SO A SEARCH ON THE THREAD
+    # POOL NEVER WRITES THE CACHE
+    def cacheMatches(self, matches):
+        cache = self.termCache
+        for term, match in matches.items():
+            cache[term] = match
+            cache.move_to_end(term)
+        while len(cache) > self.cacheSize:
+            cache.popitem(last=False)
+
+
+# SIGNALS FOR AN INDEX BUILT ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class IndexSignals(QObject):
+    built = Signal(object)
+    failed = Signal(str)
+
+
+class IndexBuilder(QRunnable):
+    def __init__(self, columns, rows):
+        super().__init__()
+        self.columns = columns
+        self.rows = rows
+        self.state = None
+        self.signals = IndexSignals()
+
+    def run(self):
+        try:
+            with tracing.span("buildSearchIndex", rows=self.rows):
+                self.state = SearchState(self.columns)
+                self.state.extend(self.columns, self.rows)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.built.emit(self)
+
+
+# SIGNALS FOR A SEARCH ON THE THREAD POOL
+# ///////////////////////////////////////////////////////////////
+class SearchSignals(QObject):
+    found = Signal(object)
+    failed = Signal(str)
+
+
+# matches - TERM -> MATCH OF EVERY TERM THE SEARCH USED, FOR THE GUI THREAD TO CACHE
+class SearchRunner(QRunnable):
+    def __init__(self, index, state, query):
+        super().__init__()
+        self.index = index
+        self.state = state
+        self.generation = state.generation
+        self.query = query
+        self.rows = None
+        self.matches = {}
+        self.signals = SearchSignals()
+
+    def run(self):
+        try:
+            self.rows = self.index.searchRows(self.state, self.query, self.matches)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.found.emit(self)
+
+
+class TransactionSearchIndex(QObject):
+    changed = Signal()
+    found = Signal(str, object)     # QUERY, ASCENDING ROWS
+
+    def __init__(self, portfolio, parent=None):
+        super().__init__(parent)
+        self.portfolio = portfolio
+        self.state = None
+        self.builder = None
+
+        # ONE SEARCH ON THE THREAD POOL AT A TIME - THE LATEST QUERY ASKED FOR WHILE IT RUNS
+        # IS SEARCHED NEXT, ANY BEFORE IT NEVER
+        self.runner = None
+        self.nextQuery = None
+        portfolio.changed.connect(self.portfolioChanged)
+        self.rebuild()
+
+    def isReady(self):
+        return self.state is not None
+
+    ## CLASS METHODS ==> BUILD
+    ########################################################################
+    # INDEX THE ROWS THERE ARE NOW ON THE THREAD POOL - ROWS APPENDED MEANWHILE ARE ADDED
+    # WHEN IT FINISHES
+    def rebuild(self):
+        self.state = None
+        columns = self.portfolio.columns
+        self.builder = IndexBuilder(columns, len(columns))
+        self.builder.signals.built.connect(self.built)
+        self.builder.signals.failed.connect(self.buildFailed)
+        QThreadPool.globalInstance().start(self.builder)
+
+    def built(self, builder):
+        # A BUILD STARTED BEFORE THE LATEST rebuild() IS OUT OF DATE
+        if builder is not self.builder or builder.columns is not self.portfolio.columns:
+            return
+        self.builder = None
+        self.state = builder.state
+        self.state.extend(self.portfolio.columns, len(self.portfolio.columns))
+        self.changed.emit()
+
+    def buildFailed(self, message):
+        self.builder = None
+        print(message, file=sys.stderr)
+
+    ## CLASS METHODS ==> CHANGES
+    ########################################################################
+    # AN EDIT DURING A BUILD MAY HAVE BEEN READ HALF WRITTEN - THAT BUILD STARTS AGAIN
+    def portfolioChanged(self, change):
+        if change.kind == INSERTED:
+            self.rowsInserted(change)
+        elif change.kind == UPDATED:
+            if not set(SEARCH_FIELDS).intersection(change.fields):
+                return
+            if self.state is None:
+                self.rebuild()
+                return
+            with tracing.span("indexEdits", rows=len(change)):
+                self.state.update(self.portfolio.columns, change)
+            self.changed.emit()
+        else:
+            self.rebuild()
+
+    def rowsInserted(self, change):
+        if self.state is None:
+            return
+        with tracing.span("indexRows", rows=len(change)):
+            self.state.extend(self.portfolio.columns, len(self.portfolio.columns))
+        self.changed.emit()
+
+    ## CLASS METHODS ==> SEARCH
+    ########################################################################
+    # ASCENDING ROWS CONTAINING EVERY WORD OF query IN ANY FIELD, None UNTIL THE INDEX IS BUILT
+    def search(self, query):
+        if self.state is None:
+            return None
+        matches = {}
+        rows = self.searchRows(self.state, query, matches)
+        self.state.cacheMatches(matches)
+        return rows
+
+    # search ON THE THREAD POOL - found CARRIES THE ROWS. UNTIL THE INDEX IS BUILT NOTHING IS
+    # SEARCHED (changed SAYS WHEN TO ASK AGAIN)
+    def searchLater(self, query):
+        if self.state is None:
+            return
+        if self.runner is not None:
+            self.nextQuery = query
+            return
+        self.runner = SearchRunner(self, self.state, query)
+        self.runner.signals.found.connect(self.searched)
+        self.runner.signals.failed.connect(self.searchFailed)
+        QThreadPool.globalInstance().start(self.runner)
+
+    def searched(self, runner):
+        if runner is not self.runner:
+            return
+        self.runner = None
+        query, self.nextQuery = self.nextQuery, None
+        if runner.state is not self.state or runner.generation != self.state.generation:
+            # THE INDEX CHANGED UNDER THE SEARCH - ITS ROWS MAY BE WRONG
+            self.searchLater(query or runner.query)
+            return
+        self.state.cacheMatches(runner.matches)
+        if query is not None and query != runner.query:
+            self.searchLater(query)
+            return
+        self.found.emit(runner.query, runner.rows)
+
+    def searchFailed(self, message):
+        self.runner = None
+        self.nextQuery = None
+        print(message, file=sys.stderr)
+
+    # query'S ROWS FROM state. READS THE TERM CACHE BUT NEVER WRITES IT - EVERY TERM USED GOES
+    # INTO matches
+    def searchRows(self, state, query, matches):
+        with tracing.span("search", query=query):
+            terms = sorted((self.termMatches(state, term, matches) for term in query.split()),
+                           key=lambda match: len(match[0]))
+            if not terms:
+                return array("I")
+            # A COPY (A memcpy) - THE INDEX KEEPS APPENDING TO ITS OWN ARRAYS
+            rows = array("I", terms[0][0])
+            fieldIds = [ids for texts, ids in searchFields(self.portfolio.columns)]
+            for other, lookups in terms[1:]:
+                if len(lookups) == 1:
+                    # THE WORD MATCHED ONE FIELD - CHECK EACH ROW'S TEXT ID, NO PASS OVER THE TABLE
+                    (field, lookup), = lookups.items()
+                    keep = map(lookup.__getitem__, map(fieldIds[field].__getitem__, rows))
+                else:
+                    keep = map(rowMask(other, state.rowCount).__getitem__, rows)
+                rows = array("I", compress(rows, keep))
+            return rows
+
+    # (ROWS, {FIELD: 0/1 BYTE PER TEXT ID}) FOR ONE WORD OF A QUERY
+    def termMatches(self, state, term, matches):
+        match = matches.get(term) or state.termCache.get(term)
+        if match is None:
+            match = self.matchTerm(state, term)
+        matches[term] = match
+        return match
+
+    def matchTerm(self, state, term):
+        pieces, lookups = [], {}
+        for field, index in enumerate(state.fields):
+            textIds = index.trigrams.search(term)
+            if textIds:
+                lookups[field] = bytes(map(set(textIds).__contains__, range(len(index.rows))))
+                pieces.append([index.rows[textId] for textId in textIds])
+        if not pieces:
+            return array("I"), lookups
+        if len(pieces) == 1:
+            # ONE FIELD - ITS TEXTS NEVER SHARE A ROW, SO THE ARRAYS ONLY NEED MERGING
+            arrays = pieces[0]
+            rows = arrays[0] if len(arrays) == 1 else array("I", sorted(chain.from_iterable(arrays)))
+        else:
+            rows = array("I", sorted(set(chain.from_iterable(chain.from_iterable(pieces)))))
+        return rows, lookups
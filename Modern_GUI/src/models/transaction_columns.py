@@ -0,0 +1,156 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction columns - broker history held as typed column arrays
+##
+## ONE array PER FIELD INSTEAD OF ONE OBJECT PER ROW OR CELL: A ROW COSTS 33 BYTES
+## (DATE 4, TICKER 4, ACTION 1, QUANTITY/PRICE/FEES 8 EACH) PLUS ONE SHARED STRING
+## PER DISTINCT TICKER. MONEY AND QUANTITIES ARE FIXED-POINT INTEGERS SO NO FLOAT
+## ROUNDING ENTERS THE TAX CALCULATIONS
+##
+################################################################################
+
+from array import array
+from datetime import date
+from decimal import ROUND_HALF_EVEN, Decimal
+
+
+# FIXED-POINT SCALES - A STORED INTEGER v MEANS v / SCALE
+# ///////////////////////////////////////////////////////////////
+QUANTITY_SCALE = 10_000      # 4 DP - FRACTIONAL SHARES
+PRICE_SCALE = 1_000_000      # 6 DP - UNIT PRICES
+FEE_SCALE = 100              # 2 DP - PENCE / CENTS
+
+ACTIONS = ("BUY", "SELL")
+BUY, SELL = range(len(ACTIONS))
+
+
+## CONVERSIONS
+########################################################################
+def toFixed(value, scale):
+    if isinstance(value, int):
+        return value * scale
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value).replace(",", "").strip() or "0")
+    return int((value * scale).to_integral_value(ROUND_HALF_EVEN))
+
+
+def fromFixed(value, scale):
+    return Decimal(value) / scale
+
+
+# INTEGER-ONLY FORMATTING - TRAILING ZEROS BEYOND minPlaces ARE DROPPED
+def formatFixed(value, scale, minPlaces=2):
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), scale)
+    places = len(str(scale)) - 1
+    digits = f"{fraction:0{places}d}".rstrip("0")
+    if len(digits) < minPlaces:
+        digits = digits.ljust(minPlaces, "0")
+    return f"{sign}{whole:,}.{digits}" if digits else f"{sign}{whole:,}"
+
+
+# DECIMAL PLACES formatFixed SHOWS FOR value BEFORE PADDING TO minPlaces
+def fractionPlaces(value, scale):
+    return len(f"{abs(value) % scale:0{len(str(scale)) - 1}d}".rstrip("0"))
+
+
+def toOrdinal(day):
+    if isinstance(day, int):
+        return day
+    if isinstance(day, str):
+        day = date.fromisoformat(day.strip())
+    return day.toordinal()
+
+
+def formatOrdinal(ordinal):
+    day = date.fromordinal(ordinal)
+    return f"{day.day:02d}/{day.month:02d}/{day.year}"
+
+
+def toAction(action):
+    if isinstance(action, int):
+        return action
+    return ACTIONS.index(action.strip().upper())
+
+
+class TransactionColumns():
+    def __init__(self):
+        self.dates = array("i")          # date.toordinal()
+        self.tickerIds = array("I")      # INDEX INTO self.tickers
+        self.actions = array("B")        # INDEX INTO ACTIONS
+        self.quantities = array("q")     # x QUANTITY_SCALE
+        self.prices = array("q")         # x PRICE_SCALE
+        self.fees = array("q")           # x FEE_SCALE
+
+        # INTERNED TICKERS - EACH DISTINCT STRING IS STORED ONCE
+        self.tickers = []
+        self.tickerIndex = {}
+
+    def __len__(self):
+        return len(self.dates)
+
+    def fields(self):
+        return (self.dates, self.tickerIds, self.actions, self.quantities, self.prices, self.fees)
+
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in self.fields())
+
+    def tickerId(self, ticker):
+        ticker = ticker.strip().upper()
+        tickerId = self.tickerIndex.get(ticker)
+        if tickerId is None:
+            tickerId = len(self.tickers)
+            self.tickers.append(ticker)
+            self.tickerIndex[ticker] = tickerId
+        return tickerId
+
+    ## CLASS METHODS ==> ADD ROWS
+    ########################################################################
+    def append(self, day, ticker, action, quantity, price, fee=0):
+        self.appendFixed(toOrdinal(day), self.tickerId(ticker), toAction(action),
+                         toFixed(quantity, QUANTITY_SCALE), toFixed(price, PRICE_SCALE),
+                         toFixed(fee, FEE_SCALE))
+
+    # ALREADY CONVERTED VALUES - THE FAST PATH FOR IMPORTERS
+    def appendFixed(self, ordinal, tickerId, action, quantity, price, fee):
+        self.dates.append(ordinal)
+        self.tickerIds.append(tickerId)
+        self.actions.append(action)
+        self.quantities.append(quantity)
+        self.prices.append(price)
+        self.fees.append(fee)
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(*row)
+
+    # APPEND ALL THE ROWS OF other, MAPPING ITS TICKER IDS ONTO THIS TABLE'S
+    def extendColumns(self, other):
+        mapping = [self.tickerId(ticker) for ticker in other.tickers]
+        if mapping == list(range(len(mapping))):
+            self.tickerIds.extend(other.tickerIds)
+        else:
+            self.tickerIds.extend(array("I", map(mapping.__getitem__, other.tickerIds)))
+        self.dates.extend(other.dates)
+        self.actions.extend(other.actions)
+        self.quantities.extend(other.quantities)
+        self.prices.extend(other.prices)
+        self.fees.extend(other.fees)
+
+    def clear(self):
+        for column in self.fields():
+            del column[:]
+        self.tickers = []
+        self.tickerIndex = {}
+
+    ## CLASS METHODS ==> READ ROWS
+    ########################################################################
+    def ticker(self, row):
+        return self.tickers[self.tickerIds[row]]
+
+    def row(self, row):
+        return (date.fromordinal(self.dates[row]), self.ticker(row), ACTIONS[self.actions[row]],
+                fromFixed(self.quantities[row], QUANTITY_SCALE),
+                fromFixed(self.prices[row], PRICE_SCALE),
+                fromFixed(self.fees[row], FEE_SCALE))
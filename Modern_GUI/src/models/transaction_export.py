@@ -0,0 +1,180 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction export - rows streamed to CSV on a worker thread
+##
+## ROWS ARE FORMATTED AND WRITTEN A CHUNK AT A TIME, STRAIGHT FROM THE COLUMN ARRAYS (OR
+## BLOCKS READ FROM THE STORE), SO MEMORY STAYS AT ONE CHUNK HOWEVER MANY ROWS ARE
+## EXPORTED. THE FILE IS WRITTEN UNDER A .part NAME AND ONLY RENAMED ONCE COMPLETE - A
+## CANCELLED OR FAILED EXPORT LEAVES NOTHING BEHIND. A COPY IS THE SAME EXPORT TO A
+## TEMPORARY FILE, PUT ON THE CLIPBOARD AS CsvFileMimeData: THE TEXT IS ONLY READ WHEN
+## SOMETHING IS PASTED
+##
+################################################################################
+
+import os
+import traceback
+from array import array
+from bisect import bisect_left
+from datetime import date
+from itertools import repeat
+from operator import sub
+
+from PySide6.QtCore import QMimeData, QObject, QRunnable, Signal
+
+from src import tracing
+from src.models.transaction_columns import (ACTIONS, FEE_SCALE, PRICE_SCALE, QUANTITY_SCALE,
+                                            formatFixed)
+
+
+HEADER = "Date,Ticker,Action,Quantity,Price,Fees\r\n"
+
+# DATES ARE MEMOISED (FEW DISTINCT DAYS) - DROPPED BEFORE A CHUNK ONCE THIS MANY ARE HELD,
+# SO THE MEMO CANNOT GROW WITH THE EXPORT
+MEMO_LIMIT = 65536
+
+
+## FORMATTING - EVERY STEP IS A map OVER THE CHUNK, PYTHON RUNS ONLY FOR A NEW DATE
+########################################################################
+class DateTexts(dict):
+    def __missing__(self, ordinal):
+        text = self[ordinal] = date.fromordinal(ordinal).isoformat()
+        return text
+
+
+# FIXED-POINT VALUES AS PLAIN DECIMALS, TRAILING ZEROS DROPPED ("1967.45", "15", "0.5") -
+# % FORMATS THE divmod, rstrip AND removesuffix TRIM IT. NEGATIVE VALUES (WHICH divmod
+# WOULD SPLIT WRONGLY) GO THROUGH formatFixed
+def fixedTexts(values, scale):
+    if values and min(values) < 0:
+        return [formatFixed(value, scale, 0).replace(",", "") for value in values]
+    pattern = f"%d.%0{len(str(scale)) - 1}d"
+    texts = map(pattern.__mod__, map(divmod, values, repeat(scale)))
+    return map(str.removesuffix, map(str.rstrip, texts, repeat("0")), repeat("."))
+
+
+def csvField(text):
+    if any(character in text for character in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+class CsvFormatter():
+    def __init__(self):
+        self.dates = DateTexts()
+        self.tickers = None
+        self.tickerTexts = []
+
+    # rows (POSITIONS IN columns) AS CSV LINES
+    def text(self, columns, rows):
+        if len(self.dates) > MEMO_LIMIT:
+            self.dates.clear()
+        if columns.tickers is not self.tickers or len(self.tickerTexts) != len(columns.tickers):
+            self.tickers = columns.tickers
+            self.tickerTexts = [csvField(ticker) for ticker in columns.tickers]
+
+        def values(field):
+            column = getattr(columns, field)
+            return array(column.typecode, map(column.__getitem__, rows))
+
+        fields = zip(
+            map(self.dates.__getitem__, values("dates")),
+            map(self.tickerTexts.__getitem__, values("tickerIds")),
+            map(ACTIONS.__getitem__, values("actions")),
+            fixedTexts(values("quantities"), QUANTITY_SCALE),
+            fixedTexts(values("prices"), PRICE_SCALE),
+            fixedTexts(values("fees"), FEE_SCALE),
+        )
+        return "".join(map("%s,%s,%s,%s,%s,%s\r\n".__mod__, fields))
+
+
+## CHUNKS - (TransactionColumns, ROWS IN IT) PAIRS OF AT MOST chunkRows ROWS
+########################################################################
+# rows IS ANY SEQUENCE OF ROWS OF columns (AN array, A range) IN THE ORDER TO WRITE THEM
+def columnChunks(columns, rows, chunkRows):
+    for start in range(0, len(rows), chunkRows):
+        yield columns, rows[start:start + chunkRows]
+
+
+# ASCENDING STORE ROWS - EACH CHUNK IS ONE readBlock SPANNING AT MOST chunkRows ROWS, SO A
+# SPARSE SELECTION NEVER READS THE GAPS BETWEEN ITS ROWS IN ONE GO
+def storeChunks(store, rows, chunkRows):
+    start = 0
+    while start < len(rows):
+        first = rows[start]
+        end = bisect_left(rows, first + chunkRows, start)
+        part = rows[start:end]
+        block = store.readBlock(first, part[-1] - first + 1)
+        yield block, array("I", map(sub, part, repeat(first)))
+        start = end
+
+
+# SIGNALS FOR AN EXPORT ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class ExportSignals(QObject):
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+class ExportRunner(QRunnable):
+    def __init__(self, chunks, total, path):
+        super().__init__()
+        self.chunks = chunks
+        self.total = total
+        self.path = path
+        self.written = 0
+        self.cancelled = False
+        self.error = None
+        self.signals = ExportSignals()
+
+    # SET FROM THE GUI THREAD, SEEN BEFORE THE NEXT CHUNK
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        partial = self.path + ".part"
+        try:
+            with tracing.span("exportRows", rows=self.total):
+                formatter = CsvFormatter()
+                with open(partial, "w", encoding="utf-8", newline="") as file:
+                    file.write(HEADER)
+                    for columns, rows in self.chunks:
+                        if self.cancelled:
+                            break
+                        file.write(formatter.text(columns, rows))
+                        self.written += len(rows)
+                        self.signals.progress.emit(self)
+            if self.cancelled:
+                os.remove(partial)
+            else:
+                os.replace(partial, self.path)
+        except Exception:
+            if os.path.exists(partial):
+                os.remove(partial)
+            self.error = traceback.format_exc()
+            self.signals.failed.emit(self)
+        else:
+            self.signals.finished.emit(self)
+
+
+# CLIPBOARD DATA BACKED BY AN EXPORTED FILE - NOTHING IS READ UNTIL A PASTE ASKS FOR IT
+class CsvFileMimeData(QMimeData):
+    FORMATS = ["text/csv", "text/plain"]
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def formats(self):
+        return self.FORMATS
+
+    def hasFormat(self, mimeType):
+        return mimeType in self.FORMATS
+
+    def retrieveData(self, mimeType, preferredType):
+        if mimeType not in self.FORMATS or not os.path.exists(self.path):
+            return None
+        with open(self.path, "rb") as file:
+            data = file.read()
+        return data.decode("utf-8") if mimeType == "text/plain" else data
@@ -0,0 +1,392 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction import - broker CSV exports streamed in on a worker thread
+##
+## A FILE'S FORMAT IS DETECTED FROM ITS FIRST FEW KB (broker_formats), THEN THE FILE GOES
+## THROUGH A CHAIN OF GENERATORS ONE CHUNK AT A TIME: mappedChunks (SLICES OF THE MEMORY-MAPPED
+## FILE CUT AT A LINE BREAK) -> mappedBlocks (A CHUNK OF PLAIN RECORDS IS SPLIT ON THE
+## DELIMITER IN ONE CALL AND ONLY THE COLUMNS THE FORMAT'S ColumnMapper READS ARE SLICED OUT;
+## THE MAPPER TURNS THEM INTO A TransactionColumns BLOCK, BAD ROWS SET ASIDE WITH THEIR LINE
+## AND REASON) -> ONE BULK INSERT PER BLOCK. A CHUNK WITH QUOTES, BLANK LINES OR RAGGED ROWS
+## GOES THROUGH THE csv MODULE INSTEAD (parseText), AS DOES A FILE THAT CANNOT BE MAPPED:
+## readChunks -> parseChunks (csv ROWS) -> convertChunks. THE WORKER WAITS WHILE
+## Settings.IMPORT_QUEUE_BLOCKS BLOCKS ARE STILL TO BE INSERTED, SO MEMORY STAYS AT A FEW
+## CHUNKS HOWEVER LARGE THE FILE.
+##
+## SEVERAL FILES (A YEAR OF MONTHLY STATEMENTS) ARE PARSED AT ONCE IN WORKER PROCESSES INSTEAD,
+## ONE FILE EACH (parseFile). A WORKER SENDS BACK THE FILE'S TransactionColumns, WHOSE arrays
+## PICKLE AS THEIR RAW BUFFERS - NO ROW OBJECTS CROSS THE PIPE - AND THE FILES ARE MERGED IN
+## THE ORDER GIVEN INTO ONE BLOCK FOR ONE BULK INSERT.
+##
+## WITH AN import_index, FILES IMPORTED BEFORE ARE SKIPPED UNREAD AND EACH BLOCK LOSES THE ROWS
+## ALREADY HELD BEFORE IT IS INSERTED
+##
+################################################################################
+
+import csv
+import io
+import mmap
+import multiprocessing
+import os
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import repeat
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from src import tracing
+from src.models.broker_formats import detectFormat
+from src.models.import_index import ImportedFile, fingerprints
+from src.models.transaction_columns import TransactionColumns
+
+
+## PIPELINE
+########################################################################
+# RAW BYTES, EACH CHUNK ENDING ON A LINE BREAK THAT IS NOT INSIDE A QUOTED FIELD
+def readChunks(file, chunkBytes):
+    carry = b""
+    while True:
+        data = file.read(chunkBytes)
+        if not data:
+            if carry:
+                yield carry
+            return
+        data = carry + data
+        end = data.rfind(b"\n") + 1
+        # AN ODD NUMBER OF QUOTES BEFORE THE BREAK - IT IS INSIDE A FIELD, TRY THE ONE BEFORE
+        while end and data.count(b'"', 0, end) % 2:
+            end = data.rfind(b"\n", 0, end - 1) + 1
+        carry = data[end:]
+        if end:
+            yield data[:end]
+
+
+# (LINE NUMBERS, ROWS) PER CHUNK - A BYTE ORDER MARK AND BLANK LINES ARE DROPPED
+def parseChunks(chunks, delimiter=","):
+    line = 1
+    for chunk in chunks:
+        text = chunk.decode("utf-8-sig" if line == 1 else "utf-8", errors="replace")
+        yield parseText(text, chunk, line, delimiter)
+        line += chunk.count(b"\n")
+
+
+# ONLY A CHUNK WITH BLANK LINES OR LINE BREAKS INSIDE QUOTES IS NUMBERED ROW BY ROW
+def parseText(text, chunk, line, delimiter):
+    rows = list(csv.reader(io.StringIO(text), delimiter=delimiter))
+    if len(rows) == chunk.count(b"\n") + (not chunk.endswith(b"\n")) and all(rows):
+        return range(line, line + len(rows)), rows
+    return numberedRows(text, line, delimiter)
+
+
+def numberedRows(text, line, delimiter):
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+    lines, rows, start = [], [], line
+    for row in reader:
+        if row:
+            lines.append(start)
+            rows.append(row)
+        start = line + reader.line_num
+    return lines, rows
+
+
+# A TransactionColumns OF THE GOOD ROWS OF EACH CHUNK - THE HEADER (FIRST ROW) IS SKIPPED,
+# mapper WAS COMPILED FOR IT
+def convertChunks(parsed, mapper, reject):
+    header = True
+    for lines, rows in parsed:
+        if header and rows:
+            header = False
+            lines, rows = lines[1:], rows[1:]
+        yield mapper.convert(lines, rows, reject)
+
+
+## MEMORY-MAPPED FILES
+########################################################################
+# THE FILE'S BLOCKS - counted SEES THE CHUNKS. A FILE mmap REFUSES (EMPTY, NOT A REGULAR FILE)
+# IS STREAMED
+def fileBlocks(file, chunkBytes, mapper, reject, counted=iter):
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return convertChunks(parseChunks(counted(readChunks(file, chunkBytes)), mapper.delimiter), mapper, reject)
+    return mappedBlocks(counted(mappedChunks(mapped, chunkBytes)), mapper, reject)
+
+
+# THE RECORDS AFTER THE HEADER, EACH CHUNK ONE SLICE (ONE COPY) OF THE MAPPING ENDING ON A LINE
+# BREAK THAT IS NOT INSIDE A QUOTED FIELD. THE BREAKS ARE FOUND BY mmap.rfind, NOT BY READING
+def mappedChunks(mapped, chunkBytes):
+    with mapped:
+        start = mapped.find(b"\n") + 1 or len(mapped)
+        while start < len(mapped):
+            end = recordEnd(mapped, start, start + chunkBytes)
+            yield mapped[start:end]
+            start = end
+
+
+# THE END OF THE LAST WHOLE RECORD BEFORE limit - THE SEARCH WIDENS UNTIL THERE IS ONE
+def recordEnd(mapped, start, limit):
+    while limit < len(mapped):
+        end = mapped.rfind(b"\n", start, limit) + 1
+        # AN ODD NUMBER OF QUOTES BEFORE THE BREAK - IT IS INSIDE A FIELD, TRY THE ONE BEFORE
+        if end and mapped.find(b'"', start, end) != -1:
+            data = mapped[start:end]
+            cut = len(data)
+            while cut and data.count(b'"', 0, cut) % 2:
+                cut = data.rfind(b"\n", 0, cut - 1) + 1
+            end = start + cut
+        if end > start:
+            return end
+        limit += limit - start
+    return len(mapped)
+
+
+# A TransactionColumns OF THE GOOD ROWS OF EACH CHUNK OF RECORDS (THE HEADER IS NOT IN THEM)
+def mappedBlocks(chunks, mapper, reject):
+    line = 2
+    for chunk in chunks:
+        text = chunk.decode("utf-8", errors="replace")
+        cells = splitColumns(text, mapper.delimiter, mapper.needed)
+        if cells is None:
+            lines, cells = mapper.cells(*parseText(text, chunk, line, mapper.delimiter), reject)
+        else:
+            lines = range(line, line + len(cells[mapper.needed[0]]))
+        yield mapper.convertCells(lines, cells, reject)
+        line += chunk.count(b"\n")
+
+
+# POSITION -> CELL TEXTS OF THE needed COLUMNS OF text, OR None UNLESS EVERY LINE IS ONE RECORD
+# WITH THE FIRST LINE'S NUMBER OF CELLS AND NO QUOTES. THE WHOLE TEXT IS SPLIT ON THE DELIMITER
+# ONLY: A LINE'S LAST CELL AND THE NEXT LINE'S FIRST THEN SHARE AN "EDGE" CELL AND EVERY OTHER
+# COLUMN IS A SLICE WITH A STEP OF (CELLS PER RECORD - 1). EACH OF THE n RECORDS ENDS IN ONE
+# EDGE, SO n EDGES EACH HOLDING A LINE BREAK, AND NO MORE BREAKS THAN n, PROVE THE LINES LINE UP
+def splitColumns(text, delimiter, needed):
+    if '"' in text:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    if not text.endswith("\n"):
+        text += "\n"
+    records = text.count("\n")
+    step = text.count(delimiter, 0, text.find("\n"))
+    if step < needed[-1]:
+        return None
+    cells = text.split(delimiter)
+    edges = cells[step::step]
+    if len(cells) != step * records + 1 or not all(map(str.__contains__, edges, repeat("\n"))):
+        return None
+    columns = {}
+    for position in needed:
+        if position == 0:
+            columns[position] = cells[:1] + "\n".join(edges[:-1]).split("\n")[1::2]
+        elif position == step:
+            columns[position] = "\n".join(edges).split("\n")[::2]
+        else:
+            columns[position] = cells[position::step]
+    return columns
+
+
+## WORKER PROCESSES
+########################################################################
+# ONE FILE'S ROWS AND REJECTS, AS A WORKER PROCESS SENDS THEM BACK
+class ParsedFile():
+    def __init__(self, path, rejectLimit):
+        self.path = path
+        self.rejectLimit = rejectLimit
+        self.format = None
+        self.columns = TransactionColumns()
+        self.size = os.path.getsize(path)
+        self.rejected = 0
+        self.rejects = []
+        self.fingerprints = None
+
+    def reject(self, line, reason):
+        self.rejected += 1
+        if len(self.rejects) < self.rejectLimit:
+            self.rejects.append((self.path, line, reason))
+
+
+# RUNS IN A WORKER PROCESS - THE SAME PIPELINE, THE BLOCKS KEPT INSTEAD OF INSERTED AND THE
+# ROWS FINGERPRINTED HERE RATHER THAN IN THE MERGE
+def parseFile(path, chunkBytes, rejectLimit):
+    parsed = ParsedFile(path, rejectLimit)
+    with open(path, "rb") as file:
+        mapper = detectFormat(file)
+        parsed.format = mapper.format.name
+        for block in fileBlocks(file, chunkBytes, mapper, parsed.reject):
+            parsed.columns.extendColumns(block)
+    parsed.fingerprints = fingerprints(parsed.columns)
+    return parsed
+
+
+# SIGNALS FOR AN IMPORT ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class ImportSignals(QObject):
+    block = Signal(object, object)
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(object)
+
+
+# WITHOUT A store EACH BLOCK IS HANDED TO THE GUI THREAD (block) TO INSERT, AND THE GUI CALLS
+# blockInserted ONCE IT HAS; WITH ONE THE WORKER APPENDS TO IT DIRECTLY. MORE THAN ONE FILE
+# AND processes ABOVE 1 - THE FILES ARE PARSED IN UP TO processes WORKER PROCESSES. index (AN
+# ImportIndex) LEAVES OUT WHAT IS ALREADY HELD; imported LISTS THE FILES FOR IT TO RECORD
+class ImportRunner(QRunnable):
+    def __init__(self, paths, chunkBytes, queueBlocks, rejectLimit, store=None, processes=1, index=None):
+        super().__init__()
+        self.paths = paths
+        self.chunkBytes = chunkBytes
+        self.rejectLimit = rejectLimit
+        self.store = store
+        self.processes = min(processes, len(paths))
+        self.index = index
+        self.total = sum(os.path.getsize(path) for path in paths)
+        self.read = 0                   # BYTES
+        self.rows = 0                   # ROWS INSERTED
+        self.rejected = 0
+        self.rejects = []               # (PATH, LINE, REASON) OF THE FIRST rejectLimit
+        self.formats = {}               # PATH -> BROKER FORMAT NAME
+        self.duplicates = 0             # ROWS LEFT OUT AS ALREADY HELD
+        self.skipped = []               # PATHS OF FILES IMPORTED BEFORE
+        self.imported = []              # ImportedFile PER FILE READ
+        self.path = None
+        self.cancelled = False
+        self.error = None
+        self.slots = threading.Semaphore(queueBlocks)
+        self.signals = ImportSignals()
+
+    # SET FROM THE GUI THREAD, SEEN BEFORE THE NEXT CHUNK
+    def cancel(self):
+        self.cancelled = True
+
+    def blockInserted(self):
+        self.slots.release()
+
+    def reject(self, line, reason):
+        self.rejected += 1
+        if len(self.rejects) < self.rejectLimit:
+            self.rejects.append((self.path, line, reason))
+
+    def run(self):
+        try:
+            with tracing.span("importFiles", files=len(self.paths), bytes=self.total):
+                paths = self.newFiles()
+                if self.processes > 1 and len(paths) > 1:
+                    self.importInParallel(paths)
+                else:
+                    self.importEach()
+        except Exception:
+            self.error = traceback.format_exc()
+            self.signals.failed.emit(self)
+        else:
+            self.signals.finished.emit(self)
+
+    # THE PATHS NOT IMPORTED BEFORE, EACH WITH ITS ImportedFile IN imported
+    def newFiles(self):
+        paths = []
+        for path in self.paths:
+            if self.index is None:
+                self.imported.append(ImportedFile(None, path, os.path.getsize(path), 0))
+                paths.append(path)
+                continue
+            digest, size, mtime = self.index.identify(path)
+            if self.index.known(digest):
+                self.skipped.append(path)
+                self.read += size
+                continue
+            self.index.digests.add(digest)
+            self.imported.append(ImportedFile(digest, path, size, mtime))
+            paths.append(path)
+        if self.skipped:
+            self.signals.progress.emit(self)
+        return paths
+
+    def importEach(self):
+        for record in self.imported:
+            if self.cancelled:
+                return
+            self.path = record.path
+            self.importFile(record)
+
+    def importFile(self, record):
+        with open(record.path, "rb") as file:
+            mapper = detectFormat(file)
+            record.format = self.formats[record.path] = mapper.format.name
+            newRows = None if self.index is None else self.index.fileFilter()
+            for block in fileBlocks(file, self.chunkBytes, mapper, self.reject, self.counted):
+                if newRows is not None:
+                    block = newRows.newRows(block)
+                if not self.insert(block):
+                    return
+                record.rows += len(block)
+        if newRows is not None:
+            self.duplicates += newRows.duplicates
+
+    # WHILE THE PROCESSES PARSE, EACH FILE IS MERGED AS SOON AS THE FILES BEFORE IT ARE - THE
+    # MERGED BLOCK IS INSERTED IN ONE GO AT THE END. A CANCEL LEAVES ANY FILE A PROCESS HAS
+    # STARTED TO FINISH UNSEEN
+    def importInParallel(self, paths):
+        pool = ProcessPoolExecutor(min(self.processes, len(paths)), mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [pool.submit(parseFile, path, self.chunkBytes, self.rejectLimit) for path in paths]
+            merged = TransactionColumns()
+            pending = set(futures)
+            merging = 0
+            while merging < len(futures):
+                if self.cancelled:
+                    return
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                while merging < len(futures) and futures[merging].done():
+                    self.merge(merged, futures[merging].result(), self.imported[merging])
+                    futures[merging] = None
+                    merging += 1
+            with tracing.span("insertMerged", rows=len(merged)):
+                self.insert(merged)
+        finally:
+            pool.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+    def merge(self, merged, parsed, record):
+        columns = parsed.columns
+        if self.index is not None:
+            newRows = self.index.fileFilter()
+            columns = newRows.newRows(columns, parsed.fingerprints)
+            self.duplicates += newRows.duplicates
+        merged.extendColumns(columns)
+        record.rows = len(columns)
+        self.read += parsed.size
+        record.format = self.formats[parsed.path] = parsed.format
+        self.rejected += parsed.rejected
+        self.rejects.extend(parsed.rejects[:self.rejectLimit - len(self.rejects)])
+        self.signals.progress.emit(self)
+
+    # FALSE IF CANCELLED BEFORE block COULD BE INSERTED
+    def insert(self, block):
+        if self.cancelled:
+            return False
+        if not len(block):
+            self.signals.progress.emit(self)
+            return True
+        if not self.waitForSlot():
+            return False
+        if self.store is None:
+            self.signals.block.emit(self, block)
+        else:
+            self.store.append(block)
+            self.slots.release()
+        self.rows += len(block)
+        self.signals.progress.emit(self)
+        return True
+
+    def counted(self, chunks):
+        for chunk in chunks:
+            self.read += len(chunk)
+            yield chunk
+
+    # FALSE IF CANCELLED WHILE WAITING FOR THE GUI TO INSERT THE BLOCKS BEFORE
+    def waitForSlot(self):
+        while not self.slots.acquire(timeout=0.1):
+            if self.cancelled:
+                return False
+        return True
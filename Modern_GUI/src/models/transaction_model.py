@@ -0,0 +1,188 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction table model - TransactionColumns shown in a QTableView
+##
+## NOTHING IS STORED PER CELL: data() FORMATS THE VISIBLE CELLS FROM THE COLUMN
+## ARRAYS WHEN THE VIEW ASKS FOR THEM. THE COLUMNS BELONG TO A PortfolioModel - ITS
+## CHANGE SETS ARE FORWARDED AS Qt'S ROW SIGNALS, AN UPDATE AS ONE dataChanged OVER THE
+## ROWS AND COLUMNS IT WROTE
+##
+################################################################################
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from array import array
+from datetime import date
+
+from src.models.portfolio_model import FIELDS, INSERTED, REMOVED, RESET, PortfolioModel
+from src.models.transaction_columns import (ACTIONS, FEE_SCALE, PRICE_SCALE,
+                                            QUANTITY_SCALE, formatFixed, formatOrdinal,
+                                            fractionPlaces)
+
+
+class TransactionTableModel(QAbstractTableModel):
+    DATE, TICKER, ACTION, QUANTITY, PRICE, FEES = range(6)
+    HEADERS = ("Date", "Ticker", "Action", "Quantity", "Price", "Fees")
+
+    # FIXED-POINT COLUMNS - (FIELD, SCALE, MINIMUM DECIMAL PLACES SHOWN)
+    NUMERIC = {
+        QUANTITY: ("quantities", QUANTITY_SCALE, 0),
+        PRICE: ("prices", PRICE_SCALE, 2),
+        FEES: ("fees", FEE_SCALE, 2),
+    }
+    # ROWS SAMPLED FROM A BLOCK FOR THE DECIMAL PLACES IN USE
+    PLACES_SAMPLE = 1000
+
+    # THE STORED FIXED-POINT INTEGER OF A NUMERIC CELL - WHAT THE NUMERIC DELEGATES CACHE ON
+    RawValueRole = Qt.UserRole
+
+    # A TransactionColumns (OR None) GETS A PortfolioModel OF ITS OWN
+    def __init__(self, portfolio=None, parent=None):
+        super().__init__(parent)
+        if not isinstance(portfolio, PortfolioModel):
+            portfolio = PortfolioModel(portfolio, self)
+        self.portfolio = portfolio
+
+        # ONE FORMATTER AND ALIGNMENT PER COLUMN - data() IS A TUPLE LOOKUP AND A CALL
+        self.formatters = (
+            lambda columns, row: formatOrdinal(columns.dates[row]),
+            lambda columns, row: columns.tickers[columns.tickerIds[row]],
+            lambda columns, row: ACTIONS[columns.actions[row]],
+            lambda columns, row: formatFixed(columns.quantities[row], QUANTITY_SCALE, 0),
+            lambda columns, row: formatFixed(columns.prices[row], PRICE_SCALE),
+            lambda columns, row: formatFixed(columns.fees[row], FEE_SCALE),
+        )
+        left = Qt.AlignLeft | Qt.AlignVCenter
+        right = Qt.AlignRight | Qt.AlignVCenter
+        self.alignments = (left, left, left, right, right, right)
+
+        # COLUMN -> (LOWEST, HIGHEST, MOST DECIMAL PLACES) OF EVERY ROW ADDED SO FAR
+        self.extremes = {}
+        self.trackExtremes(self.columns)
+
+        portfolio.aboutToChange.connect(self.portfolioAboutToChange)
+        portfolio.changed.connect(self.portfolioChanged)
+
+    @property
+    def columns(self):
+        return self.portfolio.columns
+
+    ## CLASS METHODS ==> MODEL INTERFACE
+    ########################################################################
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        return self.cellData(index.row(), index.column(), role)
+
+    # data() WITHOUT A QModelIndex - THE PROXY CALLS THIS DIRECTLY
+    def cellData(self, row, column, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self.formatters[column](self.columns, row)
+        if role == self.RawValueRole:
+            return self.rawValue(self.columns, row, column)
+        if role == Qt.TextAlignmentRole:
+            return self.alignments[column]
+        return None
+
+    def rawValue(self, columns, row, column):
+        if column not in self.NUMERIC:
+            return None
+        return getattr(columns, self.NUMERIC[column][0])[row]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            if orientation == Qt.Horizontal:
+                return self.HEADERS[section]
+            return str(section + 1)
+        if role == Qt.TextAlignmentRole and orientation == Qt.Horizontal:
+            return self.alignments[section]
+        return None
+
+    ## CLASS METHODS ==> CHANGE THE DATA
+    ########################################################################
+    def setColumns(self, columns):
+        self.portfolio.setColumns(columns)
+
+    def appendColumns(self, other):
+        self.portfolio.appendColumns(other)
+
+    def portfolioAboutToChange(self, change):
+        if change.kind == RESET:
+            self.beginResetModel()
+        elif change.kind == INSERTED:
+            self.beginInsertRows(QModelIndex(), *change.span())
+        elif change.kind == REMOVED:
+            self.beginRemoveRows(QModelIndex(), *change.span())
+
+    def portfolioChanged(self, change):
+        if change.kind == RESET:
+            self.extremes = {}
+            self.trackExtremes(self.columns)
+            self.endResetModel()
+        elif change.kind == INSERTED:
+            self.trackExtremes(self.columns, change.rows.start)
+            self.endInsertRows()
+        elif change.kind == REMOVED:
+            self.endRemoveRows()
+        else:
+            self.trackUpdate(change)
+            first, last = change.span()
+            changed = [FIELDS.index(field) for field in change.fields]
+            self.dataChanged.emit(self.index(first, min(changed)), self.index(last, max(changed)))
+
+    ## CLASS METHODS ==> WIDEST VALUES
+    ########################################################################
+    # MERGE THE RANGE OF THE NEW ROWS first.. - min / max RUN IN C OVER THEM ONLY, THE
+    # DECIMAL PLACES COME FROM AT MOST PLACES_SAMPLE OF THEM
+    def trackExtremes(self, columns, first=0):
+        if len(columns) <= first:
+            return
+        step = max((len(columns) - first) // self.PLACES_SAMPLE, 1)
+        for column, (field, scale, minPlaces) in self.NUMERIC.items():
+            values = getattr(columns, field)
+            self.mergeExtremes(column, values[first:] if first else values, step)
+
+    # UPDATED VALUES CAN ONLY WIDEN A COLUMN - THE WIDEST SO FAR STAYS AN UPPER BOUND
+    def trackUpdate(self, change):
+        step = max(len(change) // self.PLACES_SAMPLE, 1)
+        for column, (field, scale, minPlaces) in self.NUMERIC.items():
+            if field in change.fields:
+                values = getattr(self.columns, field)
+                self.mergeExtremes(column, array(values.typecode, map(values.__getitem__, change.rows)), step)
+
+    def mergeExtremes(self, column, values, step):
+        if values:
+            field, scale, minPlaces = self.NUMERIC[column]
+            low, high = min(values), max(values)
+            places = max(fractionPlaces(value, scale) for value in values[::step])
+            if column in self.extremes:
+                knownLow, knownHigh, knownPlaces = self.extremes[column]
+                low, high, places = min(low, knownLow), max(high, knownHigh), max(places, knownPlaces)
+            self.extremes[column] = (low, high, places)
+
+    # DECIMAL PLACES TO LINE UP IN column - THE MOST SEEN SO FAR, AT LEAST THE FORMAT'S MINIMUM
+    def decimalPlaces(self, column):
+        minPlaces = self.NUMERIC[column][2]
+        return max(minPlaces, self.extremes[column][2]) if column in self.extremes else minPlaces
+
+    def tickerNames(self):
+        return self.columns.tickers
+
+    # TEXTS AT LEAST AS WIDE AS ANY CELL OF column, FOUND WITHOUT LOOKING AT THE ROWS
+    def widestValues(self, column):
+        if column == self.DATE:
+            return [formatOrdinal(date(2000, 12, 28).toordinal())]
+        if column == self.TICKER:
+            return sorted(self.tickerNames(), key=len)[-3:]
+        if column == self.ACTION:
+            return list(ACTIONS)
+        if column not in self.extremes:
+            return []
+        field, scale, minPlaces = self.NUMERIC[column]
+        low, high, places = self.extremes[column]
+        return [formatFixed(value // scale * scale, scale, max(minPlaces, places)) for value in (low, high)]
@@ -0,0 +1,646 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction proxy - sorting and filtering by row permutation
+##
+## THE PROXY IS ONE array OF SOURCE ROWS IN DISPLAY ORDER. EACH COLUMN'S ASCENDING
+## SORT PERMUTATION IS CACHED (DESCENDING IS ITS REVERSE) AND BUILT ON THE THREAD POOL AFTER
+## A LOAD OR AN APPEND (PermutationBuilder - APPENDED ROWS ARE MERGED INTO THE PERMUTATION
+## THEY FOLLOW), SO A HEADER CLICK ONLY PICKS ONE UP. FILTERS ARE byte MASKS OVER THE COLUMN
+## ARRAYS BUILT AND COMBINED BY C LOOPS (map, translate, int &), NEVER A PYTHON COMPARISON
+## PER ROW; A RANGE FILTER IS A SLICE OF ITS FIELD'S PERMUTATION FOUND BY BISECTION - THE
+## ORDER ITSELF WHEN THE GRID IS SORTED ON THAT FIELD. ROW FILTERS ARE READY-MADE ASCENDING
+## ARRAYS OF SOURCE ROWS (E.G. SEARCH RESULTS) - ONE ON ITS OWN IS THE ORDER AS IT IS.
+## A CHANGE TO THE SOURCE DROPS THE CACHES IT TOUCHES - AN EDIT TO FIELDS THE ORDER IS NOT
+## SORTED OR FILTERED ON KEEPS THE ORDER AND ONLY REPAINTS. EACH FILTER NAMES THE FIELDS
+## IT READS (predicate.fields) - ONE THAT DOES NOT IS REBUILT BY ANY EDIT
+##
+################################################################################
+
+import sys
+import traceback
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import chain, compress, repeat
+
+from PySide6.QtCore import QAbstractProxyModel, QModelIndex, QObject, QRunnable, QThreadPool, Qt, Signal
+
+from src import tracing
+from src.models.portfolio_model import FIELDS
+from src.models.transaction_columns import (FEE_SCALE, PRICE_SCALE, QUANTITY_SCALE,
+                                            toAction, toFixed, toOrdinal)
+
+
+TICKER = FIELDS.index("tickerIds")
+
+# A SORT OF FEWER THAN 1 / AT_HAND_FRACTION OF THE ROWS IS DONE ON THE GUI THREAD
+AT_HAND_FRACTION = 64
+
+
+## FILTERS - EACH RETURNS predicate(columns) -> bytes, ONE 0/1 BYTE PER SOURCE ROW
+########################################################################
+def actionFilter(action):
+    action = toAction(action)
+    table = bytes(int(value == action) for value in range(256))
+    def predicate(columns):
+        return columns.actions.tobytes().translate(table)
+    predicate.fields = ("actions",)
+    return predicate
+
+
+def tickerFilter(*tickers):
+    wanted = {ticker.strip().upper() for ticker in tickers}
+    def predicate(columns):
+        lookup = bytes(ticker in wanted for ticker in columns.tickers)
+        ids = columns.tickerIds
+        if len(lookup) <= 256:
+            # EVERY ID IS ITS LOW BYTE - ONE translate OVER EVERY ROW'S LOW BYTE
+            low = 0 if sys.byteorder == "little" else ids.itemsize - 1
+            return ids.tobytes()[low::ids.itemsize].translate(lookup.ljust(256, b"\x00"))
+        return bytes(map(lookup.__getitem__, ids))
+    predicate.fields = ("tickerIds",)
+    return predicate
+
+
+# INCLUSIVE RANGE OVER ONE FIXED-POINT COLUMN - low / high IN FIXED POINT, None FOR OPEN.
+# THE PREDICATE CARRIES ITS RANGE SO A FILTERED SET CAN BE FOUND AS A SLICE OF THE FIELD'S
+# SORT PERMUTATION (TransactionTotals)
+def rangeFilter(field, low=None, high=None):
+    def predicate(columns):
+        values = getattr(columns, field)
+        masks = []
+        if low is not None:
+            masks.append(bytes(map(low.__le__, values)))
+        if high is not None:
+            masks.append(bytes(map(high.__ge__, values)))
+        return combineMasks(masks, len(values)) if masks else b"\x01" * len(values)
+    predicate.range = (field, low, high)
+    predicate.fields = (field,)
+    return predicate
+
+
+def dateFilter(first=None, last=None):
+    return rangeFilter("dates", None if first is None else toOrdinal(first),
+                       None if last is None else toOrdinal(last))
+
+
+def quantityFilter(low=None, high=None):
+    return rangeFilter("quantities", None if low is None else toFixed(low, QUANTITY_SCALE),
+                       None if high is None else toFixed(high, QUANTITY_SCALE))
+
+
+def priceFilter(low=None, high=None):
+    return rangeFilter("prices", None if low is None else toFixed(low, PRICE_SCALE),
+                       None if high is None else toFixed(high, PRICE_SCALE))
+
+
+def feeFilter(low=None, high=None):
+    return rangeFilter("fees", None if low is None else toFixed(low, FEE_SCALE),
+                       None if high is None else toFixed(high, FEE_SCALE))
+
+
+# MASK WITH A 1 AT EACH OF rows - THE STORES RUN IN C THROUGH map
+def rowMask(rows, count):
+    mask = bytearray(count)
+    deque(map(mask.__setitem__, rows, repeat(1)), maxlen=0)
+    return mask
+
+
+# rows (A range) IN THE ORDER OF keys - presorted, THE PERMUTATION OF THE ROWS BEFORE THEM,
+# IS ONE RUN ALREADY IN ORDER THAT THE SORT ONLY MERGES THE NEW ROWS INTO
+def sortPermutation(keys, rows, presorted=None):
+    if presorted is None or not len(presorted):
+        return array("I", sorted(rows, key=keys.__getitem__))
+    return array("I", sorted(chain(presorted, range(len(presorted), rows.stop)), key=keys.__getitem__))
+
+
+# THE ARRAY SORTED ON FOR column - TICKER IDS ARE MAPPED TO THEIR ALPHABETICAL RANK
+def sortKeys(columns, column):
+    if column == TICKER:
+        alphabetical = sorted(range(len(columns.tickers)), key=columns.tickers.__getitem__)
+        ranks = [0] * len(alphabetical)
+        for rank, tickerId in enumerate(alphabetical):
+            ranks[tickerId] = rank
+        return array("I", map(ranks.__getitem__, columns.tickerIds))
+    return columns.fields()[column]
+
+
+# THE SLICE OF field'S ASCENDING permutation WITH VALUES IN [low, high]
+def rangeSlice(permutation, values, low, high):
+    key = values.__getitem__
+    first = 0 if low is None else bisect_left(permutation, low, key=key)
+    end = len(permutation) if high is None else bisect_right(permutation, high, key=key)
+    return permutation[first:max(end, first)]
+
+
+# AND OF SEVERAL MASKS AS ONE BIG-INTEGER & PER MASK
+def combineMasks(masks, rows):
+    if len(masks) == 1:
+        return masks[0]
+    combined = int.from_bytes(masks[0], "little")
+    for mask in masks[1:]:
+        combined &= int.from_bytes(mask, "little")
+    return combined.to_bytes(rows, "little")
+
+
+# SIGNALS FOR PERMUTATIONS BUILT ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class PermutationSignals(QObject):
+    built = Signal(object)
+    failed = Signal(str)
+
+
+# presorted - COLUMN TO SORT -> PERMUTATION OF THE ROWS BEFORE ANY APPENDED, OR None.
+# generations - EACH COLUMN'S CACHE GENERATION WHEN THE BUILD STARTED
+class PermutationBuilder(QRunnable):
+    def __init__(self, columns, rows, presorted, generations):
+        super().__init__()
+        self.columns = columns
+        self.rows = rows
+        self.presorted = presorted
+        self.generations = generations
+        self.permutations = {}
+        self.signals = PermutationSignals()
+
+    def run(self):
+        try:
+            with tracing.span("buildPermutations", rows=self.rows, columns=len(self.presorted)):
+                for column, presorted in self.presorted.items():
+                    keys = sortKeys(self.columns, column)
+                    self.permutations[column] = sortPermutation(keys, range(self.rows), presorted)
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.built.emit(self)
+
+
+# SIGNALS FOR AN ORDER BUILT ON THE THREAD POOL
+# ///////////////////////////////////////////////////////////////
+class OrderSignals(QObject):
+    built = Signal(object)
+    failed = Signal(str)
+
+
+class OrderBuilder(QRunnable):
+    def __init__(self, ordering, generation):
+        super().__init__()
+        self.ordering = ordering
+        self.generation = generation
+        self.order = None
+        self.signals = OrderSignals()
+
+    def run(self):
+        try:
+            self.order = self.ordering.order()
+        except Exception:
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.built.emit(self)
+
+
+# ONE REBUILD OF THE PROXY'S ORDER - ITS FILTERS AND SORT, AND THE CACHES (masks,
+# permutations, presorted) IT READS AND ADDS TO. ON THE GUI THREAD THEY ARE THE PROXY'S OWN,
+# ON THE THREAD POOL COPIES. passed - THE ASCENDING ROWS THE FILTERS PASS, IF KNOWN
+class Ordering():
+    def __init__(self, columns, filters, rowFilters, masks, permutations, presorted, sortColumn, sortOrder,
+                 passed=None):
+        self.columns = columns
+        self.filters = filters
+        self.rowFilters = rowFilters
+        self.masks = masks
+        self.permutations = permutations
+        self.presorted = presorted
+        self.sortColumn = sortColumn
+        self.sortOrder = sortOrder
+        self.passed = passed
+
+    # WHETHER order() IS LITTLE MORE THAN A LOOKUP - NO FILTER TO APPLY (NONE, ONE ROW FILTER,
+    # OR THE ROWS PASSED ALREADY KNOWN) AND NO SORT, A READY PERMUTATION OR FEW ROWS TO SORT
+    def atHand(self):
+        if self.columns is None:
+            return True
+        passed = self.passed
+        if passed is None and not self.filters and len(self.rowFilters) == 1:
+            passed = next(iter(self.rowFilters.values()))
+        if passed is None and (self.filters or self.rowFilters):
+            return False
+        if self.sortColumn < 0:
+            return True
+        if passed is None:
+            return self.sortColumn in self.permutations
+        return len(passed) * AT_HAND_FRACTION < len(self.columns)
+
+    def permutation(self, column):
+        permutation = self.permutations.get(column)
+        if permutation is None:
+            with tracing.span("sortPermutation", column=column):
+                keys = sortKeys(self.columns, column)
+                permutation = sortPermutation(keys, range(len(keys)), self.presorted.pop(column, None))
+            self.permutations[column] = permutation
+        return permutation
+
+    # THE ROWS A RANGE FILTER PASSES AS A SLICE OF ITS FIELD'S PERMUTATION, IF THE PERMUTATION
+    # IS READY - (COLUMN, SLICE), OR None
+    def rangeRows(self, predicate):
+        if getattr(predicate, "range", None) is None:
+            return None
+        field, low, high = predicate.range
+        column = FIELDS.index(field)
+        permutation = self.permutations.get(column)
+        if permutation is None:
+            return None
+        return column, rangeSlice(permutation, getattr(self.columns, field), low, high)
+
+    def predicateMasks(self):
+        for name, predicate in self.filters.items():
+            if name not in self.masks:
+                with tracing.span("filterMask", filter=name):
+                    passed = self.rangeRows(predicate)
+                    if passed is None:
+                        self.masks[name] = predicate(self.columns)
+                    else:
+                        self.masks[name] = rowMask(passed[1], len(self.columns))
+        return [self.masks[name] for name in self.filters]
+
+    # ASCENDING SOURCE ROWS PASSING EVERY FILTER - THE SMALLEST ROW FILTER IS THE STARTING
+    # POINT, SO A SEARCH HIT IS NEVER WIDENED BACK TO A PASS OVER EVERY ROW
+    def filteredRows(self, rows):
+        if self.passed is None:
+            self.passed = self.passRows(rows)
+        return self.passed
+
+    def passRows(self, rows):
+        masks = self.predicateMasks()
+        rowSets = sorted(self.rowFilters.values(), key=len)
+        if not rowSets:
+            return array("I", compress(range(rows), combineMasks(masks, rows)))
+        masks += [rowMask(rowSet, rows) for rowSet in rowSets[1:]]
+        if not masks:
+            return rowSets[0]
+        mask = combineMasks(masks, rows)
+        return array("I", compress(rowSets[0], map(mask.__getitem__, rowSets[0])))
+
+    # array("I") OF SOURCE ROWS IN DISPLAY ORDER, None FOR THE SOURCE ORDER
+    def order(self):
+        filtered = self.filters or self.rowFilters
+        if self.columns is None or (self.sortColumn < 0 and not filtered):
+            return None
+
+        with tracing.span("proxyRebuild", column=self.sortColumn, filters=len(self.filters) + len(self.rowFilters)):
+            rows = len(self.columns)
+            passed = self.rangeRows(next(iter(self.filters.values()))) if len(self.filters) == 1 else None
+            if not filtered:
+                order = self.permutation(self.sortColumn)
+            elif passed is not None and passed[0] == self.sortColumn and not self.rowFilters:
+                # ONE RANGE OVER THE FIELD SORTED ON - ITS SLICE IS THE ORDER
+                order = passed[1]
+            else:
+                order = self.filteredRows(rows)
+                if self.sortColumn >= 0:
+                    permutation = self.permutations.get(self.sortColumn)
+                    # FEW ROWS LEFT (OR NO PERMUTATION YET) - SORT ONLY THE ROWS THAT PASSED
+                    if permutation is None or len(order) * 8 < rows:
+                        keys = sortKeys(self.columns, self.sortColumn)
+                        order = array("I", sorted(order, key=keys.__getitem__))
+                    else:
+                        mask = rowMask(order, rows)
+                        order = array("I", compress(permutation, map(mask.__getitem__, permutation)))
+
+            if self.sortColumn >= 0 and self.sortOrder == Qt.DescendingOrder:
+                order = order[::-1]
+            return order
+
+
+class TransactionProxyModel(QAbstractProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.order = None           # array("I") OF SOURCE ROWS, None = SOURCE ORDER
+        self.positions = None       # SOURCE ROW -> PROXY ROW, BUILT ON FIRST mapFromSource
+        self.sortColumn = -1
+        self.sortOrder = Qt.AscendingOrder
+        self.filters = {}
+        self.rowFilters = {}        # NAME -> ASCENDING array("I") OF SOURCE ROWS
+        self.source = None
+        self.connections = []
+
+        # CACHES - DROPPED WHENEVER THE SOURCE CHANGES. AN APPEND KEEPS EACH PERMUTATION AS
+        # THE PRESORTED RUN ITS REBUILD MERGES THE NEW ROWS INTO
+        self.permutations = {}      # COLUMN -> ASCENDING array("I")
+        self.presorted = {}         # COLUMN -> ASCENDING array("I") OF THE ROWS BEFORE AN APPEND
+        self.masks = {}             # FILTER NAME -> bytes
+        self.resetting = False
+
+        # PERMUTATIONS BUILT IN THE BACKGROUND - A BUILD'S PERMUTATION IS KEPT ONLY IF ITS
+        # COLUMN'S GENERATION HAS NOT MOVED ON SINCE IT STARTED
+        self.generations = {}       # COLUMN -> COUNT OF CHANGES THAT DROPPED ITS PERMUTATION
+        self.builder = None
+        self.buildPending = False
+
+        # FILTERS REBUILT ON THE THREAD POOL - A BUILD IS APPLIED ONLY IF NO REBUILD CAME AFTER IT
+        self.orderBuilder = None
+        self.orderGeneration = 0
+        self.passed = None          # ASCENDING ROWS THE FILTERS PASS, WHILE NEITHER CHANGES
+
+    ## CLASS METHODS ==> SOURCE
+    ########################################################################
+    def setSourceModel(self, model):
+        self.beginResetModel()
+        for signal, slot in self.connections:
+            signal.disconnect(slot)
+        super().setSourceModel(model)
+        self.source = model
+        self.connections = [
+            (model.modelAboutToBeReset, self.sourceAboutToChange),
+            (model.modelReset, self.sourceReset),
+            (model.rowsAboutToBeInserted, self.sourceRowsAboutToBeInserted),
+            (model.rowsInserted, self.sourceRowsInserted),
+            (model.rowsAboutToBeRemoved, self.sourceAboutToChange),
+            (model.rowsRemoved, self.sourceReset),
+            (model.dataChanged, self.sourceDataChanged),
+            (model.headerDataChanged, self.headerDataChanged),
+        ]
+        for signal, slot in self.connections:
+            signal.connect(slot)
+        self.invalidateCaches()
+        self.rebuild()
+        self.endResetModel()
+
+    def columns(self):
+        return self.sourceModel().columns
+
+    # appended - THE ROWS ONLY GREW, SO EACH PERMUTATION IS STILL THE ORDER OF THE ROWS BEFORE
+    def invalidateCaches(self, columns=None, appended=False):
+        self.passed = None
+        if columns is None:
+            columns = range(self.sourceModel().columnCount()) if self.sourceModel() is not None else ()
+            self.presorted = {**self.presorted, **self.permutations} if appended else {}
+            self.permutations.clear()
+            self.masks.clear()
+        else:
+            for column in columns:
+                self.permutations.pop(column, None)
+                self.presorted.pop(column, None)
+            for name, predicate in self.filters.items():
+                if self.filterReads(predicate, columns):
+                    self.masks.pop(name, None)
+        for column in columns:
+            self.generations[column] = self.generations.get(column, 0) + 1
+        self.buildPermutations()
+
+    # WHETHER predicate'S MASK DEPENDS ON ANY OF columns - ONE NAMING NO FIELDS MAY READ ANY
+    def filterReads(self, predicate, columns):
+        fields = getattr(predicate, "fields", None)
+        return fields is None or any(FIELDS.index(field) in columns for field in fields)
+
+    # ANY SOURCE CHANGE WHILE SORTED OR FILTERED IS SHOWN AS A RESET - A PROXY IN SOURCE
+    # ORDER FORWARDS APPENDS AS INSERTS SO THE VIEW KEEPS ITS POSITION DURING AN IMPORT
+    def sourceAboutToChange(self, *args):
+        if not self.resetting:
+            self.resetting = True
+            self.beginResetModel()
+
+    # ROW NUMBERS MAY NOW MEAN OTHER ROWS - ROW FILTERS ARE DROPPED UNTIL THEIR OWNER SETS THEM AGAIN
+    def sourceReset(self, *args):
+        self.rowFilters.clear()
+        self.sourceChanged()
+
+    def sourceChanged(self, *args, appended=False):
+        self.invalidateCaches(appended=appended)
+        self.rebuild()
+        if self.resetting:
+            self.resetting = False
+            self.endResetModel()
+
+    def sourceRowsAboutToBeInserted(self, parent, first, last):
+        if self.order is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+        else:
+            self.sourceAboutToChange()
+
+    def sourceRowsInserted(self, parent, first, last):
+        if self.resetting:
+            self.sourceChanged(appended=True)
+        else:
+            self.invalidateCaches(appended=True)
+            self.endInsertRows()
+
+    # ROW FILTERS BELONG TO THEIR OWNER, WHICH SETS THEM AGAIN IF THE EDIT CHANGED THEM
+    def sourceDataChanged(self, topLeft, bottomRight, roles=()):
+        changed = range(topLeft.column(), bottomRight.column() + 1)
+        self.invalidateCaches(changed)
+        if self.order is None:
+            self.dataChanged.emit(self.mapFromSource(topLeft), self.mapFromSource(bottomRight), roles)
+        elif self.sortColumn in changed or any(self.filterReads(predicate, changed)
+                                               for predicate in self.filters.values()):
+            self.beginResetModel()
+            self.rebuild()
+            self.endResetModel()
+        elif self.order:
+            # THE VIEW ONLY REPAINTS THE CELLS IT SHOWS
+            self.dataChanged.emit(self.index(0, changed[0]), self.index(len(self.order) - 1, changed[-1]), roles)
+
+    ## CLASS METHODS ==> PERMUTATION
+    ########################################################################
+    # column'S PERMUTATION - SORTED HERE ONLY IF THE BACKGROUND BUILD HAS NOT GOT TO IT YET
+    def permutation(self, column):
+        return self.ordering(copies=False).permutation(column)
+
+    # SORT EVERY COLUMN WITHOUT A PERMUTATION ON THE THREAD POOL - ONE BUILD AT A TIME, AND
+    # ANOTHER ONCE IT FINISHES IF THE SOURCE CHANGED MEANWHILE
+    def buildPermutations(self):
+        if self.builder is not None:
+            self.buildPending = True
+            return
+        source = self.sourceModel()
+        missing = [column for column in range(source.columnCount() if source is not None else 0)
+                   if column not in self.permutations]
+        if not missing or not len(self.columns()):
+            return
+        presorted = {column: self.presorted.get(column) for column in missing}
+        self.builder = PermutationBuilder(self.columns(), len(self.columns()), presorted, dict(self.generations))
+        self.builder.signals.built.connect(self.permutationsBuilt)
+        self.builder.signals.failed.connect(self.permutationsFailed)
+        QThreadPool.globalInstance().start(self.builder)
+
+    def permutationsBuilt(self, builder):
+        if builder is not self.builder:
+            return
+        self.builder = None
+        rows = len(self.columns())
+        for column, permutation in builder.permutations.items():
+            if builder.generations.get(column) == self.generations.get(column) and len(permutation) == rows:
+                self.permutations.setdefault(column, permutation)
+                self.presorted.pop(column, None)
+        if self.buildPending:
+            self.buildPending = False
+            self.buildPermutations()
+
+    def permutationsFailed(self, message):
+        self.builder = None
+        print(message, file=sys.stderr)
+
+    # REBUILT HERE - AN ORDER ALREADY AT HAND, OR ONE WORKED OUT ON THE GUI THREAD
+    def rebuild(self):
+        self.orderGeneration += 1
+        self.orderBuilder = None
+        self.positions = None
+        ordering = self.ordering(copies=False)
+        self.order = ordering.order()
+        self.passed = ordering.passed
+
+    # THE PROXY'S FILTERS, SORT AND CACHES - copies FOR A REBUILD ON THE THREAD POOL
+    def ordering(self, copies=True):
+        state = (self.filters, self.rowFilters, self.masks, self.permutations, self.presorted)
+        if copies:
+            state = tuple(map(dict, state))
+        columns = None if self.sourceModel() is None else self.columns()
+        return Ordering(columns, *state, self.sortColumn, self.sortOrder, self.passed)
+
+    # A FILTER CHANGED - AN ORDER NOT AT HAND IS WORKED OUT ON THE THREAD POOL, THE GRID
+    # SHOWING THE ROWS IT HAS UNTIL THEN. A SOURCE CHANGE OR SORT MEANWHILE REBUILDS ON THE GUI
+    # THREAD WITH THE NEW FILTERS, AND THE BUILD IS THROWN AWAY
+    def reorder(self):
+        ordering = self.ordering()
+        if ordering.atHand():
+            self.beginResetModel()
+            self.rebuild()
+            self.endResetModel()
+            return
+        self.orderGeneration += 1
+        self.orderBuilder = OrderBuilder(ordering, self.orderGeneration)
+        self.orderBuilder.signals.built.connect(self.orderBuilt)
+        self.orderBuilder.signals.failed.connect(self.orderFailed)
+        QThreadPool.globalInstance().start(self.orderBuilder)
+
+    # NOTHING CHANGED SINCE THE BUILD STARTED - ITS MASKS AND PERMUTATIONS ARE CURRENT TOO
+    def orderBuilt(self, builder):
+        if builder is not self.orderBuilder or builder.generation != self.orderGeneration:
+            return
+        self.orderBuilder = None
+        ordering = builder.ordering
+        for name, mask in ordering.masks.items():
+            if name in self.filters and self.filters[name] is ordering.filters.get(name):
+                self.masks.setdefault(name, mask)
+        for column, permutation in ordering.permutations.items():
+            self.permutations.setdefault(column, permutation)
+        self.beginResetModel()
+        self.positions = None
+        self.order = builder.order
+        self.passed = ordering.passed
+        self.endResetModel()
+
+    def orderFailed(self, message):
+        self.orderBuilder = None
+        print(message, file=sys.stderr)
+
+    def filtering(self):
+        return self.orderBuilder is not None
+
+    ## CLASS METHODS ==> SORT AND FILTER
+    ########################################################################
+    # column < 0 RESTORES THE SOURCE ORDER. A SORT NOT AT HAND IS BUILT ON THE THREAD POOL LIKE
+    # A FILTER, AND SO IS ONE WHILE A FILTER IS BEING BUILT
+    def sort(self, column, order=Qt.AscendingOrder):
+        if (column, order) == (self.sortColumn, self.sortOrder):
+            return
+        if self.orderBuilder is not None or not self.ordering(copies=False).atHand():
+            self.sortColumn, self.sortOrder = column, order
+            self.reorder()
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sourceIndexes = [self.mapToSource(index) for index in persistent]
+        self.sortColumn, self.sortOrder = column, order
+        self.rebuild()
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in sourceIndexes])
+        self.layoutChanged.emit()
+
+    def setFilter(self, name, predicate):
+        self.filters[name] = predicate
+        self.masks.pop(name, None)
+        self.passed = None
+        self.reorder()
+
+    def setRowFilter(self, name, rows):
+        self.rowFilters[name] = rows
+        self.passed = None
+        self.reorder()
+
+    def clearFilter(self, name=None):
+        if name is None and not (self.filters or self.rowFilters):
+            return
+        if name is not None and name not in self.filters and name not in self.rowFilters:
+            return
+        if name is None:
+            self.filters.clear()
+            self.rowFilters.clear()
+            self.masks.clear()
+        else:
+            self.filters.pop(name, None)
+            self.rowFilters.pop(name, None)
+            self.masks.pop(name, None)
+        self.passed = None
+        self.reorder()
+
+    ## CLASS METHODS ==> MODEL INTERFACE
+    ########################################################################
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return len(self.columns()) if self.order is None else len(self.order)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        return self.sourceModel().columnCount()
+
+    # CALLED FOR EVERY VISIBLE CELL - BOUNDS CHECKED HERE RATHER THAN THROUGH hasIndex()
+    def index(self, row, column, parent=QModelIndex()):
+        if self.source is None:
+            return QModelIndex()
+        rows = len(self.source.columns) if self.order is None else len(self.order)
+        if 0 <= row < rows and 0 <= column < len(self.source.HEADERS) and not parent.isValid():
+            return self.createIndex(row, column)
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def mapToSource(self, proxyIndex):
+        if not proxyIndex.isValid():
+            return QModelIndex()
+        row = proxyIndex.row() if self.order is None else self.order[proxyIndex.row()]
+        return self.sourceModel().index(row, proxyIndex.column())
+
+    def mapFromSource(self, sourceIndex):
+        if not sourceIndex.isValid():
+            return QModelIndex()
+        if self.order is None:
+            return self.index(sourceIndex.row(), sourceIndex.column())
+        position = self.sourcePositions()[sourceIndex.row()]
+        return QModelIndex() if position < 0 else self.index(position, sourceIndex.column())
+
+    # SOURCE ROW -> PROXY ROW (-1 IF NOT SHOWN), BUILT IN C ONCE PER ORDER
+    def sourcePositions(self):
+        if self.positions is None:
+            positions = array("i", [-1]) * len(self.columns())
+            deque(map(positions.__setitem__, self.order, range(len(self.order))), maxlen=0)
+            self.positions = positions
+        return self.positions
+
+    # NO mapToSource OR SOURCE QModelIndex FOR EVERY VISIBLE CELL
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row() if self.order is None else self.order[index.row()]
+        return self.source.cellData(row, index.column(), role)
+
+    def widestValues(self, column):
+        return self.source.widestValues(column)
+
+    def decimalPlaces(self, column):
+        return self.source.decimalPlaces(column)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Vertical and role == Qt.DisplayRole:
+            return str(section + 1)
+        return self.sourceModel().headerData(section, orientation, role)
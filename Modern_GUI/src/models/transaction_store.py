@@ -0,0 +1,189 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction store - the on-disk (sqlite) broker history
+##
+## ROWS KEEP THE FIXED-POINT INTEGERS OF TransactionColumns AND ARE NUMBERED FROM 1 IN
+## THE ORDER THEY WERE ADDED. THE STORE IS APPEND-ONLY (clear() EMPTIES IT), SO ROW r
+## OF THE TABLE IS ALWAYS id r + 1 AND ANY BLOCK IS ONE PRIMARY KEY RANGE SCAN. EACH
+## THREAD GETS ITS OWN CONNECTION; WAL LETS THEM READ WHILE ANOTHER THREAD WRITES. EACH ROW
+## ALSO KEEPS ITS import_index FINGERPRINT, AND imports RECORDS EVERY FILE IMPORTED, SO A
+## RE-IMPORT ADDS ONLY NEW ROWS AND SKIPS UNCHANGED FILES
+##
+################################################################################
+
+import sqlite3
+import threading
+from array import array
+from collections import Counter
+from operator import itemgetter
+
+from src import tracing
+from src.models.import_index import FINGERPRINT_VERSION, ImportedFile, fingerprints
+from src.models.transaction_columns import TransactionColumns
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickers (
+    id INTEGER PRIMARY KEY,
+    ticker TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    day INTEGER NOT NULL,
+    tickerId INTEGER NOT NULL REFERENCES tickers(id),
+    action INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    fee INTEGER NOT NULL,
+    fingerprint INTEGER
+);
+CREATE TABLE IF NOT EXISTS imports (
+    digest TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    format TEXT,
+    rows INTEGER NOT NULL
+);
+"""
+
+# ROWS FINGERPRINTED AT A TIME WHEN AN OLDER STORE IS UPGRADED
+FINGERPRINT_BLOCK_ROWS = 100000
+
+
+class TransactionStore():
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+        # TICKERS ARE FEW - KEPT IN MEMORY AND SHARED BY EVERY BLOCK READ FROM THE STORE
+        self.tickers = []
+        self.tickerIndex = {}
+        connection = self.connection()
+        connection.executescript(SCHEMA)
+        for tickerId, ticker in connection.execute("SELECT id, ticker FROM tickers ORDER BY id"):
+            self.tickers.append(ticker)
+            self.tickerIndex[ticker] = tickerId
+        if connection.execute("PRAGMA user_version").fetchone()[0] < FINGERPRINT_VERSION:
+            self.addFingerprints(connection)
+
+    # A STORE FROM BEFORE FINGERPRINTS, OR FROM AN OLDER VERSION OF THEM - THE COLUMN IS ADDED
+    # IF NEED BE AND FILLED IN ONCE; user_version RECORDS THE VERSION IT HOLDS
+    def addFingerprints(self, connection):
+        rows = self.rowCount()
+        with connection, tracing.span("addFingerprints", rows=rows):
+            if "fingerprint" not in {column[1] for column in connection.execute("PRAGMA table_info(transactions)")}:
+                connection.execute("ALTER TABLE transactions ADD COLUMN fingerprint INTEGER")
+            for first in range(0, rows, FINGERPRINT_BLOCK_ROWS):
+                block = self.readBlock(first, FINGERPRINT_BLOCK_ROWS)
+                connection.executemany("UPDATE transactions SET fingerprint = ? WHERE id = ?",
+                                       zip(fingerprints(block), range(first + 1, first + len(block) + 1)))
+            connection.execute(f"PRAGMA user_version = {FINGERPRINT_VERSION}")
+
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self.local.connection = connection
+        return connection
+
+    def close(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    ## CLASS METHODS ==> READ
+    ########################################################################
+    # ROWS ARE DENSE, SO THE COUNT IS THE LARGEST id - ONE B-TREE LOOKUP, NOT A SCAN
+    def rowCount(self):
+        return self.connection().execute("SELECT COALESCE(MAX(id), 0) FROM transactions").fetchone()[0]
+
+    # ROWS first TO first + count - 1 AS A TransactionColumns SHARING THE STORE'S TICKERS
+    def readBlock(self, first, count):
+        with tracing.span("readBlock", first=first, count=count):
+            rows = self.connection().execute(
+                "SELECT day, tickerId, action, quantity, price, fee FROM transactions "
+                "WHERE id > ? AND id <= ? ORDER BY id", (first, first + count)).fetchall()
+            block = TransactionColumns()
+            block.tickers = self.tickers
+            block.tickerIndex = self.tickerIndex
+            if rows:
+                for column, values in zip(block.fields(), zip(*rows)):
+                    column.extend(values)
+            return block
+
+    def readAll(self):
+        return self.readBlock(0, self.rowCount())
+
+    # FINGERPRINT -> ROWS HELD WITH IT
+    def fingerprintCounts(self):
+        with tracing.span("fingerprintCounts"):
+            return Counter(map(itemgetter(0), self.connection().execute("SELECT fingerprint FROM transactions")))
+
+    def importedFiles(self):
+        return [ImportedFile(*record) for record in self.connection().execute(
+            "SELECT digest, path, size, mtime, format, rows FROM imports")]
+
+    ## CLASS METHODS ==> WRITE
+    ########################################################################
+    def append(self, columns, keys=None):
+        keys = fingerprints(columns) if keys is None else keys
+        with self.lock, tracing.span("appendToStore", rows=len(columns)):
+            connection = self.connection()
+            knownTickers = len(self.tickers)
+            try:
+                with connection:
+                    mapping = array("I", (self.storeTickerId(connection, ticker) for ticker in columns.tickers))
+                    tickerIds = (mapping[tickerId] for tickerId in columns.tickerIds)
+                    connection.executemany(
+                        "INSERT INTO transactions (day, tickerId, action, quantity, price, fee, fingerprint) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        zip(columns.dates, tickerIds, columns.actions, columns.quantities,
+                            columns.prices, columns.fees, keys))
+            except Exception:
+                # ROLLED BACK - FORGET THE TICKERS THIS CALL ADDED
+                for ticker in self.tickers[knownTickers:]:
+                    del self.tickerIndex[ticker]
+                del self.tickers[knownTickers:]
+                raise
+
+    def storeTickerId(self, connection, ticker):
+        tickerId = self.tickerIndex.get(ticker)
+        if tickerId is None:
+            tickerId = len(self.tickers)
+            connection.execute("INSERT INTO tickers (id, ticker) VALUES (?, ?)", (tickerId, ticker))
+            self.tickers.append(ticker)
+            self.tickerIndex[ticker] = tickerId
+        return tickerId
+
+    # THE FILES OF A COMPLETED IMPORT (ImportedFile) - A FILE IMPORTED AGAIN IS UPDATED
+    def recordImports(self, records):
+        with self.lock:
+            connection = self.connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO imports (digest, path, size, mtime, format, rows) VALUES (?, ?, ?, ?, ?, ?)",
+                    ((record.digest, record.path, record.size, record.mtime, record.format, record.rows)
+                     for record in records))
+
+    # KEEP THE FIRST rows ROWS (UNDOES THE APPENDS SINCE THERE WERE rows) - TICKERS STAY
+    def truncate(self, rows):
+        with self.lock:
+            connection = self.connection()
+            with connection:
+                connection.execute("DELETE FROM transactions WHERE id > ?", (rows,))
+
+    def clear(self):
+        with self.lock:
+            connection = self.connection()
+            with connection:
+                connection.execute("DELETE FROM transactions")
+                connection.execute("DELETE FROM tickers")
+                connection.execute("DELETE FROM imports")
+            # BLOCKS ALREADY HANDED OUT KEEP THE OLD LISTS
+            self.tickers = []
+            self.tickerIndex = {}
@@ -0,0 +1,232 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Transaction totals - proceeds, allowable cost, gain and count of the grid's rows
+##
+## ONE PROCEEDS AND ONE ALLOWABLE COST PER SOURCE ROW (0 FOR AN ACQUISITION). THE TOTALS ARE
+## KEPT UP TO DATE FROM THE PortfolioModel'S CHANGE SETS AND THE GainsMatcher'S UPDATES -
+## ONLY THE ROWS THAT CHANGED ARE SUMMED, FOR EVERY ROW AND FOR THE ROWS SHOWN. A FILTER
+## THAT IS RANGES OVER ONE FIELD (E.G. A TAX YEAR OF DATES) PASSES A SLICE OF THAT FIELD'S
+## SORT PERMUTATION, SO ITS TOTALS ARE TWO LOOKUPS IN PREFIX SUMS ALONG THE PERMUTATION -
+## BUILT THE SECOND TIME A FIELD IS RANGED (OR ONCE THE GRID HAS SORTED ON IT, AND AGAIN
+## AFTER AN EDIT), SO A ONE-OFF FILTER NEVER PAYS FOR IT. ANY OTHER FILTER IS SUMMED OVER
+## THE ROWS IT PASSES. ALLOWABLE COSTS COME FROM THE GainsMatcher AND ARE None WHILE IT
+## CATCHES UP WITH A CHANGE
+##
+################################################################################
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import accumulate, compress, repeat
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src import tracing
+from src.models.capital_gains import rowProceeds, selectedProceeds
+from src.models.portfolio_model import INSERTED, UPDATED
+from src.models.transaction_model import TransactionTableModel
+
+
+# FIELD A rangeFilter IS OVER -> THE COLUMN WHOSE PERMUTATION SORTS IT
+FIELD_COLUMNS = {field: column for column, (field, scale, minPlaces) in TransactionTableModel.NUMERIC.items()}
+FIELD_COLUMNS["dates"] = TransactionTableModel.DATE
+
+# FIELDS A ROW'S PROCEEDS ARE WORKED OUT FROM
+PROCEEDS_FIELDS = {"actions", "quantities", "prices", "fees"}
+
+
+class TransactionTotals(QObject):
+    changed = Signal()
+
+    def __init__(self, proxy, matcher, parent=None):
+        super().__init__(parent)
+        self.proxy = proxy
+        self.source = proxy.sourceModel()
+        self.portfolio = self.source.portfolio
+        self.matcher = matcher
+
+        # PER SOURCE ROW
+        self.rowProceeds = array("q")
+        self.rowCosts = None            # None UNTIL THE FIRST MATCHING
+
+        # EVERY ROW, AND WHAT THE GRID SHOWS - costs IS shownCosts ONCE THE MATCHING HAS
+        # CAUGHT UP, None UNTIL THEN
+        self.allProceeds = 0
+        self.allCosts = 0
+        self.count = 0
+        self.proceeds = 0
+        self.shownCosts = 0
+        self.costs = None
+        self.filterChanged = True
+
+        # COLUMN -> [PERMUTATION, PROCEEDS PREFIX, COSTS PREFIX], AND THE COLUMNS RANGED SO FAR
+        self.prefixes = {}
+        self.rangedColumns = set()
+
+        # THE GRID AND THE TOTALS CHANGE ON THE SAME SIGNALS - SUM ONCE AFTER ALL OF THEM
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setSingleShot(True)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+        self.portfolio.changed.connect(self.portfolioChanged)
+        proxy.modelReset.connect(self.gridReset)
+        matcher.matched.connect(self.setResults)
+        matcher.rematched.connect(self.costsRematched)
+        self.sourceReset()
+        if matcher.results is not None and not matcher.pending():
+            self.setResults(matcher.results)
+
+    def gain(self):
+        return None if self.costs is None else self.proceeds - self.costs
+
+    def scheduleRefresh(self):
+        self.refreshTimer.start(0)
+
+    def filtered(self):
+        return bool(self.proxy.filters or self.proxy.rowFilters)
+
+    # THE SUM OF values (ONE PER ROW OF rows) OVER THE ROWS THE GRID SHOWS
+    def shownSum(self, values, rows):
+        if self.proxy.order is None:
+            return sum(values)
+        positions = self.proxy.sourcePositions()
+        return sum(compress(values, map((-1).__lt__, map(positions.__getitem__, rows))))
+
+    ## CLASS METHODS ==> SOURCE CHANGES
+    ########################################################################
+    def portfolioChanged(self, change):
+        if change.kind == INSERTED:
+            self.rowsAppended(change)
+        elif change.kind == UPDATED:
+            self.rowsEdited(change)
+        else:
+            self.sourceReset()
+
+    def sourceReset(self):
+        columns = self.source.columns
+        with tracing.span("totalsReset", rows=len(columns)):
+            self.rowProceeds = rowProceeds(columns, 0, len(columns))
+            self.allProceeds = sum(self.rowProceeds)
+        self.rowCosts = None
+        self.prefixes.clear()
+        self.gridReset()
+
+    # AN IMPORTED BLOCK - ONLY ITS ROWS ARE SUMMED. ITS COSTS ARRIVE WITH ITS ASSETS' MATCHING
+    def rowsAppended(self, change):
+        rows = change.rows
+        block = rowProceeds(self.source.columns, rows.start, rows.stop)
+        self.rowProceeds.extend(block)
+        self.allProceeds += sum(block)
+        if self.rowCosts is not None:
+            self.rowCosts.extend(repeat(0, len(rows)))
+        self.scheduleRefresh()
+
+    # EDITED ROWS - THE DIFFERENCE BETWEEN THEIR OLD AND NEW PROCEEDS, FOR EVERY ROW AND THE
+    # ROWS SHOWN. A DISPOSAL'S COST CAN CHANGE WITH ANY EARLIER ROW OF ITS ASSET, SO COSTS WAIT
+    # FOR THE MATCHING
+    def rowsEdited(self, change):
+        if not PROCEEDS_FIELDS.intersection(change.fields):
+            self.scheduleRefresh()
+            return
+        rows = change.rows
+        old = array("q", map(self.rowProceeds.__getitem__, rows))
+        new = selectedProceeds(self.source.columns, rows)
+        deque(map(self.rowProceeds.__setitem__, rows, new), maxlen=0)
+        self.allProceeds += sum(new) - sum(old)
+        if self.filtered() and not self.filterChanged:
+            self.proceeds += self.shownSum(new, rows) - self.shownSum(old, rows)
+        for prefix in self.prefixes.values():
+            prefix[1] = None
+        self.scheduleRefresh()
+
+    # A NEW FILTER, OR THE PROXY REBUILT ITS ROWS
+    def gridReset(self):
+        self.filterChanged = True
+        self.scheduleRefresh()
+
+    def setResults(self, results):
+        rows = len(self.rowProceeds)
+        if self.matcher.pending() or len(results.columns) != rows:
+            return
+        costs = array("q", [0]) * rows
+        deque(map(costs.__setitem__, results.disposalRows, results.disposalCosts), maxlen=0)
+        self.rowCosts = costs
+        self.allCosts = sum(results.disposalCosts)
+        for prefix in self.prefixes.values():
+            prefix[2] = None
+        self.gridReset()
+
+    # ASSETS MATCHED AGAIN - THEIR OLD DISPOSALS' COSTS ARE SWAPPED FOR THE NEW ONES
+    def costsRematched(self, update):
+        if self.rowCosts is None:
+            return
+        costs = self.rowCosts
+        deque(map(costs.__setitem__, update.oldRows, repeat(0)), maxlen=0)
+        deque(map(costs.__setitem__, update.rows, update.costs), maxlen=0)
+        self.allCosts += sum(update.costs) - sum(update.oldCosts)
+        if self.filtered() and not self.filterChanged:
+            self.shownCosts += self.shownSum(update.costs, update.rows) - self.shownSum(update.oldCosts, update.oldRows)
+        for prefix in self.prefixes.values():
+            prefix[2] = None
+        self.scheduleRefresh()
+
+    ## CLASS METHODS ==> TOTALS
+    ########################################################################
+    # A FILTER STILL BEING BUILT - ITS RESET REFRESHES AGAIN
+    def refresh(self):
+        if self.proxy.filtering():
+            return
+        self.count = self.proxy.rowCount()
+        if not self.filtered():
+            self.proceeds, self.shownCosts = self.allProceeds, self.allCosts
+        elif self.filterChanged:
+            with tracing.span("filteredTotals", rows=self.count):
+                self.proceeds, self.shownCosts = self.rangeTotals() or self.filteredTotals()
+        self.filterChanged = False
+        matching = self.rowCosts is None or self.matcher.pending()
+        self.costs = None if matching else self.shownCosts
+        self.changed.emit()
+
+    def filteredTotals(self):
+        order = self.proxy.order
+        proceeds = sum(map(self.rowProceeds.__getitem__, order))
+        costs = 0 if self.rowCosts is None else sum(map(self.rowCosts.__getitem__, order))
+        return proceeds, costs
+
+    # None UNLESS EVERY FILTER IS A RANGE OVER THE SAME FIELD - THEN THE ROWS PASSING ARE
+    # permutation[first:end] AND THE TOTALS ARE prefix[end] - prefix[first]
+    def rangeTotals(self):
+        ranges = [getattr(predicate, "range", None) for predicate in self.proxy.filters.values()]
+        if self.proxy.rowFilters or None in ranges or len({field for field, low, high in ranges}) != 1:
+            return None
+        field = ranges[0][0]
+        column = FIELD_COLUMNS[field]
+        if column not in self.rangedColumns and column not in self.proxy.permutations:
+            self.rangedColumns.add(column)
+            return None
+        lows = [low for field, low, high in ranges if low is not None]
+        highs = [high for field, low, high in ranges if high is not None]
+        permutation, proceeds, costs = self.prefix(column)
+        key = getattr(self.source.columns, field).__getitem__
+        first = bisect_left(permutation, max(lows), key=key) if lows else 0
+        end = max(bisect_right(permutation, min(highs), key=key) if highs else len(permutation), first)
+        return proceeds[end] - proceeds[first], 0 if costs is None else costs[end] - costs[first]
+
+    # PREFIX SUMS ALONG column'S SORT PERMUTATION - THE PROXY CACHES THE PERMUTATION UNTIL THE
+    # SOURCE CHANGES, SO A PREFIX MADE FROM AN OLDER ONE IS REBUILT. AN EDIT DROPS THE SUMS
+    # IT CHANGED (None) UNTIL THE NEXT RANGE NEEDS THEM
+    def prefix(self, column):
+        permutation = self.proxy.permutation(column)
+        prefix = self.prefixes.get(column)
+        if prefix is None or prefix[0] is not permutation:
+            prefix = self.prefixes[column] = [permutation, None, None]
+        if prefix[1] is None:
+            with tracing.span("totalsPrefix", column=column):
+                prefix[1] = self.prefixSums(self.rowProceeds, permutation)
+        if prefix[2] is None and self.rowCosts is not None:
+            prefix[2] = self.prefixSums(self.rowCosts, permutation)
+        return prefix
+
+    def prefixSums(self, values, permutation):
+        return array("q", accumulate(map(values.__getitem__, permutation), initial=0))
@@ -0,0 +1,128 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Startup pipeline - weighted loading stages reported to the splash
+##
+################################################################################
+
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from src import tracing
+
+
+class StartupStage():
+    def __init__(self, name, label, func, weight, threaded):
+        self.name = name
+        self.label = label
+        self.func = func
+        self.weight = weight
+        self.threaded = threaded
+
+
+# SIGNALS FOR A STAGE RUNNING ON THE THREAD POOL (QRunnable IS NOT A QObject)
+# ///////////////////////////////////////////////////////////////
+class StageSignals(QObject):
+    progress = Signal(float)
+    done = Signal(object)
+    error = Signal(str)
+
+
+class StageRunner(QRunnable):
+    def __init__(self, stage):
+        super().__init__()
+        self.stage = stage
+        self.signals = StageSignals()
+
+    def run(self):
+        try:
+            with tracing.span(f"stage: {self.stage.name}"):
+                result = self.stage.func(self.signals.progress.emit)
+        except Exception:
+            self.signals.error.emit(traceback.format_exc())
+        else:
+            self.signals.done.emit(result)
+
+
+# RUNS THE REGISTERED STAGES IN ORDER
+# STAGE FUNCTIONS TAKE ONE ARGUMENT - A CALLBACK ACCEPTING THE FRACTION (0.0 TO 1.0) OF
+# THE STAGE COMPLETED - AND THEIR RETURN VALUE IS KEPT IN results[name]. THREADED STAGES
+# RUN ON THE GLOBAL QThreadPool AND MUST NOT TOUCH WIDGETS; ANYTHING THAT BUILDS WIDGETS
+# IS REGISTERED WITH threaded=False AND RUNS ON THE GUI THREAD
+# ///////////////////////////////////////////////////////////////
+class StartupPipeline(QObject):
+    progressChanged = Signal(int)
+    stageStarted = Signal(str)
+    finished = Signal()
+    failed = Signal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stages = []
+        self.results = {}
+        self.index = -1
+        self.completedWeight = 0
+        self.runner = None
+
+    def addStage(self, name, label, func, weight=1, threaded=True):
+        self.stages.append(StartupStage(name, label, func, weight, threaded))
+
+    def totalWeight(self):
+        return sum(stage.weight for stage in self.stages) or 1
+
+    def start(self):
+        self.index = -1
+        self.completedWeight = 0
+        self.results = {}
+        self.progressChanged.emit(0)
+        self.nextStage()
+
+    ## CLASS METHODS ==> STAGE EXECUTION
+    ########################################################################
+    def nextStage(self):
+        self.index += 1
+        if self.index >= len(self.stages):
+            self.progressChanged.emit(100)
+            self.finished.emit()
+            return
+
+        stage = self.stages[self.index]
+        self.stageStarted.emit(stage.label)
+        if stage.threaded:
+            self.runner = StageRunner(stage)
+            self.runner.signals.progress.connect(self.stageProgress)
+            self.runner.signals.done.connect(self.stageDone)
+            self.runner.signals.error.connect(self.stageError)
+            QThreadPool.globalInstance().start(self.runner)
+        else:
+            # LET THE SPLASH REPAINT THE NEW LABEL BEFORE BLOCKING THE GUI THREAD
+            QTimer.singleShot(0, self.runOnGuiThread)
+
+    def runOnGuiThread(self):
+        stage = self.stages[self.index]
+        try:
+            with tracing.span(f"stage: {stage.name}"):
+                result = stage.func(self.stageProgress)
+        except Exception:
+            self.stageError(traceback.format_exc())
+        else:
+            self.stageDone(result)
+
+    def stageProgress(self, fraction):
+        stage = self.stages[self.index]
+        fraction = min(max(fraction, 0.0), 1.0)
+        done = self.completedWeight + stage.weight * fraction
+        self.progressChanged.emit(int(100 * done / self.totalWeight()))
+
+    def stageDone(self, result):
+        stage = self.stages[self.index]
+        self.results[stage.name] = result
+        self.completedWeight += stage.weight
+        self.runner = None
+        self.progressChanged.emit(int(100 * self.completedWeight / self.totalWeight()))
+        self.nextStage()
+
+    def stageError(self, message):
+        self.runner = None
+        self.failed.emit(self.stages[self.index].name, message)
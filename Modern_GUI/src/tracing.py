@@ -0,0 +1,145 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Startup tracing - timeline of spans written as Chrome trace_event JSON
+##
+## ENABLE WITH THE ENVIRONMENT VARIABLE DAISYCAT_TRACE, SET TO THE OUTPUT FILE
+## (OR TO "1" FOR startup_trace.json IN THE WORKING FOLDER), THEN OPEN THE FILE
+## IN chrome://tracing OR https://ui.perfetto.dev
+##
+## STANDARD LIBRARY ONLY - main.py IMPORTS THIS BEFORE QT SO THE IMPORTS CAN BE TIMED
+##
+################################################################################
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+
+TRACE_FILE = os.environ.get("DAISYCAT_TRACE", "")
+if TRACE_FILE == "1":
+    TRACE_FILE = "startup_trace.json"
+ENABLED = bool(TRACE_FILE)
+
+# TIMESTAMPS ARE MICROSECONDS FROM THE MOMENT THIS MODULE WAS IMPORTED
+_origin = time.perf_counter_ns()
+_pid = os.getpid()
+_events = []
+
+
+# WHEN TRACING IS OFF EVERY span() RETURNS THIS ONE SHARED NO-OP OBJECT
+# ///////////////////////////////////////////////////////////////
+class NullSpan():
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+# ONE "COMPLETE" (ph=X) EVENT - WALL TIME AS ts/dur, THREAD CPU TIME AS tts/tdur AND
+# THE CHANGE IN ALLOCATED MEMORY BLOCKS IN args
+# ///////////////////////////////////////////////////////////////
+class Span():
+    __slots__ = ("name", "args", "wall", "cpu", "blocks")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.blocks = sys.getallocatedblocks()
+        self.cpu = time.thread_time_ns()
+        self.wall = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter_ns()
+        cpu = time.thread_time_ns()
+        args = dict(self.args)
+        args["cpu_ms"] = round((cpu - self.cpu) / 1e6, 3)
+        args["allocated_blocks"] = sys.getallocatedblocks() - self.blocks
+        _events.append({
+            "name": self.name, "cat": "startup", "ph": "X",
+            "pid": _pid, "tid": threading.get_ident(),
+            "ts": (self.wall - _origin) / 1000, "dur": (wall - self.wall) / 1000,
+            "tts": self.cpu / 1000, "tdur": (cpu - self.cpu) / 1000,
+            "args": args,
+        })
+        return False
+
+
+def span(name, **args):
+    if not ENABLED:
+        return NULL_SPAN
+    return Span(name, args)
+
+
+# DECORATOR - THE FUNCTION IS RETURNED UNWRAPPED WHEN TRACING IS OFF
+def traced(name=None):
+    def decorator(func):
+        if not ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# POINT-IN-TIME MARKER (ph=i), e.g. FIRST PAINT
+def instant(name, **args):
+    if not ENABLED:
+        return
+    _events.append({
+        "name": name, "cat": "startup", "ph": "i", "s": "p",
+        "pid": _pid, "tid": threading.get_ident(),
+        "ts": (time.perf_counter_ns() - _origin) / 1000, "args": args,
+    })
+
+
+# MARKS THE FIRST PAINT OF widget WITH AN INSTANT EVENT AND A SPAN FROM PROCESS START
+def traceFirstPaint(widget, name="first paint"):
+    if not ENABLED:
+        return
+    from PySide6.QtCore import QEvent, QObject
+
+    class FirstPaintProbe(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                watched.removeEventFilter(self)
+                instant(name, widget=watched.objectName())
+                now = time.perf_counter_ns()
+                _events.append({
+                    "name": f"startup -> {name}", "cat": "startup", "ph": "X",
+                    "pid": _pid, "tid": threading.get_ident(),
+                    "ts": 0, "dur": (now - _origin) / 1000, "args": {},
+                })
+            return False
+
+    widget.installEventFilter(FirstPaintProbe(widget))
+
+
+def writeTrace(path=None):
+    path = path or TRACE_FILE
+    threadNames = [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": thread.ident,
+                    "args": {"name": thread.name}} for thread in threading.enumerate()]
+    with open(path, "w") as file:
+        json.dump({"traceEvents": threadNames + _events, "displayTimeUnit": "ms"}, file)
+    return path
+
+
+if ENABLED:
+    atexit.register(writeTrace)
@@ -0,0 +1,69 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - broker CSV formats and their decimal marks
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+from src.models.broker_formats import GENERIC, BrokerFormat
+from src.models.transaction_columns import FEE_SCALE, PRICE_SCALE
+from src.models.transaction_import import parseFile
+
+
+HEADER = "Date;Ticker;Action;Quantity;Price;Fee\n"
+
+
+def parse(tmp_path, text):
+    path = tmp_path / "statement.csv"
+    path.write_text(text, encoding="utf-8")
+    parsed = parseFile(str(path), 1 << 16, 100)
+    return parsed.columns, [(line, reason) for path, line, reason in parsed.rejects]
+
+
+# A ";"-SEPARATED FILE WITH DECIMAL POINTS IS NOT READ AS DECIMAL COMMAS
+def test_semicolon_file_with_decimal_points(tmp_path):
+    columns, rejects = parse(tmp_path, HEADER + "2023-01-02;VOD;BUY;10;12.50;1.5\n"
+                                                "2023-01-03;VOD;BUY;10;1,234.5;0\n")
+    assert list(columns.prices) == [12.5 * PRICE_SCALE, 1234.5 * PRICE_SCALE]
+    assert list(columns.fees) == [1.5 * FEE_SCALE, 0]
+    assert rejects == []
+
+
+def test_semicolon_file_with_decimal_commas(tmp_path):
+    columns, rejects = parse(tmp_path, HEADER + "2023-01-02;VOD;BUY;10;12,50;1,5\n"
+                                                "2023-01-03;VOD;BUY;10;1.234,5;0\n")
+    assert list(columns.prices) == [12.5 * PRICE_SCALE, 1234.5 * PRICE_SCALE]
+    assert list(columns.fees) == [1.5 * FEE_SCALE, 0]
+    assert rejects == []
+
+
+# NOTHING IN THE FILE SETTLES THE MARK - "1,234" AND "1.234" COULD BE EITHER
+def test_numbers_read_either_way_are_rejected(tmp_path):
+    columns, rejects = parse(tmp_path, HEADER + "2023-01-02;VOD;BUY;10;1,234;0\n"
+                                                "2023-01-03;VOD;BUY;10;1.234;0\n"
+                                                "2023-01-04;VOD;BUY;10;12;0\n")
+    assert list(columns.prices) == [12 * PRICE_SCALE]
+    assert rejects == [(2, "bad price '1,234' (decimal mark unclear)"),
+                       (3, "bad price '1.234' (decimal mark unclear)")]
+
+
+def convert(decimalMark, prices):
+    header = ["Date", "Ticker", "Action", "Quantity", "Price", "Fee"]
+    format = BrokerFormat("Declared", GENERIC.columns, decimalMark=decimalMark)
+    mapper = format.compile(format.match(header), ";")
+    rejects = []
+    columns = mapper.convert(list(range(2, 2 + len(prices))),
+                             [["2023-01-02", "VOD", "BUY", "10", price, "0"] for price in prices],
+                             lambda line, reason: rejects.append((line, reason)))
+    return list(columns.prices), rejects
+
+
+# A FORMAT THAT DECLARES ITS MARK READS "1.234" AS ITS FILES MEAN IT, AND A NUMBER WRITTEN
+# THE OTHER WAY IS REJECTED RATHER THAN RESCALED
+def test_declared_decimal_mark():
+    assert convert(",", ["1.234", "12,5"]) == ([1234 * PRICE_SCALE, 12.5 * PRICE_SCALE], [])
+    assert convert(",", ["12.50"]) == ([], [(2, "bad price '12.50'")])
+    assert convert(".", ["1,234", "12.5"]) == ([1234 * PRICE_SCALE, 12.5 * PRICE_SCALE], [])
+    assert convert(".", ["12,50"]) == ([], [(2, "bad price '12,50'")])
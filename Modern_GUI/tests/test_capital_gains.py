@@ -0,0 +1,77 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - UK share matching rules
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+from src.models.capital_gains import BED_AND_BREAKFAST, SAME_DAY, SECTION_104, MONEY_SCALE, matchDisposals
+from src.models.transaction_columns import QUANTITY_SCALE, TransactionColumns
+
+
+def columnsOf(rows):
+    columns = TransactionColumns()
+    columns.extend(rows)
+    return columns
+
+
+def pounds(value):
+    return value / MONEY_SCALE
+
+
+# A DAY'S BUYS ARE ONE ACQUISITION AT THEIR AVERAGE COST (s105)
+def test_same_day_buys_are_averaged():
+    results = matchDisposals(columnsOf([
+        ("2023-05-01", "VOD", "BUY", 10, 1),
+        ("2023-05-01", "VOD", "BUY", 10, 3),
+        ("2023-05-01", "VOD", "SELL", 10, 2),
+    ]))
+    assert pounds(results.allowableCosts[0]) == 20
+    assert pounds(results.gain(0)) == 0
+    assert results.poolQuantities[0] == 10 * QUANTITY_SCALE
+    assert pounds(results.poolCosts[0]) == 20
+    assert set(results.matchRules) == {SAME_DAY}
+
+
+# A DAY'S SELLS ARE ONE DISPOSAL - THEIR COSTS ADD UP TO ONE MATCH OF THE TOTAL
+def test_same_day_sells_are_one_disposal():
+    results = matchDisposals(columnsOf([
+        ("2023-05-01", "VOD", "BUY", 1, 1),
+        ("2023-05-01", "VOD", "BUY", 1, 1),
+        ("2023-05-01", "VOD", "BUY", 1, 1.01),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+    ]))
+    assert pounds(results.allowableCosts[0]) == 3.01
+    assert list(map(pounds, results.disposalCosts)) == [1.0, 1.01, 1.0]
+
+
+# BUYS ON ONE DAY WITHIN 30 DAYS OF A SELL ARE MATCHED AT THEIR AVERAGE COST TOO
+def test_bed_and_breakfast_buys_are_averaged():
+    results = matchDisposals(columnsOf([
+        ("2023-01-02", "VOD", "BUY", 10, 1),
+        ("2023-05-01", "VOD", "SELL", 10, 2),
+        ("2023-05-10", "VOD", "BUY", 10, 1),
+        ("2023-05-10", "VOD", "BUY", 10, 3),
+    ]))
+    assert set(results.matchRules) == {BED_AND_BREAKFAST}
+    assert pounds(results.allowableCosts[0]) == 20
+    assert results.poolQuantities[0] == 20 * QUANTITY_SCALE
+    assert pounds(results.poolCosts[0]) == 30
+
+
+# SELLS ON ONE DAY TAKE FROM THE POOL AS ONE DISPOSAL
+def test_same_day_sells_from_the_pool():
+    results = matchDisposals(columnsOf([
+        ("2023-01-02", "VOD", "BUY", 3, 1),
+        ("2023-01-02", "VOD", "BUY", 3, 1.01),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+        ("2023-05-01", "VOD", "SELL", 1, 2),
+    ]))
+    assert set(results.matchRules) == {SECTION_104}
+    assert pounds(results.allowableCosts[0]) == 3.02
+    assert pounds(results.poolCosts[0]) == 3.01
@@ -0,0 +1,69 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - gains matching kept in step with edits by splicing
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+import random
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from src.models.capital_gains import matchDisposals
+from src.models.gains_matcher import GainsMatcher
+from src.models.portfolio_model import FIELDS, PortfolioModel
+from src.models.transaction_columns import TransactionColumns
+
+
+app = QApplication.instance() or QApplication([])
+
+# ENOUGH ASSETS THAT AN EDIT NEVER TOUCHES HALF THE ROWS (WHICH IS MATCHED AFRESH, NOT SPLICED)
+TICKERS = ("AAL", "AV.", "AZN", "BA.", "BARC", "BATS", "BP.", "BT.A", "DGE", "GSK", "HSBA", "LLOY", "NG.",
+           "NWG", "REL", "RIO", "SHEL", "TSCO", "ULVR", "VOD")
+
+
+def settle(matcher):
+    app.processEvents()
+    while matcher.pending():
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+
+
+def sampleRows(count):
+    random.seed(20)
+    return [(f"2023-{random.randint(1, 12):02}-{random.randint(1, 28):02}", random.choice(TICKERS),
+             random.choice(("BUY", "BUY", "SELL")), random.randint(1, 50), random.randint(100, 2000) / 100)
+            for row in range(count)]
+
+
+def resultsOf(results):
+    return {name: list(value) for name, value in vars(results).items() if name != "columns"}
+
+
+# EACH EDIT IS 1-3 ROWS GIVEN FIELDS OF OTHER ROWS - A THIRD OF THEM MOVE ROWS TO ANOTHER TICKER
+def test_spliced_edits_equal_a_full_match():
+    columns = TransactionColumns()
+    columns.extend(sampleRows(1000))
+    portfolio = PortfolioModel(columns)
+    matcher = GainsMatcher(portfolio)
+    matched, rematched = [], []
+    matcher.matched.connect(matched.append)
+    matcher.rematched.connect(rematched.append)
+    settle(matcher)
+    assert len(matched) == 1
+
+    for edit in range(200):
+        rows = sorted(random.sample(range(len(columns)), random.randint(1, 3)))
+        fields = random.sample([field for field in FIELDS if field != "tickerIds"], random.randint(1, 3))
+        if edit % 3 == 0:
+            fields.append("tickerIds")
+        portfolio.updateRows(rows, {field: [getattr(columns, field)[random.randrange(len(columns))] for row in rows]
+                                    for field in fields})
+        settle(matcher)
+        assert resultsOf(matcher.results) == resultsOf(matchDisposals(portfolio.columns))
+
+    assert len(matched) == 1 and len(rematched) == 200
+    assert not all(update.sameShape for update in rematched)
@@ -0,0 +1,79 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - row fingerprints and leaving out rows already imported
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+import hashlib
+import struct
+from collections import Counter
+
+from src.models.import_index import FileFilter, fingerprintCounts, fingerprints, tickerCode
+from src.models.transaction_columns import TransactionColumns
+
+
+def columnsOf(rows):
+    columns = TransactionColumns()
+    columns.extend(rows)
+    return columns
+
+
+def rowsOf(columns):
+    return [columns.row(row) for row in range(len(columns))]
+
+
+FILL = ("2023-05-01", "VOD", "BUY", 10, 1.5)
+OTHER = ("2023-05-01", "VOD", "BUY", 10, 1.6)
+LATER = ("2023-05-02", "BP", "SELL", 5, 4.25)
+
+
+# A DIGEST OF THE PACKED FIELDS, NOT hash() - THE SAME UNDER ANY PYTHON VERSION OR BUILD
+def test_fingerprint_is_a_digest_of_the_fields():
+    columns = columnsOf([FILL])
+    packed = struct.pack("<iqBqqq", columns.dates[0], tickerCode("VOD"), columns.actions[0],
+                         columns.quantities[0], columns.prices[0], columns.fees[0])
+    digest = hashlib.blake2b(packed, digest_size=8).digest()
+    assert list(fingerprints(columns)) == [int.from_bytes(digest, "little", signed=True)]
+    assert fingerprints(columnsOf([FILL, OTHER, LATER]))[0] == fingerprints(columnsOf([LATER, FILL]))[1]
+
+
+# A FILE'S n-TH COPY OF A ROW IS NEW ONLY IF FEWER THAN n ARE HELD
+def test_nth_copy_is_new_only_past_the_copies_held():
+    held = fingerprintCounts(columnsOf([FILL, FILL]))
+    newRows = FileFilter(held)
+    kept = newRows.newRows(columnsOf([FILL, FILL, FILL, OTHER]))
+    assert rowsOf(kept) == rowsOf(columnsOf([FILL, OTHER]))
+    assert newRows.duplicates == 2
+    assert held[fingerprints(columnsOf([FILL]))[0]] == 3
+
+
+# A STATEMENT WHOSE FIRST HALF REPEATS AN EARLIER ONE ADDS ONLY ITS SECOND HALF
+def test_overlapping_files_add_only_new_rows():
+    held = Counter()
+    FileFilter(held).newRows(columnsOf([FILL, OTHER]))
+    newRows = FileFilter(held)
+    kept = newRows.newRows(columnsOf([OTHER, LATER]))
+    assert rowsOf(kept) == rowsOf(columnsOf([LATER]))
+    assert newRows.duplicates == 1
+
+    # THE SAME FILE AGAIN ADDS NOTHING
+    again = FileFilter(held)
+    assert len(again.newRows(columnsOf([OTHER, LATER]))) == 0
+    assert again.duplicates == 2
+
+
+# TWO IDENTICAL FILLS IN ONE FILE STAY TWO, ACROSS BLOCKS TOO, AND A RE-IMPORT ADDS NEITHER
+def test_identical_fills_in_one_file_are_kept():
+    held = Counter()
+    newRows = FileFilter(held)
+    assert len(newRows.newRows(columnsOf([FILL, FILL]))) == 2
+    assert len(newRows.newRows(columnsOf([FILL]))) == 1
+    assert newRows.duplicates == 0
+
+    again = FileFilter(held)
+    assert len(again.newRows(columnsOf([FILL, FILL]))) == 0
+    assert len(again.newRows(columnsOf([FILL, FILL]))) == 1
+    assert again.duplicates == 3
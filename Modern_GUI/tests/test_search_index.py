@@ -0,0 +1,113 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - the trigram search index behind the search box
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from src.models.portfolio_model import PortfolioModel
+from src.models.search_index import TransactionSearchIndex, TrigramIndex
+from src.models.transaction_columns import BUY, SELL, TransactionColumns
+
+
+app = QApplication.instance() or QApplication([])
+
+ROWS = [
+    ("2023-01-02", "VOD", "BUY", 10, 1),        # 0
+    ("2023-01-03", "BP.", "SELL", 5, 4),        # 1
+    ("2023-01-04", "BARC", "BUY", 7, 2),        # 2
+    ("2023-01-05", "VOD", "SELL", 3, 1.1),      # 3
+    ("2023-01-06", "SELLAS", "BUY", 1, 9),      # 4 - A TICKER THAT CONTAINS "SELL"
+    ("2023-01-07", "AVON", "BUY", 2, 3),        # 5
+]
+
+
+def settle():
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def indexOf(rows):
+    columns = TransactionColumns()
+    columns.extend(rows)
+    portfolio = PortfolioModel(columns)
+    index = TransactionSearchIndex(portfolio)
+    settle()
+    assert index.isReady()
+    return portfolio, index
+
+
+def test_trigram_index_folds_case_and_short_terms():
+    trigrams = TrigramIndex()
+    ids = [trigrams.add(text) for text in ("VOD", "AVON", "BARC")]
+    assert sorted(trigrams.search("vo")) == [ids[0], ids[1]]
+    assert trigrams.search("VoD") == [ids[0]]
+    assert trigrams.search("avon") == [ids[1]]
+    assert trigrams.search("xyz") == []
+
+
+def test_words_are_and_and_fold_case():
+    portfolio, index = indexOf(ROWS)
+    assert list(index.search("vod")) == [0, 3]
+    assert list(index.search("VOD sell")) == [3]
+    assert list(index.search("  sell   Vod ")) == [3]
+    assert list(index.search("vod barc")) == []
+    assert list(index.search("")) == []
+
+
+# "sell" IS AN ACTION AND PART OF A TICKER - ROWS MATCHING EITHER FIELD, EACH ONCE
+def test_term_matching_several_fields():
+    portfolio, index = indexOf(ROWS)
+    assert list(index.search("sell")) == [1, 3, 4]
+    rows, lookups = index.matchTerm(index.state, "sell")
+    assert set(lookups) == {0, 1}
+    assert list(index.search("sell buy")) == [4]
+    assert list(index.search("o")) == [0, 3, 5]
+
+
+def test_appended_and_edited_rows():
+    portfolio, index = indexOf(ROWS)
+    assert list(index.search("vod")) == [0, 3]
+    block = TransactionColumns()
+    block.extend([("2023-02-01", "VOD", "SELL", 1, 1), ("2023-02-02", "NEWCO", "BUY", 1, 1)])
+    portfolio.appendColumns(block)
+    assert list(index.search("vod")) == [0, 3, 6]
+    assert list(index.search("newco")) == [7]
+
+    # ROW 0 BECOMES A BARC SELL - IT MOVES BETWEEN TEXTS IN BOTH FIELDS
+    columns = portfolio.columns
+    portfolio.updateRows([0], {"tickerIds": [columns.tickerIndex["BARC"]], "actions": [SELL]})
+    assert list(index.search("vod")) == [3, 6]
+    assert list(index.search("barc")) == [0, 2]
+    assert list(index.search("barc sell")) == [0]
+    portfolio.updateRows([2], {"actions": [SELL]})
+    assert list(index.search("buy")) == [4, 5, 7]
+    assert columns.actions[5] == BUY
+
+
+# THE SEARCH BOX'S SEARCH ON THE THREAD POOL - A QUERY TYPED OVER IS NEVER SHOWN, A SEARCH THAT
+# RAN WHILE ROWS WERE ADDED IS RUN AGAIN
+def test_search_later():
+    portfolio, index = indexOf(ROWS)
+    found = []
+    index.found.connect(lambda query, rows: found.append((query, list(rows))))
+    index.searchLater("v")
+    index.searchLater("vo")
+    index.searchLater("vod")
+    settle()
+    settle()
+    assert found == [("vod", [0, 3])]
+
+    found.clear()
+    index.searchLater("vod")
+    block = TransactionColumns()
+    block.extend([("2023-02-01", "VOD", "SELL", 1, 1)])
+    portfolio.appendColumns(block)
+    settle()
+    settle()
+    assert found == [("vod", [0, 3, 6])]
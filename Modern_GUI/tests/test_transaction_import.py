@@ -0,0 +1,87 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - reading statement files in chunks and taking back a cancelled import
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+import io
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from src.gui.mainwindow import MainWindow
+from src.models.transaction_columns import QUANTITY_SCALE
+from src.models.transaction_import import parseChunks, readChunks
+
+
+app = QApplication.instance() or QApplication([])
+
+HEADER = b"date,ticker,action,quantity,price,fees\n"
+QUOTED = (HEADER + b'2023-01-02,VOD,BUY,10,1.5,"0"\n'
+          b'2023-01-03,"B\nP",SELL,5,4,0\n'
+          b'\n'
+          b'2023-01-04,"BARC\n\n",BUY,7,2,0\n'
+          b'2023-01-05,VOD,SELL,3,1.1,0\n')
+
+
+def settle():
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+# EVERY CHUNK SIZE - CHUNKS END ON A LINE BREAK OUTSIDE QUOTES AND ADD UP TO THE FILE
+def test_chunks_never_split_a_quoted_field():
+    for chunkBytes in range(1, len(QUOTED) + 2):
+        chunks = list(readChunks(io.BytesIO(QUOTED), chunkBytes))
+        assert b"".join(chunks) == QUOTED
+        for chunk in chunks:
+            assert chunk.endswith(b"\n") and chunk.count(b'"') % 2 == 0
+
+
+# A ROW'S LINE IS WHERE IT STARTS IN THE FILE - BREAKS INSIDE QUOTES AND BLANK LINES COUNT
+def test_rows_are_numbered_by_file_line():
+    for chunkBytes in (7, 40, 1 << 16):
+        numbered = []
+        for lines, rows in parseChunks(readChunks(io.BytesIO(b"\xef\xbb\xbf" + QUOTED), chunkBytes)):
+            numbered.extend(zip(lines, (row[1] for row in rows)))
+        assert numbered == [(1, "ticker"), (2, "VOD"), (3, "B\nP"), (6, "BARC\n\n"), (9, "VOD")]
+
+
+def writeStatement(path, first):
+    with open(path, "wb") as file:
+        file.write(HEADER + b"".join(b"2023-01-%02d,VOD,BUY,%d,1.5,0\n" % (day, first + day)
+                                     for day in range(1, 21)))
+    return str(path)
+
+
+# THE CANCELLED IMPORT'S ROWS GO AND ITS FILE IS NOT HELD - THE EARLIER IMPORT STAYS, ROWS AND FILE
+def test_cancelled_import_keeps_earlier_imports(tmp_path):
+    window = MainWindow()
+    window.pages.page("new_page")
+    first, second = writeStatement(tmp_path / "first.csv", 0), writeStatement(tmp_path / "second.csv", 100)
+
+    window.startImport([first])
+    settle()
+    assert len(window.portfolio) == 20
+    assert [record.path for record in window.importedFiles] == [first]
+
+    # CANCELLED ONCE ITS FIRST BLOCK IS IN THE TABLE
+    cancel = lambda change: window.cancelImport()
+    window.portfolio.changed.connect(cancel)
+    window.startImport([second])
+    settle()
+    window.portfolio.changed.disconnect(cancel)
+    assert window.importRunner is None
+    assert len(window.portfolio) == 20
+    assert list(window.portfolio.columns.quantities) == [day * QUANTITY_SCALE for day in range(1, 21)]
+    assert [record.path for record in window.importedFiles] == [first]
+
+    # THE FIRST FILE IS STILL KNOWN, THE SECOND IS READ AGAIN
+    window.startImport([first, second])
+    settle()
+    assert window.importRunner is None
+    assert len(window.portfolio) == 40
+    window.close()
@@ -0,0 +1,148 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - sorting and filtering through the permutation proxy
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+import random
+
+from PySide6.QtCore import QThreadPool, Qt
+from PySide6.QtWidgets import QApplication
+
+from src.models.transaction_columns import ACTIONS, PRICE_SCALE, TransactionColumns, toOrdinal
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import (TransactionProxyModel, actionFilter, dateFilter, priceFilter,
+                                          tickerFilter)
+
+
+app = QApplication.instance() or QApplication([])
+
+TICKERS = ("VOD", "BP.", "AZN", "LLOY", "BARC")
+
+
+def sampleColumns(rows, seed=1):
+    random.seed(seed)
+    columns = TransactionColumns()
+    columns.extend((f"20{random.randint(18, 22)}-{random.randint(1, 12):02}-{random.randint(1, 28):02}",
+                    random.choice(TICKERS), random.choice(ACTIONS), random.randint(1, 50),
+                    random.randint(1, 400) / 4, random.randint(0, 3)) for row in range(rows))
+    return columns
+
+
+# LET THE THREAD POOL FINISH AND ITS SIGNALS ARRIVE
+def settle():
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def proxyOf(columns, wait=True):
+    model = TransactionTableModel(columns)
+    proxy = TransactionProxyModel()
+    proxy.setSourceModel(model)
+    if wait:
+        settle()
+    return model, proxy
+
+
+def shown(proxy):
+    return [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())]
+
+
+def sortedRows(columns, column, rows=None):
+    keys = columns.fields()[column]
+    if column == TransactionTableModel.TICKER:
+        keys = [columns.tickers[tickerId] for tickerId in columns.tickerIds]
+    return sorted(range(len(columns)) if rows is None else rows, key=keys.__getitem__)
+
+
+def test_sort_and_reverse_every_column():
+    columns = sampleColumns(2000)
+    model, proxy = proxyOf(columns)
+    assert len(proxy.permutations) == len(model.HEADERS)
+    for column in range(len(model.HEADERS)):
+        proxy.sort(column, Qt.AscendingOrder)
+        assert shown(proxy) == sortedRows(columns, column)
+        proxy.sort(column, Qt.DescendingOrder)
+        assert shown(proxy) == sortedRows(columns, column)[::-1]
+    proxy.sort(-1)
+    assert shown(proxy) == list(range(len(columns)))
+
+
+# A HEADER CLICK BEFORE THE BACKGROUND BUILD FINISHES SORTS THERE AND THEN
+def test_sort_before_permutations_are_built():
+    columns = sampleColumns(500)
+    model, proxy = proxyOf(columns, wait=False)
+    proxy.permutations.clear()
+    proxy.sort(model.PRICE, Qt.AscendingOrder)
+    assert shown(proxy) == sortedRows(columns, model.PRICE)
+    settle()
+    assert shown(proxy) == sortedRows(columns, model.PRICE)
+
+
+# EVERY KIND OF FILTER TOGETHER, SORTED AND NOT, WITH AND WITHOUT PERMUTATIONS TO SLICE
+def test_filters_combine():
+    columns = sampleColumns(3000)
+    for ready in (True, False):
+        model, proxy = proxyOf(columns, wait=ready)
+        if not ready:
+            proxy.permutations.clear()
+        search = [row for row in range(len(columns)) if row % 3]
+        proxy.setFilter("action", actionFilter("SELL"))
+        proxy.setFilter("ticker", tickerFilter("VOD", "AZN"))
+        proxy.setFilter("date", dateFilter("2019-04-06", "2021-04-05"))
+        proxy.setFilter("price", priceFilter(10, 60))
+        proxy.setRowFilter("search", search)
+        settle()
+        expected = [row for row in search
+                    if ACTIONS[columns.actions[row]] == "SELL"
+                    and columns.tickers[columns.tickerIds[row]] in ("VOD", "AZN")
+                    and toOrdinal("2019-04-06") <= columns.dates[row] <= toOrdinal("2021-04-05")
+                    and 10 * PRICE_SCALE <= columns.prices[row] <= 60 * PRICE_SCALE]
+        assert expected and shown(proxy) == expected
+
+        proxy.sort(model.FEES, Qt.DescendingOrder)
+        settle()
+        assert shown(proxy) == sortedRows(columns, model.FEES, expected)[::-1]
+
+        proxy.clearFilter("search")
+        proxy.clearFilter("ticker")
+        settle()
+        assert set(shown(proxy)) > set(expected)
+        proxy.clearFilter()
+        settle()
+        assert shown(proxy) == sortedRows(columns, model.FEES)[::-1]
+
+
+# A RANGE OVER THE FIELD SORTED ON IS A SLICE OF ITS PERMUTATION
+def test_range_filter_sorted_on_its_field():
+    columns = sampleColumns(2000)
+    model, proxy = proxyOf(columns)
+    proxy.sort(model.DATE, Qt.AscendingOrder)
+    proxy.setFilter("date", dateFilter("2020-04-06", "2021-04-05"))
+    settle()
+    first, last = toOrdinal("2020-04-06"), toOrdinal("2021-04-05")
+    assert shown(proxy) == [row for row in sortedRows(columns, model.DATE) if first <= columns.dates[row] <= last]
+
+
+# IN SOURCE ORDER AN APPEND IS FORWARDED AS AN INSERT; THE PERMUTATIONS TAKE IN THE NEW ROWS
+def test_append_is_forwarded_and_merged():
+    columns = sampleColumns(1000)
+    model, proxy = proxyOf(columns)
+    inserts, resets = [], []
+    proxy.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+    proxy.modelReset.connect(lambda: resets.append(True))
+    model.appendColumns(sampleColumns(200, seed=2))
+    assert inserts == [(1000, 1199)] and not resets
+    assert proxy.rowCount() == 1200
+    settle()
+    for column in range(len(model.HEADERS)):
+        assert list(proxy.permutations[column]) == sortedRows(model.columns, column)
+
+    # SORTED, AN APPEND IS A RESET TO THE NEW ORDER
+    proxy.sort(model.PRICE, Qt.AscendingOrder)
+    model.appendColumns(sampleColumns(100, seed=3))
+    assert resets and not inserts[1:]
+    assert shown(proxy) == sortedRows(model.columns, model.PRICE)
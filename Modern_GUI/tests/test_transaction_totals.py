@@ -0,0 +1,78 @@
+################################################################################
+##
+## BY:      Sunil Patel
+## MODULE:  Tests - the totals footer's prefix sums against summing the rows shown
+##
+## RUN FROM THE Modern_GUI FOLDER:  python -m pytest -q tests
+##
+################################################################################
+
+import random
+
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from src.models.gains_matcher import GainsMatcher
+from src.models.transaction_columns import SELL, TransactionColumns, toOrdinal
+from src.models.transaction_model import TransactionTableModel
+from src.models.transaction_proxy import TransactionProxyModel, dateFilter
+from src.models.transaction_totals import TransactionTotals
+
+
+app = QApplication.instance() or QApplication([])
+
+TICKERS = ("VOD", "BP.", "AZN", "LLOY", "BARC")
+
+
+def sampleColumns(rows, seed):
+    random.seed(seed)
+    columns = TransactionColumns()
+    columns.extend((f"20{random.randint(18, 22)}-{random.randint(1, 12):02}-{random.randint(1, 28):02}",
+                    random.choice(TICKERS), random.choice(("BUY", "BUY", "SELL")), random.randint(1, 50),
+                    random.randint(1, 400) / 4, random.randint(0, 3)) for row in range(rows))
+    return columns
+
+
+# UNTIL THE MATCHING, THE PROXY'S ROWS AND THE TOTALS HAVE ALL CAUGHT UP
+def settle(totals):
+    app.processEvents()
+    while totals.matcher.pending() or totals.proxy.filtering() or totals.refreshTimer.isActive():
+        QThreadPool.globalInstance().waitForDone()
+        app.processEvents()
+
+
+def assertPrefixTotals(totals):
+    settle(totals)
+    assert totals.costs is not None
+    expected = totals.filteredTotals()
+    assert totals.rangeTotals() == expected
+    assert (totals.proceeds, totals.costs) == expected
+    assert TransactionTableModel.DATE in totals.prefixes
+
+
+# ONE TAX YEAR - ITS TOTALS ARE TWO PREFIX SUM LOOKUPS, BEFORE AND AFTER AN APPEND AND EDITS
+def test_tax_year_prefix_totals_equal_summed_rows():
+    model = TransactionTableModel(sampleColumns(3000, seed=1))
+    proxy = TransactionProxyModel()
+    proxy.setSourceModel(model)
+    totals = TransactionTotals(proxy, GainsMatcher(model.portfolio))
+    settle(totals)
+    proxy.setFilter("taxYear", dateFilter("2020-04-06", "2021-04-05"))
+    assertPrefixTotals(totals)
+    assert totals.proceeds and totals.costs
+
+    model.appendColumns(sampleColumns(500, seed=2))
+    assertPrefixTotals(totals)
+
+    # A DISPOSAL IN THE YEAR REPRICED, THEN ONE MOVED INTO IT
+    columns = model.columns
+    first, last = toOrdinal("2020-04-06"), toOrdinal("2021-04-05")
+    disposals = [row for row in range(len(columns)) if columns.actions[row] == SELL]
+    inside = next(row for row in disposals if first <= columns.dates[row] <= last)
+    outside = next(row for row in disposals if columns.dates[row] > last)
+    model.portfolio.updateRows([inside], {"prices": [columns.prices[inside] * 2]})
+    assertPrefixTotals(totals)
+    before = totals.proceeds
+    model.portfolio.updateRows([outside], {"dates": [first]})
+    assertPrefixTotals(totals)
+    assert totals.proceeds != before